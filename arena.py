@@ -0,0 +1,206 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Buffer arenas: a few large GL buffers shared by many meshes, each mesh getting a range.
+#
+# a = MeshArena()
+# r = a.vertices.alloc(vertex_data)     a Range: r.offset is where the data went
+# a.vertices.write(r,new_data)          glBufferSubData of just that range
+# r.free()
+# a.stats()                             utilization and fragmentation of each buffer
+# a.delete()                            deletes both buffers
+#
+# Ranges are handed out best-fit from a free list kept in address order, and freed ranges
+# merge with their neighbours.  When no free block is big enough the arena first compacts
+# the live ranges (defragment) and only grows the buffer if that does not help.
+# Compacting moves ranges, so users must read r.offset again when the arena's generation
+# changes.  Growing keeps both the offsets and the buffer name.
+#
+# A copy of the contents is kept in memory, as OpenGLES 2 cannot copy between buffers.
+#
+# NumPy is required.
+
+import bisect
+import ctypes
+import numpy
+from bindings import glBufferData, glGenBuffers
+from gl2 import GL_ARRAY_BUFFER, GL_ELEMENT_ARRAY_BUFFER, GL_STATIC_DRAW
+from glstate import gl_state
+from upload import buffer_sub_data, data_pointer
+
+class Allocator(object):
+    """Best-fit allocation of aligned ranges out of a capacity"""
+
+    def __init__(self,capacity,alignment=4):
+        self.capacity = capacity
+        self.alignment = alignment
+        self.free = [(0,capacity)] if capacity else [] # (offset,size) in address order
+        self.used = 0
+
+    def aligned(self,size):
+        a = self.alignment
+        return (size+a-1)//a*a
+
+    def alloc(self,size):
+        """Returns the offset of a new range of size bytes, or None if no block fits"""
+        size = self.aligned(size)
+        best = None
+        for i,(offset,n) in enumerate(self.free):
+            if n>=size and (best is None or n<self.free[best][1]):
+                best = i
+                if n==size:
+                    break
+        if best is None:
+            return None
+        offset,n = self.free[best]
+        if n==size:
+            del self.free[best]
+        else:
+            self.free[best] = (offset+size,n-size)
+        self.used += size
+        return offset
+
+    def release(self,offset,size):
+        """Returns a range to the free list, merging it with free neighbours"""
+        size = self.aligned(size)
+        self.used -= size
+        i = bisect.bisect(self.free,(offset,0))
+        if i<len(self.free) and offset+size==self.free[i][0]:
+            size += self.free[i][1]
+            del self.free[i]
+        if i>0 and self.free[i-1][0]+self.free[i-1][1]==offset:
+            offset = self.free[i-1][0]
+            size += self.free[i-1][1]
+            i -= 1
+            del self.free[i]
+        self.free.insert(i,(offset,size))
+
+    def grow(self,capacity):
+        extra = capacity-self.capacity
+        self.capacity = capacity
+        self.used += extra # release takes it back off
+        self.release(capacity-extra,extra)
+
+    def stats(self):
+        """Returns capacity, used and free bytes, the largest free block, the number of
+        free blocks, utilization (used/capacity) and fragmentation (the part of the free
+        space outside the largest free block)"""
+        free = self.capacity-self.used
+        largest = max([n for offset,n in self.free] or [0])
+        return {'capacity':self.capacity,'used':self.used,'free':free,'largest_free':largest,
+                'free_blocks':len(self.free),
+                'utilization':float(self.used)/self.capacity if self.capacity else 0.0,
+                'fragmentation':1.0-float(largest)/free if free else 0.0}
+
+class Range(object):
+    """Part of an arena's buffer"""
+
+    def __init__(self,arena,offset,size):
+        self.arena = arena
+        self.offset = offset
+        self.size = size
+
+    def free(self):
+        self.arena.free(self)
+
+class BufferArena(object):
+    """One GL buffer whose space is shared out in ranges"""
+
+    def __init__(self,target=GL_ARRAY_BUFFER,capacity=1<<20,usage=GL_STATIC_DRAW,alignment=4):
+        self.target = target
+        self.usage = usage
+        self.allocator = Allocator(capacity,alignment)
+        self.shadow = numpy.zeros(capacity,dtype=numpy.uint8)
+        self.ranges = set()
+        self.generation = 0 # Changes whenever ranges move
+        self.defragmented = 0
+        self.grown = 0
+        buf = ctypes.c_uint()
+        glGenBuffers(1,ctypes.byref(buf))
+        self.buf = buf.value
+        self.bind()
+        glBufferData(target,capacity,None,usage)
+
+    def bind(self):
+        gl_state.bind_buffer(self.target,self.buf)
+
+    def alloc(self,data):
+        """Returns a Range holding a copy of data"""
+        address,n,t,owner = data_pointer(data)
+        offset = self.allocator.alloc(n)
+        if offset is None:
+            a = self.allocator
+            if a.capacity-a.used>=a.aligned(n):
+                self.defragment()
+            else:
+                # Only the new tail is sure to be one block, so it must hold the whole range
+                self.grow(max(2*a.capacity,a.capacity+a.aligned(n)))
+            offset = self.allocator.alloc(n)
+        if offset is None:
+            raise ValueError('No room for %d bytes in the arena' % n)
+        r = Range(self,offset,n)
+        self.ranges.add(r)
+        self.write(r,data)
+        return r
+
+    def write(self,r,data):
+        """Replaces the contents of a range with data of the same size"""
+        address,n,t,owner = data_pointer(data)
+        if n!=r.size:
+            raise ValueError('Range holds %d bytes, not %d' % (r.size,n))
+        ctypes.memmove(self.shadow.ctypes.data+r.offset,address,n)
+        self.bind()
+        buffer_sub_data(self.target,r.offset,data)
+
+    def free(self,r):
+        self.ranges.remove(r)
+        self.allocator.release(r.offset,r.size)
+
+    def defragment(self):
+        """Moves the live ranges together at the start of the buffer"""
+        a = self.allocator
+        end = 0
+        for r in sorted(self.ranges,key=lambda r:r.offset):
+            if r.offset!=end:
+                self.shadow[end:end+r.size] = self.shadow[r.offset:r.offset+r.size].copy()
+                r.offset = end
+            end += a.aligned(r.size)
+        a.free = [(end,a.capacity-end)] if end<a.capacity else []
+        self.bind()
+        buffer_sub_data(self.target,0,self.shadow[:end])
+        self.generation += 1
+        self.defragmented += 1
+
+    def grow(self,capacity):
+        """Reallocates the buffer with a larger capacity, keeping every range in place"""
+        shadow = numpy.zeros(capacity,dtype=numpy.uint8)
+        shadow[:len(self.shadow)] = self.shadow
+        self.shadow = shadow
+        self.allocator.grow(capacity)
+        self.bind()
+        glBufferData(self.target,capacity,self.shadow.ctypes.data,self.usage)
+        self.grown += 1
+
+    def delete(self):
+        """Deletes the buffer; every range in it is lost"""
+        gl_state.delete_buffers([self.buf])
+        self.buf = None
+        self.ranges = set()
+
+    def stats(self):
+        s = self.allocator.stats()
+        s['ranges'] = len(self.ranges)
+        return s
+
+class MeshArena(object):
+    """A vertex arena and an index arena"""
+
+    def __init__(self,vertex_capacity=1<<20,index_capacity=1<<18,usage=GL_STATIC_DRAW):
+        self.vertices = BufferArena(GL_ARRAY_BUFFER,vertex_capacity,usage)
+        self.indices = BufferArena(GL_ELEMENT_ARRAY_BUFFER,index_capacity,usage)
+
+    def delete(self):
+        self.vertices.delete()
+        self.indices.delete()
+
+    def stats(self):
+        return {'vertices':self.vertices.stats(),'indices':self.indices.stats()}
@@ -0,0 +1,217 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Static batching: many small meshes merged into shared buffers, one draw per material.
+#
+# b = StaticBatch()
+# h = b.add(mesh,model_matrix,material)      mesh is a mesh.Mesh, material a Material
+# b.draw({'view':view_projection})           one glDrawElements per material
+# b.move(h,new_model_matrix)                 only that entry's vertices are re-uploaded
+#
+# Vertices are transformed into world space when the batch is built, so the shaders only
+# apply the view and projection.  Adding or removing an entry rebuilds the buffers of its
+# material only; moving one rewrites just its range of the vertex buffer.  The layout may
+# hold a vertex, normal, uv and tangent (the meshes must then have uvs and tangents).
+#
+# NumPy is required.
+
+import ctypes
+import numpy
+from bindings import glDrawElements, glGenBuffers
+from gl2 import GL_ARRAY_BUFFER, GL_ELEMENT_ARRAY_BUFFER, GL_STATIC_DRAW, GL_TRIANGLES
+import glinfo
+import layout
+import mesh
+from glstate import gl_state
+import transform
+from upload import buffer_data, buffer_sub_data
+import vao
+
+default_layout = layout.VertexLayout(('vertex',3,'float'),('normal',3,'byte'))
+
+class Material(object):
+    """A Program and the uniform values to draw with it"""
+
+    def __init__(self,program,uniforms=None):
+        self.program = program
+        self.uniforms = dict(uniforms or {})
+
+    def apply(self,uniforms=None):
+        """Makes the program current and sets its uniforms, then any shared ones given"""
+        self.program.use()
+        for values in (self.uniforms,uniforms or {}):
+            for name,value in values.iteritems():
+                self.program[name] = value
+
+def world_space(m,model):
+    """Returns the positions and unit normals of a mesh.Mesh transformed by a model matrix"""
+    model = numpy.asarray(model,dtype=numpy.float64)
+    positions = transform.transform_points(m.positions,model)[:,:3]
+    # Normals go through the inverse transpose so non-uniform scales keep them normal
+    normals = numpy.dot(m.normals,numpy.linalg.inv(model[:3,:3]).T)
+    length = numpy.sqrt((normals*normals).sum(axis=1))
+    length[length==0] = 1.0
+    return positions,normals/length[:,None]
+
+def world_tangents(m,model):
+    """Returns the (n,4) tangents of a mesh.Mesh transformed by a model matrix, keeping
+    their handedness in w"""
+    R = numpy.asarray(model,dtype=numpy.float64)[:3,:3]
+    # Tangents lie along the surface, so they transform as the positions do
+    t = numpy.dot(m.tangents[:,:3],R)
+    length = numpy.sqrt((t*t).sum(axis=1))
+    length[length==0] = 1.0
+    # A mirroring model matrix flips the handedness
+    w = m.tangents[:,3]*(-1.0 if numpy.linalg.det(R)<0 else 1.0)
+    return numpy.column_stack((t/length[:,None],w))
+
+class _Entry(object):
+    def __init__(self,m,model,material):
+        self.mesh = m
+        self.model = model
+        self.material = material
+        self.run = None    # The _Run holding its vertices
+        self.offset = 0    # Byte offset of its first vertex in the run's vertex buffer
+
+class _Run(object):
+    """Entries of one material drawn by a single glDrawElements"""
+
+    def __init__(self,entries):
+        self.entries = entries
+        self.vbuf = None
+        self.ebuf = None
+        self.count = 0
+        self.index_type = None
+        self.array = None
+
+    def delete(self):
+        if self.array is not None:
+            self.array.delete()
+        if self.vbuf is not None:
+            gl_state.delete_buffers((self.vbuf,self.ebuf))
+
+class StaticBatch(object):
+    """Meshes with model matrices and materials, drawn with one call per material"""
+
+    def __init__(self,layout=None):
+        self.layout = layout or default_layout
+        if any(a.format=='qshort' for a in self.layout.attributes):
+            raise ValueError('Batched vertices cannot be quantised per entry')
+        for a in self.layout.attributes:
+            if a.name not in ('vertex','normal','uv','tangent'):
+                raise ValueError('Batches have no %r attribute to pack' % a.name)
+        self.names = [a.name for a in self.layout.attributes]
+        self.entries = {}    # handle -> _Entry
+        self.groups = {}     # material -> [_Run]
+        self.dirty = set()   # materials whose runs must be rebuilt
+        self.moved = set()   # handles whose vertices must be rewritten
+        self.rebuilt = 0     # Materials rebuilt
+        self.updated = 0     # Entries rewritten in place
+        self._next = 0
+
+    def add(self,m,model,material):
+        """Adds a mesh.Mesh drawn with a model matrix and a Material, returning a handle"""
+        for name,values in (('uv',m.uvs),('tangent',m.tangents)):
+            if name in self.names and values is None:
+                raise ValueError('The layout needs %ss, which the mesh lacks' % name)
+        handle = self._next
+        self._next += 1
+        self.entries[handle] = _Entry(m,model,material)
+        self.dirty.add(material)
+        return handle
+
+    def remove(self,handle):
+        e = self.entries.pop(handle)
+        self.moved.discard(handle)
+        self.dirty.add(e.material)
+
+    def move(self,handle,model):
+        """Changes the model matrix of an entry"""
+        self.entries[handle].model = model
+        self.moved.add(handle)
+
+    def build(self):
+        """Brings the buffers up to date (draw calls this)"""
+        for material in self.dirty:
+            for run in self.groups.pop(material,[]):
+                run.delete()
+            entries = [e for h,e in sorted(self.entries.items()) if e.material is material]
+            if entries:
+                self.groups[material] = [self._build(material,run) for run in self._runs(entries)]
+            self.rebuilt += 1
+        for handle in self.moved:
+            e = self.entries[handle]
+            if e.material in self.dirty:
+                continue # Already written by the rebuild
+            data = self._pack(e)
+            gl_state.bind_buffer(GL_ARRAY_BUFFER,e.run.vbuf)
+            buffer_sub_data(GL_ARRAY_BUFFER,e.offset,data)
+            self.updated += 1
+        self.dirty.clear()
+        self.moved.clear()
+
+    def _pack(self,e):
+        """Returns an entry's vertices in world space, packed by the layout"""
+        positions,normals = world_space(e.mesh,e.model)
+        arrays = {'vertex':positions,'normal':normals}
+        if 'uv' in self.names:
+            arrays['uv'] = e.mesh.uvs # Unchanged by the model matrix
+        if 'tangent' in self.names:
+            arrays['tangent'] = world_tangents(e.mesh,e.model)
+        return self.layout.pack(arrays)[0]
+
+    def _runs(self,entries):
+        """Splits entries into runs whose vertices fit the available index type"""
+        if glinfo.has_extension('GL_OES_element_index_uint'):
+            return [entries]
+        runs = [[]]
+        n = 0
+        for e in entries:
+            v = len(e.mesh.positions)
+            if v>1<<16:
+                raise ValueError('A mesh of %d vertices needs GL_OES_element_index_uint' % v)
+            if n+v>1<<16:
+                runs.append([])
+                n = 0
+            runs[-1].append(e)
+            n += v
+        return runs
+
+    def _build(self,material,entries):
+        run = _Run(entries)
+        vertices = []
+        faces = []
+        n = 0
+        for e in entries:
+            data = self._pack(e)
+            e.run = run
+            e.offset = n*self.layout.stride
+            vertices.append(data)
+            faces.append(e.mesh.faces.ravel()+n)
+            n += len(data)
+        X = numpy.concatenate(vertices)
+        E = numpy.concatenate(faces).astype(mesh.index_dtype(n,True))
+        bufs = (ctypes.c_uint*2)()
+        glGenBuffers(2,ctypes.byref(bufs))
+        run.vbuf,run.ebuf = bufs
+        gl_state.bind_buffer(GL_ARRAY_BUFFER,run.vbuf)
+        gl_state.bind_buffer(GL_ELEMENT_ARRAY_BUFFER,run.ebuf)
+        buffer_data(GL_ARRAY_BUFFER,X,GL_STATIC_DRAW)
+        run.index_type = buffer_data(GL_ELEMENT_ARRAY_BUFFER,E,GL_STATIC_DRAW)
+        run.count = len(E)
+        run.array = vao.VertexArray(self.layout,material.program.attributes,run.vbuf,run.ebuf)
+        return run
+
+    def draw(self,uniforms=None):
+        """Draws every material's entries, setting the given uniforms (such as the view and
+        projection matrix) on each material's program"""
+        if self.dirty or self.moved:
+            self.build()
+        for material,runs in self.groups.iteritems():
+            material.apply(uniforms)
+            for run in runs:
+                run.array.bind()
+                glDrawElements(GL_TRIANGLES,run.count,run.index_type,0)
+
+    def draw_calls(self):
+        """Returns the number of glDrawElements calls draw makes"""
+        return sum(len(runs) for runs in self.groups.itervalues())
@@ -0,0 +1,474 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Microbenchmarks for the Python side of pyopengles.
+#
+# python benchmark.py            runs every benchmark
+# python benchmark.py calls      runs just the named benchmarks
+
+import sys
+import time
+import ctypes
+
+def timeit(fn,n=100000):
+    """Returns the time in microseconds for one call of fn, averaged over n calls"""
+    t=time.time()
+    for i in xrange(n):
+        fn()
+    return (time.time()-t)*1e6/n
+
+def report(name,us):
+    print '%-50s %8.3f us' % (name,us)
+
+def bench_calls():
+    """Per-call cost of the typed, cached bindings against untyped CDLL lookups"""
+    from pyopengles import EGL
+    from gl2 import GL_BLEND
+    import bindings
+    egl = EGL()
+    untyped = ctypes.CDLL('libGLESv2.so') # A fresh CDLL has no argtypes set
+    loc = -1 # Uniform updates to location -1 are silently ignored
+    report('untyped opengles.glGetError()',timeit(lambda:untyped.glGetError()))
+    report('typed glGetError()',timeit(lambda:bindings.glGetError()))
+    report('untyped opengles.glUniform2f(eglfloat,eglfloat)',
+           timeit(lambda:untyped.glUniform2f(loc,ctypes.c_float(0.5),ctypes.c_float(0.5))))
+    glUniform2f = bindings.glUniform2f
+    report('typed glUniform2f(float,float)',timeit(lambda:glUniform2f(loc,0.5,0.5)))
+    report('untyped opengles.glDisable()',timeit(lambda:untyped.glDisable(GL_BLEND)))
+    glDisable = bindings.glDisable
+    report('typed glDisable()',timeit(lambda:glDisable(GL_BLEND)))
+
+def bench_import(n=10):
+    """Startup cost of importing the constants and pyopengles, each in a fresh interpreter"""
+    import subprocess
+    def run(code):
+        t=time.time()
+        for i in xrange(n):
+            subprocess.check_call([sys.executable,'-c',code])
+        return (time.time()-t)*1e6/n
+    base = run('pass')
+    report('python -c pass',base)
+    for name,code in [
+        ('import gl2,egl (no table loaded)','import gl2,egl'),
+        ('from gl2 import GL_TRIANGLES','from gl2 import GL_TRIANGLES'),
+        ('star import of all five headers',
+         'from egl import *;from gl2 import *;from gl2ext import *;from gl import *;from glext import *'),
+        ('import pyopengles','import pyopengles'),
+        ('from pyopengles import *','from pyopengles import *'),
+        ]:
+        report(name+' (minus python -c pass)',run(code)-base)
+
+def bench_errors(calls=10):
+    """Cost of a frame of GL calls under each glerror policy"""
+    from pyopengles import EGL
+    import bindings
+    import glerror
+    egl = EGL()
+    glUniform2f = bindings.glUniform2f
+    glGetError = bindings.glGetError
+    def frame():
+        for i in xrange(calls):
+            glUniform2f(-1,0.5,0.5)
+        glerror.check_frame()
+    def frame_checking_each_call():
+        # What demo.check() after every call used to cost
+        for i in xrange(calls):
+            glUniform2f(-1,0.5,0.5)
+            if glGetError(): raise ValueError
+    report('glGetError after every call (old demo.check)',timeit(frame_checking_each_call,10000))
+    for p in (glerror.OFF,glerror.FRAME,glerror.CALL):
+        glerror.set_policy(p)
+        report('policy %s, %d calls per frame' % (p,calls),timeit(frame,10000))
+    glerror.set_policy(glerror.FRAME)
+
+def bench_shaders(count=12):
+    """Startup cost of building a scene's programs one at a time against in a single batch"""
+    from pyopengles import EGL
+    import program
+    from gl2 import GL_FRAGMENT_SHADER, GL_VERTEX_SHADER
+    egl = EGL()
+    vertex = """attribute vec4 vertex;
+              void main(void) { gl_Position = vertex; }"""
+    def fragments(tag):
+        # Distinct sources so nothing is shared between the runs
+        return ["""uniform vec4 color;
+              void main(void) { gl_FragColor = color*%d.0+vec4(%s.0); }""" % (i,tag)
+                for i in xrange(count)]
+    def serial():
+        shader = program.compile_shader(GL_VERTEX_SHADER,vertex+'//serial')
+        for f in fragments(1):
+            program.link_program([shader,program.compile_shader(GL_FRAGMENT_SHADER,f)])
+    t = time.time()
+    serial()
+    report('%d programs, status checked after each call' % count,(time.time()-t)*1e6)
+    cache = program.ProgramCache() # No directory, so no binaries
+    t = time.time()
+    cache.get_many([(vertex,f) for f in fragments(2)])
+    report('%d programs, submitted then checked in one pass' % count,(time.time()-t)*1e6)
+    for label,submit,wait in cache.timings:
+        report('  %s submit' % label,submit*1e6)
+        report('  %s wait' % label,wait*1e6)
+
+def bench_transforms(objects=1000):
+    """Model-view-projection matrices for a scene of objects: per-object nested lists
+    (the math cone.py used to do) against one batched NumPy call"""
+    import itertools
+    import math
+    import numpy
+    import transform
+    # The list-of-lists versions of cone.mat_mult, View.translate and View.rotate
+    def mat_mult(A,B):
+        return [ [ sum(A[i][j]*B[j][k] for j in range(4)) for k in range(4)] for i in range(4)]
+    def translate(V,pt):
+        V=[row[:] for row in V]
+        V[3]=[sum(pt[j]*V[j][i] for j in xrange(3))+V[3][i] for i in xrange(4)]
+        return V
+    def rotate(V,angle):
+        c=math.cos(angle*3.1415/180.0)
+        s=math.sin(angle*3.1415/180.0)
+        return mat_mult([[c,s,0,0],[-s,c,0,0],[0,0,1,0],[0,0,0,1]],V)
+    VP = transform.multiply(transform.look_at([0,0,0],[0,-100,50]),transform.projection())
+    M = VP.tolist()
+    positions = numpy.random.uniform(-100,100,(objects,3)).astype(numpy.float32)
+    angles = numpy.random.uniform(0,360,objects).astype(numpy.float32)
+    P = positions.tolist()
+    A = angles.tolist()
+    def lists():
+        for pt,angle in zip(P,A):
+            V = rotate(translate(M,pt),angle)
+            # What Shader.select_view did to upload each matrix
+            (ctypes.c_float*16)(*itertools.chain(*V))
+    def per_object():
+        for pt,angle in zip(positions,angles):
+            transform.multiply(transform.multiply(transform.rotation_z(angle),
+                                                  transform.translation(pt)),VP)
+    def batched():
+        transform.multiply(transform.multiply(transform.rotation_z(angles),
+                                              transform.translation(positions)),VP)
+    report('%d objects, nested lists' % objects,timeit(lists,10))
+    report('%d objects, one NumPy matrix at a time' % objects,timeit(per_object,10))
+    report('%d objects, batched NumPy' % objects,timeit(batched,100))
+
+def grid_mesh(n):
+    """Returns positions, faces and uvs of a wavy n x n grid with 2*(n-1)**2 triangles"""
+    import numpy
+    g = numpy.mgrid[0:n,0:n].reshape(2,-1).T
+    positions = numpy.hstack((g,numpy.sin(g[:,:1]*0.1))).astype(numpy.float32)
+    i = numpy.arange(n*n).reshape(n,n)[:-1,:-1].ravel()
+    faces = numpy.vstack((numpy.c_[i,i+1,i+n],numpy.c_[i+1,i+n+1,i+n]))
+    return positions,faces,g/float(n)
+
+def bench_mesh(n=500):
+    """Building interleaved position+normal data: the Python loops cone.Buffer used against
+    mesh.Mesh"""
+    import array
+    import itertools
+    import math
+    import mesh
+    def vec_sub(A,B):
+        return [a-b for a,b in zip(A,B)]
+    def vec_cross(a,b):
+        return [a[1]*b[2]-a[2]*b[1],a[2]*b[0]-a[0]*b[2],a[0]*b[1]-a[1]*b[0]]
+    def vec_normal(A):
+        n=math.sqrt(sum(a**2 for a in A))+0.0001
+        return [a/n for a in A]
+    def loops(pts,faces):
+        # What cone.Buffer.__init__ used to do
+        normals=[[] for p in pts]
+        for f in faces:
+            a,b,c=f[0:3]
+            n=tuple(vec_normal(vec_cross(vec_sub(pts[b],pts[a]),vec_sub(pts[c],pts[a]))))
+            for x in f[0:3]:
+                normals[x].append(n)
+        for i,N in enumerate(normals):
+            normals[i]=tuple( vec_normal( [sum(v[k] for v in N) for k in range(3)] ) )
+        P=[ p+n for p,n in zip(pts,normals)]
+        return array.array('f',itertools.chain(*P))
+    small = 50
+    positions,faces,uvs = grid_mesh(small)
+    pts = [tuple(p) for p in positions.tolist()]
+    F = faces.tolist()
+    t = time.time()
+    loops(pts,F)
+    report('%d triangles, Python loops' % len(F),(time.time()-t)*1e6)
+    t = time.time()
+    mesh.Mesh(positions,faces).vertices()
+    report('%d triangles, mesh.Mesh' % len(F),(time.time()-t)*1e6)
+    positions,faces,uvs = grid_mesh(n)
+    t = time.time()
+    mesh.Mesh(positions,faces).vertices()
+    report('%d triangles, mesh.Mesh' % len(faces),(time.time()-t)*1e6)
+    t = time.time()
+    mesh.Mesh(positions,faces,uvs,tangents=True).vertices()
+    report('%d triangles, mesh.Mesh with uvs and tangents' % len(faces),(time.time()-t)*1e6)
+
+def bench_meshopt(n=100):
+    """ACMR and time of the vertex cache optimisation on a grid whose faces are shuffled"""
+    import numpy
+    import mesh
+    import meshopt
+    positions,faces,uvs = grid_mesh(n)
+    faces = faces[numpy.random.permutation(len(faces))]
+    # Give each face its own copies of its vertices, as some model files do
+    vertices = positions[faces.ravel()]
+    faces = numpy.arange(len(vertices)).reshape(-1,3)
+    t = time.time()
+    welded,faces = meshopt.weld(vertices,faces)
+    report('weld %d vertices to %d' % (len(vertices),len(welded)),(time.time()-t)*1e6)
+    m = mesh.Mesh(welded,faces)
+    t = time.time()
+    before,after = m.optimize()
+    report('optimize %d triangles' % len(faces),(time.time()-t)*1e6)
+    print 'ACMR before %.3f after %.3f' % (before,after)
+
+def bench_batch(objects=1000):
+    """Python time per frame to draw many small meshes one at a time against one static batch"""
+    from pyopengles import EGL
+    import numpy
+    import batch
+    import mesh
+    import transform
+    import vao
+    from bindings import glDrawElements, glFinish, glGenBuffers
+    from gl2 import GL_ARRAY_BUFFER, GL_ELEMENT_ARRAY_BUFFER, GL_STATIC_DRAW, GL_TRIANGLES
+    from glstate import gl_state
+    from program import program_cache
+    from upload import buffer_data
+    egl = EGL()
+    p = program_cache.get("""attribute vec3 vertex;
+              attribute vec3 normal;
+              uniform mat4 view;
+              varying vec3 n;
+              void main(void) { n = normal; gl_Position = view*vec4(vertex,1.0); }""",
+              """varying vec3 n;
+              uniform vec4 color;
+              void main(void) { gl_FragColor = color*vec4(n+0.5,1.0); }""")
+    positions,faces,uvs = grid_mesh(4)
+    m = mesh.Mesh(positions,faces)
+    models = transform.translation(numpy.random.uniform(-100,100,(objects,3)))
+    VP = transform.multiply(transform.look_at([0,0,0],[0,-300,150]),transform.projection())
+    MVP = transform.multiply(models,VP)
+    # One buffer pair per object, as cone.Buffer does
+    data,dequantize = m.pack(batch.default_layout)
+    indices = m.indices()
+    arrays = []
+    for i in xrange(objects):
+        bufs = (ctypes.c_uint*2)()
+        glGenBuffers(2,ctypes.byref(bufs))
+        gl_state.bind_buffer(GL_ARRAY_BUFFER,bufs[0])
+        gl_state.bind_buffer(GL_ELEMENT_ARRAY_BUFFER,bufs[1])
+        buffer_data(GL_ARRAY_BUFFER,data,GL_STATIC_DRAW)
+        index_type = buffer_data(GL_ELEMENT_ARRAY_BUFFER,indices,GL_STATIC_DRAW)
+        arrays.append(vao.VertexArray(batch.default_layout,p.attributes,bufs[0],bufs[1]))
+    p.use()
+    p['color'] = (1.0,1.0,1.0,1.0)
+    def separate():
+        for i in xrange(objects):
+            p['view'] = MVP[i]
+            arrays[i].bind()
+            glDrawElements(GL_TRIANGLES,indices.size,index_type,0)
+        glFinish()
+    b = batch.StaticBatch()
+    material = batch.Material(p,{'color':(1.0,1.0,1.0,1.0)})
+    for model in models:
+        b.add(m,model,material)
+    b.build()
+    def batched():
+        b.draw({'view':VP})
+        glFinish()
+    report('%d meshes, one draw each' % objects,timeit(separate,20))
+    report('%d meshes, static batch (%d draws)' % (objects,b.draw_calls()),timeit(batched,20))
+
+def bench_arena(operations=20000):
+    """Allocator cost and the fragmentation left by random mesh sized allocations and frees"""
+    import random
+    import arena
+    a = arena.Allocator(16<<20)
+    live = []
+    rng = random.Random(1)
+    sizes = [rng.randint(1<<8,1<<16) for i in xrange(operations)]
+    def churn():
+        for size in sizes:
+            if live and rng.random()<0.45:
+                a.release(*live.pop(rng.randrange(len(live))))
+            else:
+                offset = a.alloc(size)
+                if offset is not None:
+                    live.append((offset,size))
+    t = time.time()
+    churn()
+    report('%d allocations and frees' % operations,(time.time()-t)*1e6)
+    for name,value in sorted(a.stats().items()):
+        print '  %-20s %s' % (name,value)
+
+def bench_culling(objects=10000):
+    """Frustum culling a scene through its hierarchy against testing every object"""
+    import numpy
+    import cull
+    import transform
+    rng = numpy.random.RandomState(1)
+    positions = rng.uniform(-2000,2000,(objects,3))
+    positions[:,2] = rng.uniform(-50,50,objects)
+    box = (numpy.array([-20.0,-20.0,0.0]),numpy.array([20.0,20.0,20.0]))
+    scene = cull.Scene()
+    for p in positions:
+        scene.add(None,transform.translation(p),bounds=box)
+    VP = transform.multiply(transform.look_at([0,0,0],[0,-100,50]),transform.projection())
+    models = scene.models[:objects]
+    def every():
+        lo,hi = cull.world_bounds(scene.local_lo[:objects],scene.local_hi[:objects],models)
+        return numpy.nonzero(cull.boxes_visible(cull.frustum_planes(VP),lo,hi))[0]
+    moving = numpy.arange(0,objects,10)
+    def move():
+        scene.move(moving,models[moving])
+        scene.visible(VP)
+    scene.visible(VP)
+    report('%d objects, test every box' % objects,timeit(every,20))
+    report('%d objects, hierarchy' % objects,timeit(lambda:scene.visible(VP),20))
+    report('%d objects, hierarchy refitted for %d moved' % (objects,len(moving)),timeit(move,20))
+    for name,value in sorted(scene.last_frame.items()):
+        print '  %-20s %s' % (name,value)
+
+def bench_queue(draws=5000):
+    """Sorting a frame of draws by state and depth: radix sorted keys against Python tuples"""
+    import numpy
+    import renderqueue
+    rng = numpy.random.RandomState(1)
+    q = renderqueue.RenderQueue()
+    def fill():
+        for i in xrange(draws):
+            q.submit(int,rng.uniform(10,1000),program=rng.randint(8),texture=rng.randint(32),
+                     buffer=rng.randint(256),transparent=i%10==0)
+    fill()
+    fields = zip(q.transparent,q.programs,q.textures,q.buffers,q.depths)
+    report('%d draws, sorted as Python tuples' % draws,
+           timeit(lambda:sorted(xrange(draws),key=fields.__getitem__),20))
+    report('%d draws, keys built and radix sorted' % draws,timeit(q.order,20))
+    q.flush()
+    for name,value in sorted(q.last_frame.items()):
+        print '  %-20s %s' % (name,value)
+
+def bench_lod(n=100,objects=1000):
+    """Simplifying a mesh into levels of detail, and the triangles they save in a scene"""
+    import numpy
+    import lod
+    import transform
+    positions,faces,uvs = grid_mesh(n)
+    positions = numpy.array(positions,dtype=numpy.float64)
+    positions[:,2] = 5.0*numpy.sin(positions[:,0]*0.2)*numpy.cos(positions[:,1]*0.2)
+    t = time.time()
+    levels = lod.simplified_levels(positions,faces)
+    report('%d triangles simplified to %s' % (len(faces),'/'.join(str(len(f)) for p,f in levels[1:])),
+           (time.time()-t)*1e6)
+    class Level(object):
+        def __init__(self,p,f):
+            import mesh
+            self.bounds = mesh.bounds(p)
+            self.sphere = mesh.bounding_sphere(p)
+            self.ntris = len(f)
+    detail = lod.LOD([Level(p,f) for p,f in levels],(0.2,0.1,0.05))
+    rng = numpy.random.RandomState(1)
+    models = transform.translation(rng.uniform(-2000,2000,(objects,3))*[1,1,0]+[0,2100,0])
+    VP = transform.multiply(transform.look_at([0,0,0],[0,-100,50]),transform.projection())
+    scene = [lod.LODObject(detail) for i in xrange(objects)]
+    report('%d objects, levels picked' % objects,timeit(lambda:lod.update_levels(scene,models,VP),20))
+    counts = lod.update_levels(scene,models,VP)
+    print '  objects per level   ',counts.tolist()
+    print '  triangles           ',sum(detail.levels[o.level].ntris for o in scene),
+    print 'against',objects*len(faces),'without levels'
+
+def bench_strips(n=100,ranges=1000):
+    """Index counts of triangle lists against joined strips, and the draw calls needed for
+    many ranges of one index buffer"""
+    import numpy
+    import meshopt
+    import multidraw
+    positions,faces,uvs = grid_mesh(n)
+    for name,f in (('grid order',faces),
+                   ('cache optimised',meshopt.optimize_triangles(faces,len(positions)))):
+        t = time.time()
+        strips = meshopt.stripify(f)
+        indices = meshopt.join_strips(strips)
+        report('%d triangles stripified (%s)' % (len(f),name),(time.time()-t)*1e6)
+        print '  list indices %d, strip indices %d in %d strips, ACMR %.2f -> %.2f' % (
+            f.size,len(indices),len(strips),meshopt.acmr(f),
+            meshopt.acmr(numpy.column_stack((indices[:-2],indices[1:-1],indices[2:]))))
+    from gl2 import GL_TRIANGLES, GL_TRIANGLE_STRIP, GL_UNSIGNED_INT
+    rng = numpy.random.RandomState(1)
+    visible = numpy.sort(rng.choice(ranges,ranges//2,replace=False))
+    indices = numpy.arange(ranges*96,dtype=numpy.uint32)
+    counts = numpy.full(len(visible),96)
+    offsets = visible*96*4
+    # Count the calls drawing would make, with the draws replaced by counters
+    made = [0]
+    def count(*args):
+        made[0] += 1
+    class Stream(object):
+        def write(self,data):
+            return 0
+    saved = multidraw.glDrawElements,multidraw.glMultiDrawElementsEXT
+    multidraw.glDrawElements = multidraw.glMultiDrawElementsEXT = count
+    try:
+        for mode,name in ((GL_TRIANGLES,'lists'),(GL_TRIANGLE_STRIP,'strips')):
+            calls = []
+            for args in ({'multi':False},{'multi':False,'indices':indices,'stream':Stream()},
+                         {'multi':True}):
+                made[0] = 0
+                returned = multidraw.draw_elements(mode,counts,GL_UNSIGNED_INT,offsets,**args)
+                assert returned==made[0]
+                calls.append(returned)
+            print '  %d of %d ranges as %s: %d draw calls separately, %d gathered, %d with multi-draw' % (
+                (len(visible),ranges,name)+tuple(calls))
+    finally:
+        multidraw.glDrawElements,multidraw.glMultiDrawElementsEXT = saved
+
+def bench_pipeline(frames=300):
+    """The Mandelbrot/Julia demo unpaced, with glFinish every frame against frames left in
+    flight for the GPU"""
+    import pyopengles
+    import fence
+    from frames import FrameScheduler
+    pyopengles.egl = egl = pyopengles.EGL() # The demo draws to the module's display
+    d = pyopengles.demo()
+    d.draw_mandelbrot_to_texture(0.003)
+    print '  EGL_KHR_fence_sync',fence.supported()
+    for in_flight in (0,1,2,3):
+        s = FrameScheduler(egl,interval=0,fps=None,in_flight=in_flight)
+        n = [0]
+        def render(alpha):
+            n[0] += 1
+            d.draw_triangles(0.003,(200+n[0]%200,300))
+        t = time.time()
+        cpu = time.clock()
+        s.run(None,render,lambda:n[0]>=frames)
+        cpu = time.clock()-cpu
+        s.close()
+        name = 'glFinish every frame' if in_flight==0 else '%d frames in flight' % in_flight
+        report('%s, per frame' % name,(time.time()-t)*1e6/frames)
+        stats = s.stats()
+        print '  CPU %.2fms a frame, p99 %.2fms, waited for the GPU in %d frames (%.1fms)' % (
+            cpu*1e3/frames,stats['p99'],stats['gpu_waits'],stats['gpu_wait']*1e3)
+
+benchmarks = [
+    ('calls',bench_calls),
+    ('import',bench_import),
+    ('errors',bench_errors),
+    ('shaders',bench_shaders),
+    ('transforms',bench_transforms),
+    ('mesh',bench_mesh),
+    ('meshopt',bench_meshopt),
+    ('batch',bench_batch),
+    ('arena',bench_arena),
+    ('culling',bench_culling),
+    ('queue',bench_queue),
+    ('lod',bench_lod),
+    ('strips',bench_strips),
+    ('pipeline',bench_pipeline),
+]
+
+if __name__ == "__main__":
+    names = sys.argv[1:]
+    for name,fn in benchmarks:
+        if names and name not in names:
+            continue
+        print '==',name,'=='
+        fn()
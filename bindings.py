@@ -0,0 +1,589 @@
+# This file is generated by prepare_bindings.py from the header files.  Do not edit.
+#
+# Every entry point has argtypes/restype set, so floats can be passed directly
+# and pointers are returned at full width.  Entry points the library does not
+# provide are looked up with eglGetProcAddress, or set to None if unavailable.
+import ctypes
+
+GLchar = ctypes.c_char
+GLenum = ctypes.c_uint
+GLboolean = ctypes.c_ubyte
+GLbitfield = ctypes.c_uint
+GLbyte = ctypes.c_byte
+GLshort = ctypes.c_short
+GLint = ctypes.c_int
+GLsizei = ctypes.c_int
+GLubyte = ctypes.c_ubyte
+GLushort = ctypes.c_ushort
+GLuint = ctypes.c_uint
+GLfloat = ctypes.c_float
+GLclampf = ctypes.c_float
+GLfixed = ctypes.c_int
+GLintptr = ctypes.c_ssize_t
+GLsizeiptr = ctypes.c_ssize_t
+GLeglImageOES = ctypes.c_void_p
+EGLBoolean = ctypes.c_uint
+EGLenum = ctypes.c_uint
+EGLint = ctypes.c_int
+EGLConfig = ctypes.c_void_p
+EGLContext = ctypes.c_void_p
+EGLDisplay = ctypes.c_void_p
+EGLSurface = ctypes.c_void_p
+EGLClientBuffer = ctypes.c_void_p
+EGLNativeDisplayType = ctypes.c_void_p
+EGLNativePixmapType = ctypes.c_void_p
+EGLNativeWindowType = ctypes.c_void_p
+EGLImageKHR = ctypes.c_void_p
+EGLSyncKHR = ctypes.c_void_p
+EGLTimeKHR = ctypes.c_uint64
+EGLSyncNV = ctypes.c_void_p
+EGLTimeNV = ctypes.c_uint64
+EGLuint64NV = ctypes.c_uint64
+__eglMustCastToProperFunctionPointerType = ctypes.c_void_p
+
+opengles = ctypes.CDLL('libGLESv2.so')
+openegl = ctypes.CDLL('libEGL.so')
+
+def _bind(lib,name,restype,argtypes):
+    """Returns the typed entry point, or None if it cannot be found"""
+    try:
+        f = getattr(lib,name)
+    except AttributeError:
+        address = eglGetProcAddress(name)
+        if not address:
+            return None
+        return ctypes.CFUNCTYPE(restype,*argtypes)(address)
+    f.restype = restype
+    f.argtypes = argtypes
+    return f
+
+eglGetProcAddress = openegl.eglGetProcAddress
+eglGetProcAddress.restype = ctypes.c_void_p
+eglGetProcAddress.argtypes = [ctypes.c_char_p]
+
+glActiveTexture = _bind(opengles,'glActiveTexture',None,[GLenum])
+glAttachShader = _bind(opengles,'glAttachShader',None,[GLuint, GLuint])
+glBindAttribLocation = _bind(opengles,'glBindAttribLocation',None,[GLuint, GLuint, ctypes.c_char_p])
+glBindBuffer = _bind(opengles,'glBindBuffer',None,[GLenum, GLuint])
+glBindFramebuffer = _bind(opengles,'glBindFramebuffer',None,[GLenum, GLuint])
+glBindRenderbuffer = _bind(opengles,'glBindRenderbuffer',None,[GLenum, GLuint])
+glBindTexture = _bind(opengles,'glBindTexture',None,[GLenum, GLuint])
+glBlendColor = _bind(opengles,'glBlendColor',None,[GLclampf, GLclampf, GLclampf, GLclampf])
+glBlendEquation = _bind(opengles,'glBlendEquation',None,[GLenum])
+glBlendEquationSeparate = _bind(opengles,'glBlendEquationSeparate',None,[GLenum, GLenum])
+glBlendFunc = _bind(opengles,'glBlendFunc',None,[GLenum, GLenum])
+glBlendFuncSeparate = _bind(opengles,'glBlendFuncSeparate',None,[GLenum, GLenum, GLenum, GLenum])
+glBufferData = _bind(opengles,'glBufferData',None,[GLenum, GLsizeiptr, ctypes.c_void_p, GLenum])
+glBufferSubData = _bind(opengles,'glBufferSubData',None,[GLenum, GLintptr, GLsizeiptr, ctypes.c_void_p])
+glCheckFramebufferStatus = _bind(opengles,'glCheckFramebufferStatus',GLenum,[GLenum])
+glClear = _bind(opengles,'glClear',None,[GLbitfield])
+glClearColor = _bind(opengles,'glClearColor',None,[GLclampf, GLclampf, GLclampf, GLclampf])
+glClearDepthf = _bind(opengles,'glClearDepthf',None,[GLclampf])
+glClearStencil = _bind(opengles,'glClearStencil',None,[GLint])
+glColorMask = _bind(opengles,'glColorMask',None,[GLboolean, GLboolean, GLboolean, GLboolean])
+glCompileShader = _bind(opengles,'glCompileShader',None,[GLuint])
+glCompressedTexImage2D = _bind(opengles,'glCompressedTexImage2D',None,[GLenum, GLint, GLenum, GLsizei, GLsizei, GLint, GLsizei, ctypes.c_void_p])
+glCompressedTexSubImage2D = _bind(opengles,'glCompressedTexSubImage2D',None,[GLenum, GLint, GLint, GLint, GLsizei, GLsizei, GLenum, GLsizei, ctypes.c_void_p])
+glCopyTexImage2D = _bind(opengles,'glCopyTexImage2D',None,[GLenum, GLint, GLenum, GLint, GLint, GLsizei, GLsizei, GLint])
+glCopyTexSubImage2D = _bind(opengles,'glCopyTexSubImage2D',None,[GLenum, GLint, GLint, GLint, GLint, GLint, GLsizei, GLsizei])
+glCreateProgram = _bind(opengles,'glCreateProgram',GLuint,[])
+glCreateShader = _bind(opengles,'glCreateShader',GLuint,[GLenum])
+glCullFace = _bind(opengles,'glCullFace',None,[GLenum])
+glDeleteBuffers = _bind(opengles,'glDeleteBuffers',None,[GLsizei, ctypes.c_void_p])
+glDeleteFramebuffers = _bind(opengles,'glDeleteFramebuffers',None,[GLsizei, ctypes.c_void_p])
+glDeleteProgram = _bind(opengles,'glDeleteProgram',None,[GLuint])
+glDeleteRenderbuffers = _bind(opengles,'glDeleteRenderbuffers',None,[GLsizei, ctypes.c_void_p])
+glDeleteShader = _bind(opengles,'glDeleteShader',None,[GLuint])
+glDeleteTextures = _bind(opengles,'glDeleteTextures',None,[GLsizei, ctypes.c_void_p])
+glDepthFunc = _bind(opengles,'glDepthFunc',None,[GLenum])
+glDepthMask = _bind(opengles,'glDepthMask',None,[GLboolean])
+glDepthRangef = _bind(opengles,'glDepthRangef',None,[GLclampf, GLclampf])
+glDetachShader = _bind(opengles,'glDetachShader',None,[GLuint, GLuint])
+glDisable = _bind(opengles,'glDisable',None,[GLenum])
+glDisableVertexAttribArray = _bind(opengles,'glDisableVertexAttribArray',None,[GLuint])
+glDrawArrays = _bind(opengles,'glDrawArrays',None,[GLenum, GLint, GLsizei])
+glDrawElements = _bind(opengles,'glDrawElements',None,[GLenum, GLsizei, GLenum, ctypes.c_void_p])
+glEnable = _bind(opengles,'glEnable',None,[GLenum])
+glEnableVertexAttribArray = _bind(opengles,'glEnableVertexAttribArray',None,[GLuint])
+glFinish = _bind(opengles,'glFinish',None,[])
+glFlush = _bind(opengles,'glFlush',None,[])
+glFramebufferRenderbuffer = _bind(opengles,'glFramebufferRenderbuffer',None,[GLenum, GLenum, GLenum, GLuint])
+glFramebufferTexture2D = _bind(opengles,'glFramebufferTexture2D',None,[GLenum, GLenum, GLenum, GLuint, GLint])
+glFrontFace = _bind(opengles,'glFrontFace',None,[GLenum])
+glGenBuffers = _bind(opengles,'glGenBuffers',None,[GLsizei, ctypes.c_void_p])
+glGenerateMipmap = _bind(opengles,'glGenerateMipmap',None,[GLenum])
+glGenFramebuffers = _bind(opengles,'glGenFramebuffers',None,[GLsizei, ctypes.c_void_p])
+glGenRenderbuffers = _bind(opengles,'glGenRenderbuffers',None,[GLsizei, ctypes.c_void_p])
+glGenTextures = _bind(opengles,'glGenTextures',None,[GLsizei, ctypes.c_void_p])
+glGetActiveAttrib = _bind(opengles,'glGetActiveAttrib',None,[GLuint, GLuint, GLsizei, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p])
+glGetActiveUniform = _bind(opengles,'glGetActiveUniform',None,[GLuint, GLuint, GLsizei, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p])
+glGetAttachedShaders = _bind(opengles,'glGetAttachedShaders',None,[GLuint, GLsizei, ctypes.c_void_p, ctypes.c_void_p])
+glGetAttribLocation = _bind(opengles,'glGetAttribLocation',ctypes.c_int,[GLuint, ctypes.c_char_p])
+glGetBooleanv = _bind(opengles,'glGetBooleanv',None,[GLenum, ctypes.c_void_p])
+glGetBufferParameteriv = _bind(opengles,'glGetBufferParameteriv',None,[GLenum, GLenum, ctypes.c_void_p])
+glGetError = _bind(opengles,'glGetError',GLenum,[])
+glGetFloatv = _bind(opengles,'glGetFloatv',None,[GLenum, ctypes.c_void_p])
+glGetFramebufferAttachmentParameteriv = _bind(opengles,'glGetFramebufferAttachmentParameteriv',None,[GLenum, GLenum, GLenum, ctypes.c_void_p])
+glGetIntegerv = _bind(opengles,'glGetIntegerv',None,[GLenum, ctypes.c_void_p])
+glGetProgramiv = _bind(opengles,'glGetProgramiv',None,[GLuint, GLenum, ctypes.c_void_p])
+glGetProgramInfoLog = _bind(opengles,'glGetProgramInfoLog',None,[GLuint, GLsizei, ctypes.c_void_p, ctypes.c_void_p])
+glGetRenderbufferParameteriv = _bind(opengles,'glGetRenderbufferParameteriv',None,[GLenum, GLenum, ctypes.c_void_p])
+glGetShaderiv = _bind(opengles,'glGetShaderiv',None,[GLuint, GLenum, ctypes.c_void_p])
+glGetShaderInfoLog = _bind(opengles,'glGetShaderInfoLog',None,[GLuint, GLsizei, ctypes.c_void_p, ctypes.c_void_p])
+glGetShaderPrecisionFormat = _bind(opengles,'glGetShaderPrecisionFormat',None,[GLenum, GLenum, ctypes.c_void_p, ctypes.c_void_p])
+glGetShaderSource = _bind(opengles,'glGetShaderSource',None,[GLuint, GLsizei, ctypes.c_void_p, ctypes.c_void_p])
+glGetString = _bind(opengles,'glGetString',ctypes.c_char_p,[GLenum])
+glGetTexParameterfv = _bind(opengles,'glGetTexParameterfv',None,[GLenum, GLenum, ctypes.c_void_p])
+glGetTexParameteriv = _bind(opengles,'glGetTexParameteriv',None,[GLenum, GLenum, ctypes.c_void_p])
+glGetUniformfv = _bind(opengles,'glGetUniformfv',None,[GLuint, GLint, ctypes.c_void_p])
+glGetUniformiv = _bind(opengles,'glGetUniformiv',None,[GLuint, GLint, ctypes.c_void_p])
+glGetUniformLocation = _bind(opengles,'glGetUniformLocation',ctypes.c_int,[GLuint, ctypes.c_char_p])
+glGetVertexAttribfv = _bind(opengles,'glGetVertexAttribfv',None,[GLuint, GLenum, ctypes.c_void_p])
+glGetVertexAttribiv = _bind(opengles,'glGetVertexAttribiv',None,[GLuint, GLenum, ctypes.c_void_p])
+glGetVertexAttribPointerv = _bind(opengles,'glGetVertexAttribPointerv',None,[GLuint, GLenum, ctypes.c_void_p])
+glHint = _bind(opengles,'glHint',None,[GLenum, GLenum])
+glIsBuffer = _bind(opengles,'glIsBuffer',GLboolean,[GLuint])
+glIsEnabled = _bind(opengles,'glIsEnabled',GLboolean,[GLenum])
+glIsFramebuffer = _bind(opengles,'glIsFramebuffer',GLboolean,[GLuint])
+glIsProgram = _bind(opengles,'glIsProgram',GLboolean,[GLuint])
+glIsRenderbuffer = _bind(opengles,'glIsRenderbuffer',GLboolean,[GLuint])
+glIsShader = _bind(opengles,'glIsShader',GLboolean,[GLuint])
+glIsTexture = _bind(opengles,'glIsTexture',GLboolean,[GLuint])
+glLineWidth = _bind(opengles,'glLineWidth',None,[GLfloat])
+glLinkProgram = _bind(opengles,'glLinkProgram',None,[GLuint])
+glPixelStorei = _bind(opengles,'glPixelStorei',None,[GLenum, GLint])
+glPolygonOffset = _bind(opengles,'glPolygonOffset',None,[GLfloat, GLfloat])
+glReadPixels = _bind(opengles,'glReadPixels',None,[GLint, GLint, GLsizei, GLsizei, GLenum, GLenum, ctypes.c_void_p])
+glReleaseShaderCompiler = _bind(opengles,'glReleaseShaderCompiler',None,[])
+glRenderbufferStorage = _bind(opengles,'glRenderbufferStorage',None,[GLenum, GLenum, GLsizei, GLsizei])
+glSampleCoverage = _bind(opengles,'glSampleCoverage',None,[GLclampf, GLboolean])
+glScissor = _bind(opengles,'glScissor',None,[GLint, GLint, GLsizei, GLsizei])
+glShaderBinary = _bind(opengles,'glShaderBinary',None,[GLsizei, ctypes.c_void_p, GLenum, ctypes.c_void_p, GLsizei])
+glShaderSource = _bind(opengles,'glShaderSource',None,[GLuint, GLsizei, ctypes.c_void_p, ctypes.c_void_p])
+glStencilFunc = _bind(opengles,'glStencilFunc',None,[GLenum, GLint, GLuint])
+glStencilFuncSeparate = _bind(opengles,'glStencilFuncSeparate',None,[GLenum, GLenum, GLint, GLuint])
+glStencilMask = _bind(opengles,'glStencilMask',None,[GLuint])
+glStencilMaskSeparate = _bind(opengles,'glStencilMaskSeparate',None,[GLenum, GLuint])
+glStencilOp = _bind(opengles,'glStencilOp',None,[GLenum, GLenum, GLenum])
+glStencilOpSeparate = _bind(opengles,'glStencilOpSeparate',None,[GLenum, GLenum, GLenum, GLenum])
+glTexImage2D = _bind(opengles,'glTexImage2D',None,[GLenum, GLint, GLint, GLsizei, GLsizei, GLint, GLenum, GLenum, ctypes.c_void_p])
+glTexParameterf = _bind(opengles,'glTexParameterf',None,[GLenum, GLenum, GLfloat])
+glTexParameterfv = _bind(opengles,'glTexParameterfv',None,[GLenum, GLenum, ctypes.c_void_p])
+glTexParameteri = _bind(opengles,'glTexParameteri',None,[GLenum, GLenum, GLint])
+glTexParameteriv = _bind(opengles,'glTexParameteriv',None,[GLenum, GLenum, ctypes.c_void_p])
+glTexSubImage2D = _bind(opengles,'glTexSubImage2D',None,[GLenum, GLint, GLint, GLint, GLsizei, GLsizei, GLenum, GLenum, ctypes.c_void_p])
+glUniform1f = _bind(opengles,'glUniform1f',None,[GLint, GLfloat])
+glUniform1fv = _bind(opengles,'glUniform1fv',None,[GLint, GLsizei, ctypes.c_void_p])
+glUniform1i = _bind(opengles,'glUniform1i',None,[GLint, GLint])
+glUniform1iv = _bind(opengles,'glUniform1iv',None,[GLint, GLsizei, ctypes.c_void_p])
+glUniform2f = _bind(opengles,'glUniform2f',None,[GLint, GLfloat, GLfloat])
+glUniform2fv = _bind(opengles,'glUniform2fv',None,[GLint, GLsizei, ctypes.c_void_p])
+glUniform2i = _bind(opengles,'glUniform2i',None,[GLint, GLint, GLint])
+glUniform2iv = _bind(opengles,'glUniform2iv',None,[GLint, GLsizei, ctypes.c_void_p])
+glUniform3f = _bind(opengles,'glUniform3f',None,[GLint, GLfloat, GLfloat, GLfloat])
+glUniform3fv = _bind(opengles,'glUniform3fv',None,[GLint, GLsizei, ctypes.c_void_p])
+glUniform3i = _bind(opengles,'glUniform3i',None,[GLint, GLint, GLint, GLint])
+glUniform3iv = _bind(opengles,'glUniform3iv',None,[GLint, GLsizei, ctypes.c_void_p])
+glUniform4f = _bind(opengles,'glUniform4f',None,[GLint, GLfloat, GLfloat, GLfloat, GLfloat])
+glUniform4fv = _bind(opengles,'glUniform4fv',None,[GLint, GLsizei, ctypes.c_void_p])
+glUniform4i = _bind(opengles,'glUniform4i',None,[GLint, GLint, GLint, GLint, GLint])
+glUniform4iv = _bind(opengles,'glUniform4iv',None,[GLint, GLsizei, ctypes.c_void_p])
+glUniformMatrix2fv = _bind(opengles,'glUniformMatrix2fv',None,[GLint, GLsizei, GLboolean, ctypes.c_void_p])
+glUniformMatrix3fv = _bind(opengles,'glUniformMatrix3fv',None,[GLint, GLsizei, GLboolean, ctypes.c_void_p])
+glUniformMatrix4fv = _bind(opengles,'glUniformMatrix4fv',None,[GLint, GLsizei, GLboolean, ctypes.c_void_p])
+glUseProgram = _bind(opengles,'glUseProgram',None,[GLuint])
+glValidateProgram = _bind(opengles,'glValidateProgram',None,[GLuint])
+glVertexAttrib1f = _bind(opengles,'glVertexAttrib1f',None,[GLuint, GLfloat])
+glVertexAttrib1fv = _bind(opengles,'glVertexAttrib1fv',None,[GLuint, ctypes.c_void_p])
+glVertexAttrib2f = _bind(opengles,'glVertexAttrib2f',None,[GLuint, GLfloat, GLfloat])
+glVertexAttrib2fv = _bind(opengles,'glVertexAttrib2fv',None,[GLuint, ctypes.c_void_p])
+glVertexAttrib3f = _bind(opengles,'glVertexAttrib3f',None,[GLuint, GLfloat, GLfloat, GLfloat])
+glVertexAttrib3fv = _bind(opengles,'glVertexAttrib3fv',None,[GLuint, ctypes.c_void_p])
+glVertexAttrib4f = _bind(opengles,'glVertexAttrib4f',None,[GLuint, GLfloat, GLfloat, GLfloat, GLfloat])
+glVertexAttrib4fv = _bind(opengles,'glVertexAttrib4fv',None,[GLuint, ctypes.c_void_p])
+glVertexAttribPointer = _bind(opengles,'glVertexAttribPointer',None,[GLuint, GLint, GLenum, GLboolean, GLsizei, ctypes.c_void_p])
+glViewport = _bind(opengles,'glViewport',None,[GLint, GLint, GLsizei, GLsizei])
+glEGLImageTargetTexture2DOES = _bind(opengles,'glEGLImageTargetTexture2DOES',None,[GLenum, GLeglImageOES])
+glEGLImageTargetRenderbufferStorageOES = _bind(opengles,'glEGLImageTargetRenderbufferStorageOES',None,[GLenum, GLeglImageOES])
+glGetProgramBinaryOES = _bind(opengles,'glGetProgramBinaryOES',None,[GLuint, GLsizei, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p])
+glProgramBinaryOES = _bind(opengles,'glProgramBinaryOES',None,[GLuint, GLenum, ctypes.c_void_p, GLint])
+glMapBufferOES = _bind(opengles,'glMapBufferOES',ctypes.c_void_p,[GLenum, GLenum])
+glUnmapBufferOES = _bind(opengles,'glUnmapBufferOES',GLboolean,[GLenum])
+glGetBufferPointervOES = _bind(opengles,'glGetBufferPointervOES',None,[GLenum, GLenum, ctypes.c_void_p])
+glTexImage3DOES = _bind(opengles,'glTexImage3DOES',None,[GLenum, GLint, GLenum, GLsizei, GLsizei, GLsizei, GLint, GLenum, GLenum, ctypes.c_void_p])
+glTexSubImage3DOES = _bind(opengles,'glTexSubImage3DOES',None,[GLenum, GLint, GLint, GLint, GLint, GLsizei, GLsizei, GLsizei, GLenum, GLenum, ctypes.c_void_p])
+glCopyTexSubImage3DOES = _bind(opengles,'glCopyTexSubImage3DOES',None,[GLenum, GLint, GLint, GLint, GLint, GLint, GLint, GLsizei, GLsizei])
+glCompressedTexImage3DOES = _bind(opengles,'glCompressedTexImage3DOES',None,[GLenum, GLint, GLenum, GLsizei, GLsizei, GLsizei, GLint, GLsizei, ctypes.c_void_p])
+glCompressedTexSubImage3DOES = _bind(opengles,'glCompressedTexSubImage3DOES',None,[GLenum, GLint, GLint, GLint, GLint, GLsizei, GLsizei, GLsizei, GLenum, GLsizei, ctypes.c_void_p])
+glFramebufferTexture3DOES = _bind(opengles,'glFramebufferTexture3DOES',None,[GLenum, GLenum, GLenum, GLuint, GLint, GLint])
+glBindVertexArrayOES = _bind(opengles,'glBindVertexArrayOES',None,[GLuint])
+glDeleteVertexArraysOES = _bind(opengles,'glDeleteVertexArraysOES',None,[GLsizei, ctypes.c_void_p])
+glGenVertexArraysOES = _bind(opengles,'glGenVertexArraysOES',None,[GLsizei, ctypes.c_void_p])
+glIsVertexArrayOES = _bind(opengles,'glIsVertexArrayOES',GLboolean,[GLuint])
+glGetPerfMonitorGroupsAMD = _bind(opengles,'glGetPerfMonitorGroupsAMD',None,[ctypes.c_void_p, GLsizei, ctypes.c_void_p])
+glGetPerfMonitorCountersAMD = _bind(opengles,'glGetPerfMonitorCountersAMD',None,[GLuint, ctypes.c_void_p, ctypes.c_void_p, GLsizei, ctypes.c_void_p])
+glGetPerfMonitorGroupStringAMD = _bind(opengles,'glGetPerfMonitorGroupStringAMD',None,[GLuint, GLsizei, ctypes.c_void_p, ctypes.c_void_p])
+glGetPerfMonitorCounterStringAMD = _bind(opengles,'glGetPerfMonitorCounterStringAMD',None,[GLuint, GLuint, GLsizei, ctypes.c_void_p, ctypes.c_void_p])
+glGetPerfMonitorCounterInfoAMD = _bind(opengles,'glGetPerfMonitorCounterInfoAMD',None,[GLuint, GLuint, GLenum, ctypes.c_void_p])
+glGenPerfMonitorsAMD = _bind(opengles,'glGenPerfMonitorsAMD',None,[GLsizei, ctypes.c_void_p])
+glDeletePerfMonitorsAMD = _bind(opengles,'glDeletePerfMonitorsAMD',None,[GLsizei, ctypes.c_void_p])
+glSelectPerfMonitorCountersAMD = _bind(opengles,'glSelectPerfMonitorCountersAMD',None,[GLuint, GLboolean, GLuint, GLint, ctypes.c_void_p])
+glBeginPerfMonitorAMD = _bind(opengles,'glBeginPerfMonitorAMD',None,[GLuint])
+glEndPerfMonitorAMD = _bind(opengles,'glEndPerfMonitorAMD',None,[GLuint])
+glGetPerfMonitorCounterDataAMD = _bind(opengles,'glGetPerfMonitorCounterDataAMD',None,[GLuint, GLenum, GLsizei, ctypes.c_void_p, ctypes.c_void_p])
+glBlitFramebufferANGLE = _bind(opengles,'glBlitFramebufferANGLE',None,[GLint, GLint, GLint, GLint, GLint, GLint, GLint, GLint, GLbitfield, GLenum])
+glRenderbufferStorageMultisampleANGLE = _bind(opengles,'glRenderbufferStorageMultisampleANGLE',None,[GLenum, GLsizei, GLenum, GLsizei, GLsizei])
+glRenderbufferStorageMultisampleAPPLE = _bind(opengles,'glRenderbufferStorageMultisampleAPPLE',None,[GLenum, GLsizei, GLenum, GLsizei, GLsizei])
+glResolveMultisampleFramebufferAPPLE = _bind(opengles,'glResolveMultisampleFramebufferAPPLE',None,[])
+glDiscardFramebufferEXT = _bind(opengles,'glDiscardFramebufferEXT',None,[GLenum, GLsizei, ctypes.c_void_p])
+glMultiDrawArraysEXT = _bind(opengles,'glMultiDrawArraysEXT',None,[GLenum, ctypes.c_void_p, ctypes.c_void_p, GLsizei])
+glMultiDrawElementsEXT = _bind(opengles,'glMultiDrawElementsEXT',None,[GLenum, ctypes.c_void_p, GLenum, ctypes.c_void_p, GLsizei])
+glRenderbufferStorageMultisampleIMG = _bind(opengles,'glRenderbufferStorageMultisampleIMG',None,[GLenum, GLsizei, GLenum, GLsizei, GLsizei])
+glFramebufferTexture2DMultisampleIMG = _bind(opengles,'glFramebufferTexture2DMultisampleIMG',None,[GLenum, GLenum, GLenum, GLuint, GLint, GLsizei])
+glCoverageMaskNV = _bind(opengles,'glCoverageMaskNV',None,[GLboolean])
+glCoverageOperationNV = _bind(opengles,'glCoverageOperationNV',None,[GLenum])
+glDrawBuffersNV = _bind(opengles,'glDrawBuffersNV',None,[GLsizei, ctypes.c_void_p])
+glDeleteFencesNV = _bind(opengles,'glDeleteFencesNV',None,[GLsizei, ctypes.c_void_p])
+glGenFencesNV = _bind(opengles,'glGenFencesNV',None,[GLsizei, ctypes.c_void_p])
+glIsFenceNV = _bind(opengles,'glIsFenceNV',GLboolean,[GLuint])
+glTestFenceNV = _bind(opengles,'glTestFenceNV',GLboolean,[GLuint])
+glGetFenceivNV = _bind(opengles,'glGetFenceivNV',None,[GLuint, GLenum, ctypes.c_void_p])
+glFinishFenceNV = _bind(opengles,'glFinishFenceNV',None,[GLuint])
+glSetFenceNV = _bind(opengles,'glSetFenceNV',None,[GLuint, GLenum])
+glReadBufferNV = _bind(opengles,'glReadBufferNV',None,[GLenum])
+glAlphaFuncQCOM = _bind(opengles,'glAlphaFuncQCOM',None,[GLenum, GLclampf])
+glGetDriverControlsQCOM = _bind(opengles,'glGetDriverControlsQCOM',None,[ctypes.c_void_p, GLsizei, ctypes.c_void_p])
+glGetDriverControlStringQCOM = _bind(opengles,'glGetDriverControlStringQCOM',None,[GLuint, GLsizei, ctypes.c_void_p, ctypes.c_void_p])
+glEnableDriverControlQCOM = _bind(opengles,'glEnableDriverControlQCOM',None,[GLuint])
+glDisableDriverControlQCOM = _bind(opengles,'glDisableDriverControlQCOM',None,[GLuint])
+glExtGetTexturesQCOM = _bind(opengles,'glExtGetTexturesQCOM',None,[ctypes.c_void_p, GLint, ctypes.c_void_p])
+glExtGetBuffersQCOM = _bind(opengles,'glExtGetBuffersQCOM',None,[ctypes.c_void_p, GLint, ctypes.c_void_p])
+glExtGetRenderbuffersQCOM = _bind(opengles,'glExtGetRenderbuffersQCOM',None,[ctypes.c_void_p, GLint, ctypes.c_void_p])
+glExtGetFramebuffersQCOM = _bind(opengles,'glExtGetFramebuffersQCOM',None,[ctypes.c_void_p, GLint, ctypes.c_void_p])
+glExtGetTexLevelParameterivQCOM = _bind(opengles,'glExtGetTexLevelParameterivQCOM',None,[GLuint, GLenum, GLint, GLenum, ctypes.c_void_p])
+glExtTexObjectStateOverrideiQCOM = _bind(opengles,'glExtTexObjectStateOverrideiQCOM',None,[GLenum, GLenum, GLint])
+glExtGetTexSubImageQCOM = _bind(opengles,'glExtGetTexSubImageQCOM',None,[GLenum, GLint, GLint, GLint, GLint, GLsizei, GLsizei, GLsizei, GLenum, GLenum, ctypes.c_void_p])
+glExtGetBufferPointervQCOM = _bind(opengles,'glExtGetBufferPointervQCOM',None,[GLenum, ctypes.c_void_p])
+glExtGetShadersQCOM = _bind(opengles,'glExtGetShadersQCOM',None,[ctypes.c_void_p, GLint, ctypes.c_void_p])
+glExtGetProgramsQCOM = _bind(opengles,'glExtGetProgramsQCOM',None,[ctypes.c_void_p, GLint, ctypes.c_void_p])
+glExtIsProgramBinaryQCOM = _bind(opengles,'glExtIsProgramBinaryQCOM',GLboolean,[GLuint])
+glExtGetProgramBinarySourceQCOM = _bind(opengles,'glExtGetProgramBinarySourceQCOM',None,[GLuint, GLenum, ctypes.c_void_p, ctypes.c_void_p])
+glStartTilingQCOM = _bind(opengles,'glStartTilingQCOM',None,[GLuint, GLuint, GLuint, GLuint, GLbitfield])
+glEndTilingQCOM = _bind(opengles,'glEndTilingQCOM',None,[GLbitfield])
+
+eglGetError = _bind(openegl,'eglGetError',EGLint,[])
+eglGetDisplay = _bind(openegl,'eglGetDisplay',EGLDisplay,[EGLNativeDisplayType])
+eglInitialize = _bind(openegl,'eglInitialize',EGLBoolean,[EGLDisplay, ctypes.c_void_p, ctypes.c_void_p])
+eglTerminate = _bind(openegl,'eglTerminate',EGLBoolean,[EGLDisplay])
+eglQueryString = _bind(openegl,'eglQueryString',ctypes.c_char_p,[EGLDisplay, EGLint])
+eglGetConfigs = _bind(openegl,'eglGetConfigs',EGLBoolean,[EGLDisplay, ctypes.c_void_p, EGLint, ctypes.c_void_p])
+eglChooseConfig = _bind(openegl,'eglChooseConfig',EGLBoolean,[EGLDisplay, ctypes.c_void_p, ctypes.c_void_p, EGLint, ctypes.c_void_p])
+eglGetConfigAttrib = _bind(openegl,'eglGetConfigAttrib',EGLBoolean,[EGLDisplay, EGLConfig, EGLint, ctypes.c_void_p])
+eglCreateWindowSurface = _bind(openegl,'eglCreateWindowSurface',EGLSurface,[EGLDisplay, EGLConfig, EGLNativeWindowType, ctypes.c_void_p])
+eglCreatePbufferSurface = _bind(openegl,'eglCreatePbufferSurface',EGLSurface,[EGLDisplay, EGLConfig, ctypes.c_void_p])
+eglCreatePixmapSurface = _bind(openegl,'eglCreatePixmapSurface',EGLSurface,[EGLDisplay, EGLConfig, EGLNativePixmapType, ctypes.c_void_p])
+eglDestroySurface = _bind(openegl,'eglDestroySurface',EGLBoolean,[EGLDisplay, EGLSurface])
+eglQuerySurface = _bind(openegl,'eglQuerySurface',EGLBoolean,[EGLDisplay, EGLSurface, EGLint, ctypes.c_void_p])
+eglBindAPI = _bind(openegl,'eglBindAPI',EGLBoolean,[EGLenum])
+eglQueryAPI = _bind(openegl,'eglQueryAPI',EGLenum,[])
+eglWaitClient = _bind(openegl,'eglWaitClient',EGLBoolean,[])
+eglReleaseThread = _bind(openegl,'eglReleaseThread',EGLBoolean,[])
+eglCreatePbufferFromClientBuffer = _bind(openegl,'eglCreatePbufferFromClientBuffer',EGLSurface,[EGLDisplay, EGLenum, EGLClientBuffer, EGLConfig, ctypes.c_void_p])
+eglSurfaceAttrib = _bind(openegl,'eglSurfaceAttrib',EGLBoolean,[EGLDisplay, EGLSurface, EGLint, EGLint])
+eglBindTexImage = _bind(openegl,'eglBindTexImage',EGLBoolean,[EGLDisplay, EGLSurface, EGLint])
+eglReleaseTexImage = _bind(openegl,'eglReleaseTexImage',EGLBoolean,[EGLDisplay, EGLSurface, EGLint])
+eglSwapInterval = _bind(openegl,'eglSwapInterval',EGLBoolean,[EGLDisplay, EGLint])
+eglCreateContext = _bind(openegl,'eglCreateContext',EGLContext,[EGLDisplay, EGLConfig, EGLContext, ctypes.c_void_p])
+eglDestroyContext = _bind(openegl,'eglDestroyContext',EGLBoolean,[EGLDisplay, EGLContext])
+eglMakeCurrent = _bind(openegl,'eglMakeCurrent',EGLBoolean,[EGLDisplay, EGLSurface, EGLSurface, EGLContext])
+eglGetCurrentContext = _bind(openegl,'eglGetCurrentContext',EGLContext,[])
+eglGetCurrentSurface = _bind(openegl,'eglGetCurrentSurface',EGLSurface,[EGLint])
+eglGetCurrentDisplay = _bind(openegl,'eglGetCurrentDisplay',EGLDisplay,[])
+eglQueryContext = _bind(openegl,'eglQueryContext',EGLBoolean,[EGLDisplay, EGLContext, EGLint, ctypes.c_void_p])
+eglWaitGL = _bind(openegl,'eglWaitGL',EGLBoolean,[])
+eglWaitNative = _bind(openegl,'eglWaitNative',EGLBoolean,[EGLint])
+eglSwapBuffers = _bind(openegl,'eglSwapBuffers',EGLBoolean,[EGLDisplay, EGLSurface])
+eglCopyBuffers = _bind(openegl,'eglCopyBuffers',EGLBoolean,[EGLDisplay, EGLSurface, EGLNativePixmapType])
+eglLockSurfaceKHR = _bind(openegl,'eglLockSurfaceKHR',EGLBoolean,[EGLDisplay, EGLSurface, ctypes.c_void_p])
+eglUnlockSurfaceKHR = _bind(openegl,'eglUnlockSurfaceKHR',EGLBoolean,[EGLDisplay, EGLSurface])
+eglCreateImageKHR = _bind(openegl,'eglCreateImageKHR',EGLImageKHR,[EGLDisplay, EGLContext, EGLenum, EGLClientBuffer, ctypes.c_void_p])
+eglDestroyImageKHR = _bind(openegl,'eglDestroyImageKHR',EGLBoolean,[EGLDisplay, EGLImageKHR])
+eglCreateSyncKHR = _bind(openegl,'eglCreateSyncKHR',EGLSyncKHR,[EGLDisplay, EGLenum, ctypes.c_void_p])
+eglDestroySyncKHR = _bind(openegl,'eglDestroySyncKHR',EGLBoolean,[EGLDisplay, EGLSyncKHR])
+eglClientWaitSyncKHR = _bind(openegl,'eglClientWaitSyncKHR',EGLint,[EGLDisplay, EGLSyncKHR, EGLint, EGLTimeKHR])
+eglSignalSyncKHR = _bind(openegl,'eglSignalSyncKHR',EGLBoolean,[EGLDisplay, EGLSyncKHR, EGLenum])
+eglGetSyncAttribKHR = _bind(openegl,'eglGetSyncAttribKHR',EGLBoolean,[EGLDisplay, EGLSyncKHR, EGLint, ctypes.c_void_p])
+eglCreatePixmapSurfaceHI = _bind(openegl,'eglCreatePixmapSurfaceHI',EGLSurface,[EGLDisplay, EGLConfig, ctypes.c_void_p])
+eglCreateDRMImageMESA = _bind(openegl,'eglCreateDRMImageMESA',EGLImageKHR,[EGLDisplay, ctypes.c_void_p])
+eglExportDRMImageMESA = _bind(openegl,'eglExportDRMImageMESA',EGLBoolean,[EGLDisplay, EGLImageKHR, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p])
+eglPostSubBufferNV = _bind(openegl,'eglPostSubBufferNV',EGLBoolean,[EGLDisplay, EGLSurface, EGLint, EGLint, EGLint, EGLint])
+eglQuerySurfacePointerANGLE = _bind(openegl,'eglQuerySurfacePointerANGLE',EGLBoolean,[EGLDisplay, EGLSurface, EGLint, ctypes.c_void_p])
+eglGetSystemTimeFrequencyNV = _bind(openegl,'eglGetSystemTimeFrequencyNV',EGLuint64NV,[])
+eglGetSystemTimeNV = _bind(openegl,'eglGetSystemTimeNV',EGLuint64NV,[])
+
+opengles_functions = (
+    'glActiveTexture',
+    'glAttachShader',
+    'glBindAttribLocation',
+    'glBindBuffer',
+    'glBindFramebuffer',
+    'glBindRenderbuffer',
+    'glBindTexture',
+    'glBlendColor',
+    'glBlendEquation',
+    'glBlendEquationSeparate',
+    'glBlendFunc',
+    'glBlendFuncSeparate',
+    'glBufferData',
+    'glBufferSubData',
+    'glCheckFramebufferStatus',
+    'glClear',
+    'glClearColor',
+    'glClearDepthf',
+    'glClearStencil',
+    'glColorMask',
+    'glCompileShader',
+    'glCompressedTexImage2D',
+    'glCompressedTexSubImage2D',
+    'glCopyTexImage2D',
+    'glCopyTexSubImage2D',
+    'glCreateProgram',
+    'glCreateShader',
+    'glCullFace',
+    'glDeleteBuffers',
+    'glDeleteFramebuffers',
+    'glDeleteProgram',
+    'glDeleteRenderbuffers',
+    'glDeleteShader',
+    'glDeleteTextures',
+    'glDepthFunc',
+    'glDepthMask',
+    'glDepthRangef',
+    'glDetachShader',
+    'glDisable',
+    'glDisableVertexAttribArray',
+    'glDrawArrays',
+    'glDrawElements',
+    'glEnable',
+    'glEnableVertexAttribArray',
+    'glFinish',
+    'glFlush',
+    'glFramebufferRenderbuffer',
+    'glFramebufferTexture2D',
+    'glFrontFace',
+    'glGenBuffers',
+    'glGenerateMipmap',
+    'glGenFramebuffers',
+    'glGenRenderbuffers',
+    'glGenTextures',
+    'glGetActiveAttrib',
+    'glGetActiveUniform',
+    'glGetAttachedShaders',
+    'glGetAttribLocation',
+    'glGetBooleanv',
+    'glGetBufferParameteriv',
+    'glGetError',
+    'glGetFloatv',
+    'glGetFramebufferAttachmentParameteriv',
+    'glGetIntegerv',
+    'glGetProgramiv',
+    'glGetProgramInfoLog',
+    'glGetRenderbufferParameteriv',
+    'glGetShaderiv',
+    'glGetShaderInfoLog',
+    'glGetShaderPrecisionFormat',
+    'glGetShaderSource',
+    'glGetString',
+    'glGetTexParameterfv',
+    'glGetTexParameteriv',
+    'glGetUniformfv',
+    'glGetUniformiv',
+    'glGetUniformLocation',
+    'glGetVertexAttribfv',
+    'glGetVertexAttribiv',
+    'glGetVertexAttribPointerv',
+    'glHint',
+    'glIsBuffer',
+    'glIsEnabled',
+    'glIsFramebuffer',
+    'glIsProgram',
+    'glIsRenderbuffer',
+    'glIsShader',
+    'glIsTexture',
+    'glLineWidth',
+    'glLinkProgram',
+    'glPixelStorei',
+    'glPolygonOffset',
+    'glReadPixels',
+    'glReleaseShaderCompiler',
+    'glRenderbufferStorage',
+    'glSampleCoverage',
+    'glScissor',
+    'glShaderBinary',
+    'glShaderSource',
+    'glStencilFunc',
+    'glStencilFuncSeparate',
+    'glStencilMask',
+    'glStencilMaskSeparate',
+    'glStencilOp',
+    'glStencilOpSeparate',
+    'glTexImage2D',
+    'glTexParameterf',
+    'glTexParameterfv',
+    'glTexParameteri',
+    'glTexParameteriv',
+    'glTexSubImage2D',
+    'glUniform1f',
+    'glUniform1fv',
+    'glUniform1i',
+    'glUniform1iv',
+    'glUniform2f',
+    'glUniform2fv',
+    'glUniform2i',
+    'glUniform2iv',
+    'glUniform3f',
+    'glUniform3fv',
+    'glUniform3i',
+    'glUniform3iv',
+    'glUniform4f',
+    'glUniform4fv',
+    'glUniform4i',
+    'glUniform4iv',
+    'glUniformMatrix2fv',
+    'glUniformMatrix3fv',
+    'glUniformMatrix4fv',
+    'glUseProgram',
+    'glValidateProgram',
+    'glVertexAttrib1f',
+    'glVertexAttrib1fv',
+    'glVertexAttrib2f',
+    'glVertexAttrib2fv',
+    'glVertexAttrib3f',
+    'glVertexAttrib3fv',
+    'glVertexAttrib4f',
+    'glVertexAttrib4fv',
+    'glVertexAttribPointer',
+    'glViewport',
+    'glEGLImageTargetTexture2DOES',
+    'glEGLImageTargetRenderbufferStorageOES',
+    'glGetProgramBinaryOES',
+    'glProgramBinaryOES',
+    'glMapBufferOES',
+    'glUnmapBufferOES',
+    'glGetBufferPointervOES',
+    'glTexImage3DOES',
+    'glTexSubImage3DOES',
+    'glCopyTexSubImage3DOES',
+    'glCompressedTexImage3DOES',
+    'glCompressedTexSubImage3DOES',
+    'glFramebufferTexture3DOES',
+    'glBindVertexArrayOES',
+    'glDeleteVertexArraysOES',
+    'glGenVertexArraysOES',
+    'glIsVertexArrayOES',
+    'glGetPerfMonitorGroupsAMD',
+    'glGetPerfMonitorCountersAMD',
+    'glGetPerfMonitorGroupStringAMD',
+    'glGetPerfMonitorCounterStringAMD',
+    'glGetPerfMonitorCounterInfoAMD',
+    'glGenPerfMonitorsAMD',
+    'glDeletePerfMonitorsAMD',
+    'glSelectPerfMonitorCountersAMD',
+    'glBeginPerfMonitorAMD',
+    'glEndPerfMonitorAMD',
+    'glGetPerfMonitorCounterDataAMD',
+    'glBlitFramebufferANGLE',
+    'glRenderbufferStorageMultisampleANGLE',
+    'glRenderbufferStorageMultisampleAPPLE',
+    'glResolveMultisampleFramebufferAPPLE',
+    'glDiscardFramebufferEXT',
+    'glMultiDrawArraysEXT',
+    'glMultiDrawElementsEXT',
+    'glRenderbufferStorageMultisampleIMG',
+    'glFramebufferTexture2DMultisampleIMG',
+    'glCoverageMaskNV',
+    'glCoverageOperationNV',
+    'glDrawBuffersNV',
+    'glDeleteFencesNV',
+    'glGenFencesNV',
+    'glIsFenceNV',
+    'glTestFenceNV',
+    'glGetFenceivNV',
+    'glFinishFenceNV',
+    'glSetFenceNV',
+    'glReadBufferNV',
+    'glAlphaFuncQCOM',
+    'glGetDriverControlsQCOM',
+    'glGetDriverControlStringQCOM',
+    'glEnableDriverControlQCOM',
+    'glDisableDriverControlQCOM',
+    'glExtGetTexturesQCOM',
+    'glExtGetBuffersQCOM',
+    'glExtGetRenderbuffersQCOM',
+    'glExtGetFramebuffersQCOM',
+    'glExtGetTexLevelParameterivQCOM',
+    'glExtTexObjectStateOverrideiQCOM',
+    'glExtGetTexSubImageQCOM',
+    'glExtGetBufferPointervQCOM',
+    'glExtGetShadersQCOM',
+    'glExtGetProgramsQCOM',
+    'glExtIsProgramBinaryQCOM',
+    'glExtGetProgramBinarySourceQCOM',
+    'glStartTilingQCOM',
+    'glEndTilingQCOM',
+)
+openegl_functions = (
+    'eglGetError',
+    'eglGetDisplay',
+    'eglInitialize',
+    'eglTerminate',
+    'eglQueryString',
+    'eglGetConfigs',
+    'eglChooseConfig',
+    'eglGetConfigAttrib',
+    'eglCreateWindowSurface',
+    'eglCreatePbufferSurface',
+    'eglCreatePixmapSurface',
+    'eglDestroySurface',
+    'eglQuerySurface',
+    'eglBindAPI',
+    'eglQueryAPI',
+    'eglWaitClient',
+    'eglReleaseThread',
+    'eglCreatePbufferFromClientBuffer',
+    'eglSurfaceAttrib',
+    'eglBindTexImage',
+    'eglReleaseTexImage',
+    'eglSwapInterval',
+    'eglCreateContext',
+    'eglDestroyContext',
+    'eglMakeCurrent',
+    'eglGetCurrentContext',
+    'eglGetCurrentSurface',
+    'eglGetCurrentDisplay',
+    'eglQueryContext',
+    'eglWaitGL',
+    'eglWaitNative',
+    'eglSwapBuffers',
+    'eglCopyBuffers',
+    'eglLockSurfaceKHR',
+    'eglUnlockSurfaceKHR',
+    'eglCreateImageKHR',
+    'eglDestroyImageKHR',
+    'eglCreateSyncKHR',
+    'eglDestroySyncKHR',
+    'eglClientWaitSyncKHR',
+    'eglSignalSyncKHR',
+    'eglGetSyncAttribKHR',
+    'eglCreatePixmapSurfaceHI',
+    'eglCreateDRMImageMESA',
+    'eglExportDRMImageMESA',
+    'eglPostSubBufferNV',
+    'eglQuerySurfacePointerANGLE',
+    'eglGetSystemTimeFrequencyNV',
+    'eglGetSystemTimeNV',
+)
+
+__all__ = ['opengles','openegl','opengles_functions','openegl_functions','eglGetProcAddress']
+__all__ += opengles_functions
+__all__ += openegl_functions
@@ -1,63 +1,161 @@
-import itertools
 from pyopengles import *
+from gl2 import (GL_ARRAY_BUFFER, GL_BACK, GL_COLOR_BUFFER_BIT, GL_CULL_FACE, GL_CW,
+                 GL_DEPTH_BUFFER_BIT, GL_DEPTH_TEST, GL_ELEMENT_ARRAY_BUFFER,
+                 GL_FRAMEBUFFER, GL_STATIC_DRAW, GL_TRIANGLES, GL_TRIANGLE_STRIP)
 from math import *
+import numpy
+import glinfo
+import layout
+import lod
+import mesh
+import meshopt
+import transform
+import upload
+from frames import FrameScheduler
+import vao
 
 def eglshorts(L):
     """Converts a tuple to an array of eglshorts (would a pointer return be better?)"""
     return (eglshort*len(L))(*L)
 
+default_layout=layout.VertexLayout(('vertex',3,'float'),('normal',3,'byte'))
+
 class Buffer(object):
-    """Hold a pair of Buffer Objects to draw a part of a model"""
-    def __init__(self,pts,faces):
+    """Hold a pair of Buffer Objects to draw a part of a model.
+
+    Indices are stored as unsigned bytes, shorts or (with GL_OES_element_index_uint)
+    ints, whichever is the narrowest that can address every vertex.  Without 32 bit
+    indices a large mesh is drawn in runs of faces that each use at most 65536 vertices,
+    with the vertices of each run stored one after the other in the vertex buffer.
+
+    With optimize=True identical vertices are welded and the faces and vertices are
+    reordered for the vertex cache before upload; self.acmr holds the ACMR before and
+    after.
+
+    The vertices are stored as given by layout, by default float positions and
+    normalised byte normals (16 bytes a vertex instead of 24).  If the layout quantises
+    the positions, draw folds self.dequantize into the shader's view matrix.
+
+    The attribute setup is kept in a vertex array per shader, so drawing a run of faces
+    needs a single bind.
+
+    Given an arena.MeshArena, the data goes into ranges of its shared buffers instead of
+    buffers of its own, so drawing different meshes does not rebind buffers.
+
+    With strips=True each run of faces is drawn as one triangle strip, its pieces joined
+    by degenerate triangles, which takes about a third of the indices.
+
+    self.bounds is the (lo,hi) box and self.sphere the (centre,radius) sphere around the
+    model, for culling (see cull.Scene)."""
+    def __init__(self,pts,faces,optimize=False,layout=None,arena=None,strips=False):
         """Generate a vertex buffer to hold data and indices"""
-        pts=[tuple(p) for p in pts]
-        normals=[[] for p in pts]
-        for f in faces:
-            a,b,c=f[0:3]
-            n=tuple(vec_normal(vec_cross(vec_sub(pts[b],pts[a]),vec_sub(pts[c],pts[a]))))
-            for x in f[0:3]:
-                normals[x].append(n) 
-        for i,N in enumerate(normals):
-            if len(N)==0:
-                normals[i]=(0,0,.01)
-                continue
-            s=1.0/len(N)
-            normals[i]=tuple( vec_normal( [sum(v[k] for v in N) for k in range(3)] ) )
-        P=[ p+n for p,n in zip(pts,normals)]
-        X=eglfloats([x for x in itertools.chain(*P)])
-
-        P=[f[0:3] for f in faces]
-        E=eglshorts([x for x in itertools.chain(*P)])
-        
-        self.vbuf=eglint()
-        opengles.glGenBuffers(1,ctypes.byref(self.vbuf))
-        self.ebuf=eglint()
-        opengles.glGenBuffers(1,ctypes.byref(self.ebuf))
-        self.select()
-        opengles.glBufferData(GL_ARRAY_BUFFER, ctypes.sizeof(X), ctypes.byref(X), GL_STATIC_DRAW);
-        opengles.glBufferData(GL_ELEMENT_ARRAY_BUFFER, ctypes.sizeof(E), ctypes.byref(E), GL_STATIC_DRAW);
-        self.ntris = len(faces)
+        self.acmr=None
+        if optimize:
+            pts,faces=meshopt.weld(pts,faces)
+        m=mesh.Mesh(pts,faces)
+        self.bounds=mesh.bounds(m.positions)
+        self.sphere=mesh.bounding_sphere(m.positions)
+        if optimize:
+            self.acmr=m.optimize()
+        self.layout=layout or default_layout
+        X,self.dequantize=m.pack(self.layout)
+        if not any(a.format=='qshort' for a in self.layout.attributes):
+            self.dequantize=None
+        dtype=mesh.index_dtype(len(X),glinfo.has_extension('GL_OES_element_index_uint'))
+        if dtype is None:
+            chunks=mesh.split(m.faces)
+            X=numpy.concatenate([X[vertices] for vertices,f in chunks])
+            dtype=numpy.uint16
+        else:
+            chunks=[(X,m.faces)]
+        self.mode=GL_TRIANGLE_STRIP if strips else GL_TRIANGLES
+        if strips:
+            chunks=[(vertices,meshopt.strip_indices(f)) for vertices,f in chunks]
+        # (byte offset of the first vertex, byte offset of the first index, index count)
+        self.chunks=[]
+        vertex=index=0
+        for vertices,f in chunks:
+            self.chunks.append((vertex*self.layout.stride,index*dtype().itemsize,f.size))
+            vertex+=len(vertices)
+            index+=f.size
+        E=numpy.concatenate([f.ravel() for vertices,f in chunks]).astype(dtype)
+        self.nindices=len(E)
+
+        self.arena=arena
+        if arena is not None:
+            self.vrange=arena.vertices.alloc(X)
+            self.erange=arena.indices.alloc(E)
+            self.vbuf=arena.vertices.buf
+            self.ebuf=arena.indices.buf
+            self.index_type=upload.data_pointer(E)[2]
+        else:
+            vbuf=eglint()
+            glGenBuffers(1,ctypes.byref(vbuf))
+            self.vbuf=vbuf.value
+            ebuf=eglint()
+            glGenBuffers(1,ctypes.byref(ebuf))
+            self.ebuf=ebuf.value
+            self.select()
+            buffer_data(GL_ARRAY_BUFFER, X, GL_STATIC_DRAW)
+            self.index_type=buffer_data(GL_ELEMENT_ARRAY_BUFFER, E, GL_STATIC_DRAW)
+        self.ntris = len(m.faces)
+        self.arrays = {} # program -> (arena generation,[VertexArray for each chunk])
        
     def select(self):
         """Makes our buffers active"""
-        opengles.glBindBuffer(GL_ARRAY_BUFFER, self.vbuf);
-        opengles.glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ebuf);
+        gl_state.bind_buffer(GL_ARRAY_BUFFER, self.vbuf)
+        gl_state.bind_buffer(GL_ELEMENT_ARRAY_BUFFER, self.ebuf)
+
+    def bases(self):
+        """Returns the byte offsets of our vertices and indices in their buffers"""
+        if self.arena is None:
+            return 0,0
+        return self.vrange.offset,self.erange.offset
+
+    def generation(self):
+        if self.arena is None:
+            return 0
+        return (self.arena.vertices.generation,self.arena.indices.generation)
+
+    def vertex_arrays(self,program):
+        """Returns a vertex array for each run of faces, set up for program's attributes"""
+        generation,arrays=self.arrays.get(program.program,(None,None))
+        if generation!=self.generation():
+            # Compacting the arena moved our vertices
+            for a in arrays or []:
+                a.delete()
+            base=self.bases()[0]
+            arrays=[vao.VertexArray(self.layout,program.attributes,self.vbuf,self.ebuf,base+vertex)
+                    for vertex,index,count in self.chunks]
+            self.arrays[program.program]=(self.generation(),arrays)
+        return arrays
+
+    def delete(self):
+        """Frees our ranges of the arena, or deletes our own buffers"""
+        for generation,arrays in self.arrays.values():
+            for a in arrays:
+                a.delete()
+        self.arrays={}
+        if self.arena is not None:
+            self.vrange.free()
+            self.erange.free()
+        else:
+            gl_state.delete_buffers((self.vbuf,self.ebuf))
         
     def draw(self,s):
-        self.select()
-        opengles.glVertexAttribPointer(s.attr_normal, 3, GL_FLOAT, 0, 24, 12);
-        opengles.glVertexAttribPointer(s.attr_vertex, 3, GL_FLOAT, 0, 24, 0);
-        opengles.glEnableVertexAttribArray(s.attr_normal);
-        opengles.glEnableVertexAttribArray(s.attr_vertex);
-        opengles.glDrawElements ( GL_TRIANGLES, self.ntris*3, GL_UNSIGNED_SHORT, 0 );
+        s.select_dequantize(self.dequantize)
+        arrays=self.vertex_arrays(s.program)
+        base=self.bases()[1]
+        for a,(vertex,index,count) in zip(arrays,self.chunks):
+            a.bind()
+            glDrawElements ( self.mode, count, self.index_type, base+index );
 
             
 class Shader(object):
     def __init__(self):
         """Prepares a shader for 3d point + normal"""
 
-        self.vshader_source = ctypes.c_char_p(
-              """
+        self.vshader_source = """
               attribute vec3 vertex;
               attribute vec3 normal;
               uniform mat4 view;
@@ -66,62 +164,39 @@ class Shader(object):
                 //light = 0.5+max(0.0,0.5*dot(normal,vec3(0.7,0,0.7)));
                 n=normal;
                 gl_Position = view * vec4(vertex,1.0);
-              }""")
+              }"""
       
-        self.fshader_source = ctypes.c_char_p(
-              """
+        self.fshader_source = """
               varying vec3 n;
               void main(void) {
                  gl_FragColor = vec4(n.x+0.5,n.y+0.5,n.z+0.5,1.0);
-              }""")
-
-        vshader = opengles.glCreateShader(GL_VERTEX_SHADER);
-        opengles.glShaderSource(vshader, 1, ctypes.byref(self.vshader_source), 0)
-        opengles.glCompileShader(vshader);
-        self.showlog(vshader)
-
-        fshader = opengles.glCreateShader(GL_FRAGMENT_SHADER);
-        opengles.glShaderSource(fshader, 1, ctypes.byref(self.fshader_source), 0);
-        opengles.glCompileShader(fshader);
-        self.showlog(fshader);
-
-        program = opengles.glCreateProgram();
-        opengles.glAttachShader(program, vshader);
-        opengles.glAttachShader(program, fshader);
-        opengles.glLinkProgram(program);
-        self.showprogramlog(program);
-
-        self.program = program
-        self.attr_vertex = opengles.glGetAttribLocation(program, "vertex");
-        self.attr_normal = opengles.glGetAttribLocation(program, "normal");
-        self.unif_view = opengles.glGetUniformLocation(program, "view");
+              }"""
+
+        self.program = program_cache.get(self.vshader_source, self.fshader_source)
+        self.attr_vertex = self.program.attributes["vertex"]
+        self.attr_normal = self.program.attributes["normal"]
+        self.V = transform.identity()
+        self.D = None
         self.select()
 
     def select(self):
         """Makes this shader active"""
-        opengles.glUseProgram ( self.program );
+        self.program.use()
 
     def select_view(self,M,M_reflect=None):
         """Call this to program the view matrix.
+        The matrix is only sent to the GPU if it differs from the one already set.
         """
-        E=eglfloats(list(itertools.chain(*M)))
-        opengles.glUniformMatrix4fv(self.unif_view,16,eglint(0),ctypes.byref(E));
-        
-    def showlog(self,shader):
-        """Prints the compile log for a shader"""
-        N=1024
-        log=(ctypes.c_char*N)()
-        loglen=ctypes.c_int()
-        opengles.glGetShaderInfoLog(shader,N,ctypes.byref(loglen),ctypes.byref(log))
-        print log.value
-
-    def showprogramlog(self,shader):
-        """Prints the compile log for a program"""
-        N=1024
-        log=(ctypes.c_char*N)()
-        loglen=ctypes.c_int()
-        opengles.glGetProgramInfoLog(shader,N,ctypes.byref(loglen),ctypes.byref(log))
-        print log.value
+        self.V = M
+        self.D = None
+        self.program["view"] = M
+
+    def select_dequantize(self,D):
+        """Applies D, a Buffer's dequantisation matrix (None if it has none), before the
+        current view matrix"""
+        if D is not self.D:
+            self.D = D
+            self.program["view"] = self.V if D is None else transform.multiply(D,self.V)
 
 class View(object):
     """The view holds the perspective transformations for the current view.
@@ -131,26 +206,22 @@ class View(object):
     
     def lookAt(self,at,eye):
         """Set up view matrix to look from eye to at including perspective"""
-        self.L=LookAtMatrix(at,eye)
-        self.P=ProjectionMatrix()
-        self.M=mat_mult(self.L,self.P) # Apply transform/rotation first, then shift into perspective space
-        self.L_reflect=LookAtMatrix(at,eye,reflect=True)
-        self.M_reflect=mat_mult(self.L_reflect,self.P)
+        self.L=transform.look_at(at,eye)
+        self.P=transform.projection()
+        self.M=transform.multiply(self.L,self.P) # Apply transform/rotation first, then shift into perspective space
+        self.L_reflect=transform.look_at(at,eye,reflect=True)
+        self.M_reflect=transform.multiply(self.L_reflect,self.P)
 
     def begin_matrix(self):
-        self.V = [row[:] for row in self.M]
+        self.V = self.M.copy()
 
     def translate(self,pt):
         """Move an object to the given location"""
-        V=self.V
-        V[3]=[sum(pt[j]*V[j][i] for j in xrange(3))+V[3][i] for i in xrange(4)]
+        self.V=transform.multiply(transform.translation(pt),self.V)
 
     def rotate(self,angle):
         """Rotate an object by an angle in degrees"""
-        c=math.cos(angle*3.1415/180.0)
-        s=math.sin(angle*3.1415/180.0)
-        M=[[c,s,0,0],[-s,c,0,0],[0,0,1,0],[0,0,0,1]]
-        self.V=mat_mult(M,self.V)
+        self.V=transform.multiply(transform.rotation_z(angle),self.V)
         
 class Cone:
     
@@ -171,85 +242,23 @@ class Cone:
     def draw(self,s):
         self.buf.draw(s)
 
-def TranslateMatrix(pt):
-    M=[[0]*4 for i in range(4)]
-    for i in range(4):
-        M[i][i]=1.0
-    for i in range(3):
-        M[3][i]=pt[i]
-    return M
-
-def ProjectionMatrix(near=10,far=1000.0,fov_h=1.7,fov_v=1.4):
-    """Setup projection matrix with given distance to near and far planes
-    and fields of view in radians"""
-    # Matrices are considered to be M[row][col]
-    # Use DirectX convention, so need to do rowvec*Matrix to transform
-    w=1./tan(fov_h*0.5)
-    h=1./tan(fov_v*0.5)
-    Q=far/(far-near)
-    M=[[0]*4 for i in range(4)]
-    M[0][0]=w
-    M[1][1]=h
-    M[2][2]=Q
-    M[3][2]=-Q*near
-    M[2][3]=1
-    return M
-
-def vec_sub(A,B):
-    return [a-b for a,b in zip(A,B)]
-
-def vec_dot(A,B):
-    return sum(a*b for a,b in zip(A,B))
-
-def vec_cross(a,b):
-    return [a[1]*b[2]-a[2]*b[1],a[2]*b[0]-a[0]*b[2],a[0]*b[1]-a[1]*b[0]]
-    
-def vec_normal(A):
-    n=math.sqrt(sum(a**2 for a in A))+0.0001
-    return [a/n for a in A]
-
-def LookAtMatrix(at,eye,up=[0,0,1],reflect=False):
-    """Define a matrix of an eye looking at"""
-    # If reflect, then reflect in plane -20.0 (water depth)
-    if reflect:
-        depth=-20.0 # Shallower to avoid edge effects
-        eye[2]=2*depth-eye[2]
-        at[2]=2*depth-at[2] 
-    zaxis = vec_normal(vec_sub(at,eye))
-    xaxis = vec_normal(vec_cross(up,zaxis))
-    yaxis = vec_cross(zaxis,xaxis)
-    xaxis.append(-vec_dot(xaxis,eye))
-    yaxis.append(-vec_dot(yaxis,eye))
-    zaxis.append(-vec_dot(zaxis,eye))
-    z=[0,0,0,1.0]
-    return [ [xaxis[a],yaxis[a],zaxis[a],z[a]] for a in range(4)]
-
-def BillboardMatrix():
-    """Define a matrix that copies x,y and sets z to 0.9"""
-    return [ [1.0,0.0,0.0,0.0],[0.0,1.0,0.0,0.0],[0.0,0.0,0.0,0.0],[0.0,0.0,0.9,1.0]]
-
-def mat_mult(A,B):
-    return [ [ sum(A[i][j]*B[j][k] for j in range(4)) for k in range(4)] for i in range(4)]
-
-def mat_transpose(A):
-    return [ [ A[k][i] for k in range(4)] for i in range(4)]
-
-def vec_mat_mult(A,B):
-    return [ sum(A[j]*B[j][k] for j in range(4)) for k in range(4)]
+def cone_lod(sz=20.0,sides=(40,20,10,5),sizes=(0.2,0.1,0.05)):
+    """Returns a lod.LOD of cones with fewer sides for smaller projected sizes"""
+    return lod.LOD([Cone(sz,n).buf for n in sides],sizes)
 
 
 egl = EGL()
 cone = Cone(50);
 s = Shader()
 v = View()
-opengles.glViewport ( 0, 0, egl.width, egl.height );
-opengles.glDepthRangef(eglfloat(-1.0),eglfloat(1.0))
-opengles.glClearColor ( eglfloat(0.3), eglfloat(0.3), eglfloat(0.7), eglfloat(1.0) );
-opengles.glBindFramebuffer(GL_FRAMEBUFFER,0)
-opengles.glFrontFace(GL_CW)
-opengles.glCullFace(GL_BACK)
-opengles.glEnable(GL_CULL_FACE)
-opengles.glEnable(GL_DEPTH_TEST)
+gl_state.viewport(0, 0, egl.width.value, egl.height.value)
+glDepthRangef(-1.0,1.0)
+glClearColor ( 0.3, 0.3, 0.7, 1.0 );
+gl_state.bind_framebuffer(GL_FRAMEBUFFER,0)
+gl_state.front_face(GL_CW)
+gl_state.cull_face(GL_BACK)
+gl_state.enable(GL_CULL_FACE)
+gl_state.enable(GL_DEPTH_TEST)
 
 print 'Setup viewport'
 v.lookAt([0,0,0],[0,-100,50])
@@ -258,25 +267,24 @@ from pymouse import start_mouse
 
 m=start_mouse()
 
-frame=0
-def draw(s):
-    global frame
-    frame+=1
+angle=0.0
+def update(dt):
+    """Turns the cone at 120 degrees a second"""
+    global angle
+    angle+=120.0*dt
 
-    opengles.glBindFramebuffer(GL_FRAMEBUFFER,0)
-    opengles.glClear(GL_COLOR_BUFFER_BIT|GL_DEPTH_BUFFER_BIT);
+def draw(alpha):
+    gl_state.bind_framebuffer(GL_FRAMEBUFFER,0)
+    glClear(GL_COLOR_BUFFER_BIT|GL_DEPTH_BUFFER_BIT);
     s.select()
-    s.select_view(v.M)
     v.begin_matrix()
-    v.rotate(frame*2)
+    v.rotate(angle+120.0*alpha*frames.dt)
     s.select_view(v.V)
     cone.draw(s)
-    opengles.glFinish()  
-    openegl.eglSwapBuffers(egl.display, egl.surface)
 
-while 1:
-    if m.finished:
-         break
-    draw(s)
+frames=FrameScheduler(egl)
+frames.run(update,draw,lambda:m.finished)
+frames.close()
+print frames.stats()
     
 m.stop()
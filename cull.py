@@ -0,0 +1,242 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Frustum culling for scenes of many objects.
+#
+# scene = Scene()
+# i = scene.add(cone,model)          anything with a draw(s) method and a Buffer's bounds
+# scene.move(i,model)                the hierarchy is refitted, not rebuilt, before culling
+# scene.draw(s,VP)                   draws the objects inside the frustum of VP
+# scene.last_frame                   {'objects','visible','culled','nodes_tested','time'}
+#
+# The objects' world space boxes are kept in a bounding volume hierarchy: a binary tree of
+# boxes split at the median of the longest axis, stored as flat arrays.  Culling walks the
+# tree a level at a time, testing the whole level against the six planes of the frustum at
+# once.  Nodes outside are dropped with everything below them, nodes wholly inside accept
+# everything below them without further tests, and only objects in leaves that straddle a
+# plane are tested one by one.
+#
+# Adding or removing objects rebuilds the tree at the next cull; moving them only refits
+# the boxes of the nodes above them.  Call rebuild() after large movements, as a refitted
+# tree keeps its old grouping of objects and its boxes grow looser.
+#
+# NumPy is required.
+
+import time
+import numpy
+import transform
+
+def frustum_planes(M):
+    """Returns the six (a,b,c,d) planes bounding what the view matrix M draws, normalised
+    so a*x+b*y+c*z+d is the distance of a point inside the frustum (negative outside).
+
+    M maps row vectors to clip space, where OpenGL draws -w<=x,y,z<=w."""
+    M = numpy.asarray(M,dtype=numpy.float64)
+    c = M.T # c[j] is the row of clip space coordinate j
+    planes = numpy.array([c[3]+c[0],c[3]-c[0],c[3]+c[1],c[3]-c[1],c[3]+c[2],c[3]-c[2]])
+    return planes/numpy.sqrt((planes[:,:3]**2).sum(axis=1))[:,None]
+
+def spheres_visible(planes,centres,radii):
+    """Returns a boolean array saying which of the spheres touch the frustum"""
+    d = numpy.dot(centres,planes[:,:3].T)+planes[:,3]
+    return (d>-numpy.asarray(radii)[:,None]).all(axis=1)
+
+def _box_distances(planes,lo,hi):
+    """Returns the (n,6) signed distances to each plane of the box corners furthest along and
+    furthest against its normal"""
+    centre = (lo+hi)*0.5
+    extent = (hi-lo)*0.5
+    d = numpy.dot(centre,planes[:,:3].T)+planes[:,3]
+    r = numpy.dot(extent,numpy.abs(planes[:,:3]).T)
+    return d+r,d-r
+
+def boxes_visible(planes,lo,hi):
+    """Returns a boolean array saying which of the (n,3) lo,hi boxes touch the frustum"""
+    far,near = _box_distances(planes,lo,hi)
+    return (far>=0).all(axis=1)
+
+def world_bounds(lo,hi,models):
+    """Returns the boxes around (n,3) lo,hi boxes moved by (n,4,4) model matrices"""
+    centre = (lo+hi)*0.5
+    extent = (hi-lo)*0.5
+    R = models[:,:3,:3]
+    c = numpy.einsum('ni,nij->nj',centre,R)+models[:,3,:3]
+    e = numpy.einsum('ni,nij->nj',extent,numpy.abs(R))
+    return c-e,c+e
+
+def _ranges(start,count):
+    """Returns the concatenation of arange(s,s+n) for each start s and count n"""
+    total = count.sum()
+    if not total:
+        return numpy.zeros(0,dtype=numpy.intp)
+    offsets = numpy.repeat(start-(numpy.cumsum(count)-count),count)
+    return offsets+numpy.arange(total)
+
+class BVH(object):
+    """A bounding volume hierarchy over n boxes"""
+
+    def __init__(self,lo,hi,leaf_size=4):
+        n = len(lo)
+        self.leaf_size = leaf_size
+        centres = (lo+hi)*0.5
+        self.order = numpy.arange(n)   # Items in tree order; every node holds a run of it
+        starts = [0]
+        counts = [n]
+        children = [-1]                # First child (the second follows it), -1 for a leaf
+        depths = [0]
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            start,count = starts[node],counts[node]
+            if count<=leaf_size:
+                continue
+            items = self.order[start:start+count]
+            c = centres[items]
+            axis = numpy.argmax(c.max(axis=0)-c.min(axis=0))
+            half = count//2
+            split = numpy.argpartition(c[:,axis],half)
+            self.order[start:start+count] = items[split]
+            children[node] = len(starts)
+            for s,k in ((start,half),(start+half,count-half)):
+                stack.append(len(starts))
+                starts.append(s)
+                counts.append(k)
+                children.append(-1)
+                depths.append(depths[node]+1)
+        self.start = numpy.array(starts,dtype=numpy.intp)
+        self.count = numpy.array(counts,dtype=numpy.intp)
+        self.child = numpy.array(children,dtype=numpy.intp)
+        depths = numpy.array(depths)
+        self.levels = [numpy.nonzero(depths==d)[0] for d in xrange(depths.max()+1)]
+        self.leaves = numpy.nonzero(self.child<0)[0]
+        self.leaves = self.leaves[numpy.argsort(self.start[self.leaves])]
+        self.lo = numpy.zeros((len(starts),3))
+        self.hi = numpy.zeros((len(starts),3))
+        self.refit(lo,hi)
+
+    def refit(self,lo,hi):
+        """Recomputes every node's box for the items' new boxes, keeping the tree's shape"""
+        if not len(self.order):
+            return
+        starts = self.start[self.leaves]
+        self.lo[self.leaves] = numpy.minimum.reduceat(lo[self.order],starts)
+        self.hi[self.leaves] = numpy.maximum.reduceat(hi[self.order],starts)
+        for level in reversed(self.levels):
+            nodes = level[self.child[level]>=0]
+            first = self.child[nodes]
+            self.lo[nodes] = numpy.minimum(self.lo[first],self.lo[first+1])
+            self.hi[nodes] = numpy.maximum(self.hi[first],self.hi[first+1])
+
+    def query(self,planes,lo,hi):
+        """Returns (indices of the items whose boxes touch the frustum, nodes tested)"""
+        if not len(self.order):
+            return numpy.zeros(0,dtype=numpy.intp),0
+        found = []
+        nodes = numpy.zeros(1,dtype=numpy.intp)
+        tested = 0
+        while len(nodes):
+            tested += len(nodes)
+            far,near = _box_distances(planes,self.lo[nodes],self.hi[nodes])
+            touching = (far>=0).all(axis=1)
+            inside = touching&(near>=0).all(axis=1)
+            found.append(self.order[_ranges(self.start[nodes[inside]],self.count[nodes[inside]])])
+            partial = nodes[touching&~inside]
+            leaf = self.child[partial]<0
+            partial_leaves = partial[leaf]
+            items = self.order[_ranges(self.start[partial_leaves],self.count[partial_leaves])]
+            found.append(items[boxes_visible(planes,lo[items],hi[items])])
+            first = self.child[partial[~leaf]]
+            nodes = numpy.concatenate((first,first+1))
+        return numpy.concatenate(found),tested
+
+class Scene(object):
+    """Objects with model matrices, drawn when they are inside the view's frustum"""
+
+    def __init__(self,capacity=256):
+        self.objects = []
+        self.local_lo = numpy.zeros((capacity,3))
+        self.local_hi = numpy.zeros((capacity,3))
+        self.models = transform.identity(capacity)
+        self.lo = None               # World space boxes of the live objects at the last cull
+        self.hi = None
+        self.bvh = None
+        self.moved = set()
+        self.removed = set()
+        self.rebuilt = 0
+        self.refitted = 0
+        self.last_frame = {'objects':0,'visible':0,'culled':0,'nodes_tested':0,'time':0.0}
+
+    def add(self,obj,model=None,bounds=None):
+        """Adds an object, returning its index.  bounds defaults to the (lo,hi) box of
+        obj.bounds or obj.buf.bounds."""
+        if bounds is None:
+            bounds = getattr(obj,'bounds',None) or obj.buf.bounds
+        i = len(self.objects)
+        if i==len(self.models):
+            n = 2*i
+            self.local_lo = numpy.resize(self.local_lo,(n,3))
+            self.local_hi = numpy.resize(self.local_hi,(n,3))
+            self.models = numpy.concatenate((self.models,transform.identity(n-i)))
+        self.objects.append(obj)
+        self.local_lo[i],self.local_hi[i] = bounds
+        self.models[i] = transform.identity() if model is None else model
+        self.bvh = None
+        return i
+
+    def remove(self,i):
+        """Removes an object; the indices of the others stay the same"""
+        self.objects[i] = None
+        self.removed.add(i)
+        self.bvh = None
+
+    def move(self,i,model):
+        """Sets an object's model matrix, or those of an array of objects"""
+        self.models[i] = model
+        if numpy.ndim(i):
+            self.moved.update(i)
+        else:
+            self.moved.add(i)
+
+    def rebuild(self):
+        """Builds the hierarchy afresh at the next cull"""
+        self.bvh = None
+
+    def _update(self):
+        n = len(self.objects)
+        if self.bvh is None:
+            self.lo,self.hi = world_bounds(self.local_lo[:n],self.local_hi[:n],self.models[:n])
+            self.live = numpy.array(sorted(set(xrange(n))-self.removed),dtype=numpy.intp)
+            if len(self.live)<n:
+                self.lo,self.hi = self.lo[self.live],self.hi[self.live]
+            self.bvh = BVH(self.lo,self.hi)
+            self.rebuilt += 1
+        elif self.moved:
+            moved = numpy.array(sorted(self.moved-self.removed),dtype=numpy.intp)
+            lo,hi = world_bounds(self.local_lo[moved],self.local_hi[moved],self.models[moved])
+            rows = numpy.searchsorted(self.live,moved)
+            self.lo[rows],self.hi[rows] = lo,hi
+            self.bvh.refit(self.lo,self.hi)
+            self.refitted += 1
+        self.moved = set()
+
+    def visible(self,VP):
+        """Returns the indices of the objects inside the frustum of the view matrix VP"""
+        t = time.time()
+        self._update()
+        planes = frustum_planes(VP)
+        found,tested = self.bvh.query(planes,self.lo,self.hi)
+        found = numpy.sort(self.live[found])
+        n = len(self.live)
+        self.last_frame = {'objects':n,'visible':len(found),'culled':n-len(found),
+                           'nodes_tested':tested,'time':time.time()-t}
+        return found
+
+    def draw(self,s,VP,found=None):
+        """Draws the visible objects with a cone.Shader-like s, each with its model*VP.
+        found gives the indices from visible(VP) if already known."""
+        if found is None:
+            found = self.visible(VP)
+        MVP = transform.multiply(self.models[found],VP)
+        for i,M in zip(found,MVP):
+            s.select_view(M)
+            self.objects[i].draw(s)
+        return found
@@ -0,0 +1,4 @@
+# This file is generated by prepare_constants.py.  Do not edit.
+# The constants are loaded from constant_tables.py on first use.
+import glconstants
+glconstants.install(__name__,'eglext')
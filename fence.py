@@ -0,0 +1,57 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# GPU fences from EGL_KHR_fence_sync: a marker in the command stream that is signaled once
+# the GPU has finished every command issued before it.
+#
+# f = Fence()          after the draws that read some data
+# f.signaled()         True once the GPU is past the fence, without waiting
+# f.wait()             blocks until then
+#
+# Check supported() first; without the extension there is no way to tell how far the GPU
+# has got short of glFinish.
+
+from bindings import (eglClientWaitSyncKHR, eglCreateSyncKHR, eglDestroySyncKHR,
+                      eglGetCurrentDisplay, eglGetError)
+from egl import EGL_FALSE
+from eglext import (EGL_FOREVER_KHR, EGL_SYNC_FENCE_KHR, EGL_SYNC_FLUSH_COMMANDS_BIT_KHR,
+                    EGL_TIMEOUT_EXPIRED_KHR)
+import glinfo
+
+def supported():
+    return glinfo.has_egl_extension('EGL_KHR_fence_sync',eglCreateSyncKHR,eglDestroySyncKHR,
+                                    eglClientWaitSyncKHR)
+
+class Fence(object):
+    """A fence after the commands issued so far on the current context"""
+
+    def __init__(self):
+        self.display = eglGetCurrentDisplay()
+        self.sync = eglCreateSyncKHR(self.display,EGL_SYNC_FENCE_KHR,None)
+        if not self.sync:
+            raise ValueError('eglCreateSyncKHR failed')
+        self.done = False
+
+    def signaled(self):
+        """Returns True if the GPU has passed the fence"""
+        if not self.done:
+            self.done = self._client_wait(0)
+        return self.done
+
+    def wait(self,timeout=EGL_FOREVER_KHR):
+        """Waits up to timeout nanoseconds for the GPU to pass the fence, returning True if
+        it has"""
+        if not self.done:
+            self.done = self._client_wait(timeout)
+        return self.done
+
+    def _client_wait(self,timeout):
+        # Flushing makes sure the fence is submitted, so it will signal eventually
+        r = eglClientWaitSyncKHR(self.display,self.sync,EGL_SYNC_FLUSH_COMMANDS_BIT_KHR,timeout)
+        if r==EGL_FALSE:
+            raise ValueError('eglClientWaitSyncKHR failed with error %s' % hex(eglGetError()))
+        return r!=EGL_TIMEOUT_EXPIRED_KHR
+
+    def delete(self):
+        if self.sync:
+            eglDestroySyncKHR(self.display,self.sync)
+            self.sync = None
@@ -0,0 +1,174 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# A frame scheduler for render loops: paced by vsync, with a fixed-timestep simulation.
+#
+# frames = FrameScheduler(egl)                   swaps every vsync (60Hz by default)
+# frames.run(update,render,finished)
+#
+# update(dt) advances the simulation by exactly dt seconds (1/60 by default), as many
+# times as the time since the last frame calls for, so the simulation runs at the same
+# speed whatever the frame rate.  render(alpha) draws a frame without swapping; alpha is
+# how far (0..1) the time has got into the next update, for interpolating.  The scheduler
+# swaps the buffers itself and stops when finished() returns True.
+#
+# eglSwapInterval(interval) makes each swap wait for the interval'th vsync.  Rather than
+# spin or block in the swap, the scheduler sleeps until just before the frame is due,
+# leaving the longest time the last few frames took to update and render plus a margin,
+# so the frame drawn shows input as late as possible.  With interval=0 it instead sleeps
+# between rendering and swapping, capping the rate at fps (or not at all for fps=None).
+# Sleeps end with a short spin, as time.sleep can oversleep by a millisecond or more.
+#
+# The CPU does not wait for the GPU to finish each frame: with in_flight=2 it builds
+# frame N+1 while the GPU still renders frame N (and perhaps N-1).  A fence placed after
+# each swap (EGL_KHR_fence_sync) bounds this: before starting a frame the scheduler waits
+# until no more than in_flight frames are unfinished, so the CPU cannot run ahead and add
+# latency.  Without the extension the driver's own queue limit applies.  in_flight=0
+# calls glFinish before each swap instead, as the demos used to.  Buffers the CPU rewrites
+# every frame need more copies than frames in flight, e.g. stream.StreamBuffer(count=3).
+# frames.close() waits for the frames still in flight and deletes their fences.
+#
+# frames.stats() gives the percentiles of the swap to swap times, the number of frames
+# that missed their vsync and the time spent waiting for the GPU.
+
+import collections
+import time
+from bindings import eglSwapInterval, glFinish
+import fence
+
+def precise_sleep(until,spin=0.002):
+    """Sleeps until time.time() reaches until, spinning for the last spin seconds"""
+    remaining = until-time.time()
+    if remaining>spin:
+        time.sleep(remaining-spin)
+    while time.time()<until:
+        pass
+
+def percentile(values,p):
+    """Returns the p'th percentile of a list of values, by the nearest rank"""
+    if not values:
+        return 0.0
+    s = sorted(values)
+    return s[min(len(s)-1,int(len(s)*p/100.0))]
+
+class FrameScheduler(object):
+    """Runs update and render callbacks in time with the display"""
+
+    def __init__(self,egl,interval=1,refresh=60.0,fps=60.0,dt=1.0/60,max_updates=5,
+                 margin=0.002,history=600,in_flight=2):
+        self.egl = egl
+        self.interval = interval
+        eglSwapInterval(egl.display,interval)
+        if interval:
+            self.period = interval/refresh
+        else:
+            self.period = 1.0/fps if fps else None
+        self.dt = dt
+        self.max_updates = max_updates # Beyond this many updates a frame, time is dropped
+        self.margin = margin
+        self.frame_times = collections.deque(maxlen=history) # Swap to swap, in seconds
+        self.work_times = collections.deque(maxlen=8)        # Updates and render, in seconds
+        self.frames = 0
+        self.missed = 0       # Frames later than their vsync
+        self.updates = 0
+        self.dropped = 0.0    # Simulation seconds skipped because updates fell behind
+        self.slept = 0.0      # Seconds spent sleeping
+        self.last_swap = None
+        self.accumulator = 0.0
+        self.last_time = None
+        self.in_flight = in_flight
+        self.fences_used = in_flight>0 and fence.supported()
+        self.pending = collections.deque() # Fences after the swaps the GPU may not have done
+        self.gpu_waits = 0    # Frames that had to wait for the GPU
+        self.gpu_wait = 0.0   # Seconds spent waiting for the GPU
+
+    def wait(self):
+        """Sleeps until it is time to start the next frame"""
+        if self.last_swap is None or not self.interval:
+            return
+        work = max(self.work_times) if self.work_times else 0.0
+        deadline = self.last_swap+self.period-work-self.margin
+        t = time.time()
+        if deadline>t:
+            precise_sleep(deadline)
+            self.slept += time.time()-t
+
+    def throttle(self):
+        """Waits until at most in_flight frames are left for the GPU to finish"""
+        pending = self.pending
+        while pending and pending[0].signaled():
+            pending.popleft().delete()
+        if len(pending)>self.in_flight:
+            t = time.time()
+            while len(pending)>self.in_flight:
+                f = pending.popleft()
+                f.wait()
+                f.delete()
+            self.gpu_waits += 1
+            self.gpu_wait += time.time()-t
+
+    def step(self,update,render):
+        """Runs one frame: the updates due, the render and the swap"""
+        self.wait()
+        if self.fences_used:
+            self.throttle()
+        start = time.time()
+        if self.last_time is None:
+            self.last_time = start
+        self.accumulator += start-self.last_time
+        self.last_time = start
+        n = 0
+        while self.accumulator>=self.dt:
+            if n==self.max_updates:
+                self.dropped += self.accumulator
+                self.accumulator = 0.0
+                break
+            if update is not None:
+                update(self.dt)
+            self.accumulator -= self.dt
+            n += 1
+        self.updates += n
+        render(self.accumulator/self.dt)
+        # The swap is left out, as with vsync it waits for the display
+        self.work_times.append(time.time()-start)
+        if self.period and not self.interval and self.last_swap is not None:
+            t = time.time()
+            precise_sleep(self.last_swap+self.period)
+            self.slept += time.time()-t
+        if not self.in_flight:
+            glFinish()
+        self.egl.swap_buffers()
+        if self.fences_used:
+            self.pending.append(fence.Fence())
+        now = time.time()
+        if self.last_swap is not None:
+            interval = now-self.last_swap
+            self.frame_times.append(interval)
+            # Half a period late means the swap waited for a later vsync
+            if self.period and interval>self.period*1.5:
+                self.missed += 1
+        self.last_swap = now
+        self.frames += 1
+
+    def run(self,update,render,finished=lambda:False):
+        while not finished():
+            self.step(update,render)
+
+    def close(self):
+        """Waits for the frames still in flight and deletes their fences"""
+        while self.pending:
+            f = self.pending.popleft()
+            f.wait()
+            f.delete()
+
+    def stats(self):
+        """Returns frame time percentiles and maximum in milliseconds, the average frame
+        rate over the history, the counts of frames, missed vsyncs and updates, and the
+        frames and seconds spent waiting for the GPU"""
+        times = list(self.frame_times)
+        ms = lambda t:t*1000.0
+        return {'frames':self.frames,'missed':self.missed,'updates':self.updates,
+                'dropped':self.dropped,'slept':self.slept,'gpu_waits':self.gpu_waits,
+                'gpu_wait':self.gpu_wait,
+                'p50':ms(percentile(times,50)),'p90':ms(percentile(times,90)),
+                'p99':ms(percentile(times,99)),'max':ms(max(times or [0.0])),
+                'fps':len(times)/sum(times) if times else 0.0}
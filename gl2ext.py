@@ -1,203 +1,4 @@
-GL_ETC1_RGB8_OES = 0x8D64
-GL_PALETTE4_RGB8_OES = 0x8B90
-GL_PALETTE4_RGBA8_OES = 0x8B91
-GL_PALETTE4_R5_G6_B5_OES = 0x8B92
-GL_PALETTE4_RGBA4_OES = 0x8B93
-GL_PALETTE4_RGB5_A1_OES = 0x8B94
-GL_PALETTE8_RGB8_OES = 0x8B95
-GL_PALETTE8_RGBA8_OES = 0x8B96
-GL_PALETTE8_R5_G6_B5_OES = 0x8B97
-GL_PALETTE8_RGBA4_OES = 0x8B98
-GL_PALETTE8_RGB5_A1_OES = 0x8B99
-GL_DEPTH_COMPONENT24_OES = 0x81A6
-GL_DEPTH_COMPONENT32_OES = 0x81A7
-GL_TEXTURE_EXTERNAL_OES = 0x8D65
-GL_SAMPLER_EXTERNAL_OES = 0x8D66
-GL_TEXTURE_BINDING_EXTERNAL_OES = 0x8D67
-GL_REQUIRED_TEXTURE_IMAGE_UNITS_OES = 0x8D68
-GL_UNSIGNED_INT = 0x1405
-GL_PROGRAM_BINARY_LENGTH_OES = 0x8741
-GL_NUM_PROGRAM_BINARY_FORMATS_OES = 0x87FE
-GL_PROGRAM_BINARY_FORMATS_OES = 0x87FF
-GL_WRITE_ONLY_OES = 0x88B9
-GL_BUFFER_ACCESS_OES = 0x88BB
-GL_BUFFER_MAPPED_OES = 0x88BC
-GL_BUFFER_MAP_POINTER_OES = 0x88BD
-GL_DEPTH_STENCIL_OES = 0x84F9
-GL_UNSIGNED_INT_24_8_OES = 0x84FA
-GL_DEPTH24_STENCIL8_OES = 0x88F0
-GL_RGB8_OES = 0x8051
-GL_RGBA8_OES = 0x8058
-GL_FRAGMENT_SHADER_DERIVATIVE_HINT_OES = 0x8B8B
-GL_STENCIL_INDEX1_OES = 0x8D46
-GL_STENCIL_INDEX4_OES = 0x8D47
-GL_TEXTURE_WRAP_R_OES = 0x8072
-GL_TEXTURE_3D_OES = 0x806F
-GL_TEXTURE_BINDING_3D_OES = 0x806A
-GL_MAX_3D_TEXTURE_SIZE_OES = 0x8073
-GL_SAMPLER_3D_OES = 0x8B5F
-GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_3D_ZOFFSET_OES = 0x8CD4
-GL_HALF_FLOAT_OES = 0x8D61
-GL_VERTEX_ARRAY_BINDING_OES = 0x85B5
-GL_UNSIGNED_INT_10_10_10_2_OES = 0x8DF6
-GL_INT_10_10_10_2_OES = 0x8DF7
-GL_3DC_X_AMD = 0x87F9
-GL_3DC_XY_AMD = 0x87FA
-GL_ATC_RGB_AMD = 0x8C92
-GL_ATC_RGBA_EXPLICIT_ALPHA_AMD = 0x8C93
-GL_ATC_RGBA_INTERPOLATED_ALPHA_AMD = 0x87EE
-GL_COUNTER_TYPE_AMD = 0x8BC0
-GL_COUNTER_RANGE_AMD = 0x8BC1
-GL_UNSIGNED_INT64_AMD = 0x8BC2
-GL_PERCENTAGE_AMD = 0x8BC3
-GL_PERFMON_RESULT_AVAILABLE_AMD = 0x8BC4
-GL_PERFMON_RESULT_SIZE_AMD = 0x8BC5
-GL_PERFMON_RESULT_AMD = 0x8BC6
-GL_Z400_BINARY_AMD = 0x8740
-GL_READ_FRAMEBUFFER_ANGLE = 0x8CA8
-GL_DRAW_FRAMEBUFFER_ANGLE = 0x8CA9
-GL_DRAW_FRAMEBUFFER_BINDING_ANGLE = 0x8CA6
-GL_READ_FRAMEBUFFER_BINDING_ANGLE = 0x8CAA
-GL_RENDERBUFFER_SAMPLES_ANGLE = 0x8CAB
-GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_ANGLE = 0x8D56
-GL_MAX_SAMPLES_ANGLE = 0x8D57
-GL_RGB_422_APPLE = 0x8A1F
-GL_UNSIGNED_SHORT_8_8_APPLE = 0x85BA
-GL_UNSIGNED_SHORT_8_8_REV_APPLE = 0x85BB
-GL_RENDERBUFFER_SAMPLES_APPLE = 0x8CAB
-GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_APPLE = 0x8D56
-GL_MAX_SAMPLES_APPLE = 0x8D57
-GL_READ_FRAMEBUFFER_APPLE = 0x8CA8
-GL_DRAW_FRAMEBUFFER_APPLE = 0x8CA9
-GL_DRAW_FRAMEBUFFER_BINDING_APPLE = 0x8CA6
-GL_READ_FRAMEBUFFER_BINDING_APPLE = 0x8CAA
-GL_BGRA_EXT = 0x80E1
-GL_TEXTURE_MAX_LEVEL_APPLE = 0x813D
-GL_MALI_SHADER_BINARY_ARM = 0x8F60
-GL_MIN_EXT = 0x8007
-GL_MAX_EXT = 0x8008
-GL_COLOR_EXT = 0x1800
-GL_DEPTH_EXT = 0x1801
-GL_STENCIL_EXT = 0x1802
-GL_BGRA_EXT = 0x80E1
-GL_UNSIGNED_SHORT_4_4_4_4_REV_EXT = 0x8365
-GL_UNSIGNED_SHORT_1_5_5_5_REV_EXT = 0x8366
-GL_TEXTURE_MAX_ANISOTROPY_EXT = 0x84FE
-GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT = 0x84FF
-GL_BGRA_EXT = 0x80E1
-GL_UNSIGNED_INT_2_10_10_10_REV_EXT = 0x8368
-GL_COMPRESSED_RGB_S3TC_DXT1_EXT = 0x83F0
-GL_COMPRESSED_RGBA_S3TC_DXT1_EXT = 0x83F1
-GL_UNPACK_ROW_LENGTH = 0x0CF2
-GL_UNPACK_SKIP_ROWS = 0x0CF3
-GL_UNPACK_SKIP_PIXELS = 0x0CF4
-GL_SHADER_BINARY_DMP = 0x9250
-GL_SGX_PROGRAM_BINARY_IMG = 0x9130
-GL_BGRA_IMG = 0x80E1
-GL_UNSIGNED_SHORT_4_4_4_4_REV_IMG = 0x8365
-GL_SGX_BINARY_IMG = 0x8C0A
-GL_COMPRESSED_RGB_PVRTC_4BPPV1_IMG = 0x8C00
-GL_COMPRESSED_RGB_PVRTC_2BPPV1_IMG = 0x8C01
-GL_COMPRESSED_RGBA_PVRTC_4BPPV1_IMG = 0x8C02
-GL_COMPRESSED_RGBA_PVRTC_2BPPV1_IMG = 0x8C03
-GL_RENDERBUFFER_SAMPLES_IMG = 0x9133
-GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_IMG = 0x9134
-GL_MAX_SAMPLES_IMG = 0x9135
-GL_TEXTURE_SAMPLES_IMG = 0x9136
-GL_COVERAGE_COMPONENT_NV = 0x8ED0
-GL_COVERAGE_COMPONENT4_NV = 0x8ED1
-GL_COVERAGE_ATTACHMENT_NV = 0x8ED2
-GL_COVERAGE_BUFFERS_NV = 0x8ED3
-GL_COVERAGE_SAMPLES_NV = 0x8ED4
-GL_COVERAGE_ALL_FRAGMENTS_NV = 0x8ED5
-GL_COVERAGE_EDGE_FRAGMENTS_NV = 0x8ED6
-GL_COVERAGE_AUTOMATIC_NV = 0x8ED7
-GL_COVERAGE_BUFFER_BIT_NV = 0x8000
-GL_DEPTH_COMPONENT16_NONLINEAR_NV = 0x8E2C
-GL_MAX_DRAW_BUFFERS_NV = 0x8824
-GL_DRAW_BUFFER0_NV = 0x8825
-GL_DRAW_BUFFER1_NV = 0x8826
-GL_DRAW_BUFFER2_NV = 0x8827
-GL_DRAW_BUFFER3_NV = 0x8828
-GL_DRAW_BUFFER4_NV = 0x8829
-GL_DRAW_BUFFER5_NV = 0x882A
-GL_DRAW_BUFFER6_NV = 0x882B
-GL_DRAW_BUFFER7_NV = 0x882C
-GL_DRAW_BUFFER8_NV = 0x882D
-GL_DRAW_BUFFER9_NV = 0x882E
-GL_DRAW_BUFFER10_NV = 0x882F
-GL_DRAW_BUFFER11_NV = 0x8830
-GL_DRAW_BUFFER12_NV = 0x8831
-GL_DRAW_BUFFER13_NV = 0x8832
-GL_DRAW_BUFFER14_NV = 0x8833
-GL_DRAW_BUFFER15_NV = 0x8834
-GL_COLOR_ATTACHMENT0_NV = 0x8CE0
-GL_COLOR_ATTACHMENT1_NV = 0x8CE1
-GL_COLOR_ATTACHMENT2_NV = 0x8CE2
-GL_COLOR_ATTACHMENT3_NV = 0x8CE3
-GL_COLOR_ATTACHMENT4_NV = 0x8CE4
-GL_COLOR_ATTACHMENT5_NV = 0x8CE5
-GL_COLOR_ATTACHMENT6_NV = 0x8CE6
-GL_COLOR_ATTACHMENT7_NV = 0x8CE7
-GL_COLOR_ATTACHMENT8_NV = 0x8CE8
-GL_COLOR_ATTACHMENT9_NV = 0x8CE9
-GL_COLOR_ATTACHMENT10_NV = 0x8CEA
-GL_COLOR_ATTACHMENT11_NV = 0x8CEB
-GL_COLOR_ATTACHMENT12_NV = 0x8CEC
-GL_COLOR_ATTACHMENT13_NV = 0x8CED
-GL_COLOR_ATTACHMENT14_NV = 0x8CEE
-GL_COLOR_ATTACHMENT15_NV = 0x8CEF
-GL_MAX_COLOR_ATTACHMENTS_NV = 0x8CDF
-GL_ALL_COMPLETED_NV = 0x84F2
-GL_FENCE_STATUS_NV = 0x84F3
-GL_FENCE_CONDITION_NV = 0x84F4
-GL_READ_BUFFER_NV = 0x0C02
-GL_ALPHA_TEST_QCOM = 0x0BC0
-GL_ALPHA_TEST_FUNC_QCOM = 0x0BC1
-GL_ALPHA_TEST_REF_QCOM = 0x0BC2
-GL_TEXTURE_WIDTH_QCOM = 0x8BD2
-GL_TEXTURE_HEIGHT_QCOM = 0x8BD3
-GL_TEXTURE_DEPTH_QCOM = 0x8BD4
-GL_TEXTURE_INTERNAL_FORMAT_QCOM = 0x8BD5
-GL_TEXTURE_FORMAT_QCOM = 0x8BD6
-GL_TEXTURE_TYPE_QCOM = 0x8BD7
-GL_TEXTURE_IMAGE_VALID_QCOM = 0x8BD8
-GL_TEXTURE_NUM_LEVELS_QCOM = 0x8BD9
-GL_TEXTURE_TARGET_QCOM = 0x8BDA
-GL_TEXTURE_OBJECT_VALID_QCOM = 0x8BDB
-GL_STATE_RESTORE = 0x8BDC
-GL_PERFMON_GLOBAL_MODE_QCOM = 0x8FA0
-GL_WRITEONLY_RENDERING_QCOM = 0x8823
-GL_COLOR_BUFFER_BIT0_QCOM = 0x00000001
-GL_COLOR_BUFFER_BIT1_QCOM = 0x00000002
-GL_COLOR_BUFFER_BIT2_QCOM = 0x00000004
-GL_COLOR_BUFFER_BIT3_QCOM = 0x00000008
-GL_COLOR_BUFFER_BIT4_QCOM = 0x00000010
-GL_COLOR_BUFFER_BIT5_QCOM = 0x00000020
-GL_COLOR_BUFFER_BIT6_QCOM = 0x00000040
-GL_COLOR_BUFFER_BIT7_QCOM = 0x00000080
-GL_DEPTH_BUFFER_BIT0_QCOM = 0x00000100
-GL_DEPTH_BUFFER_BIT1_QCOM = 0x00000200
-GL_DEPTH_BUFFER_BIT2_QCOM = 0x00000400
-GL_DEPTH_BUFFER_BIT3_QCOM = 0x00000800
-GL_DEPTH_BUFFER_BIT4_QCOM = 0x00001000
-GL_DEPTH_BUFFER_BIT5_QCOM = 0x00002000
-GL_DEPTH_BUFFER_BIT6_QCOM = 0x00004000
-GL_DEPTH_BUFFER_BIT7_QCOM = 0x00008000
-GL_STENCIL_BUFFER_BIT0_QCOM = 0x00010000
-GL_STENCIL_BUFFER_BIT1_QCOM = 0x00020000
-GL_STENCIL_BUFFER_BIT2_QCOM = 0x00040000
-GL_STENCIL_BUFFER_BIT3_QCOM = 0x00080000
-GL_STENCIL_BUFFER_BIT4_QCOM = 0x00100000
-GL_STENCIL_BUFFER_BIT5_QCOM = 0x00200000
-GL_STENCIL_BUFFER_BIT6_QCOM = 0x00400000
-GL_STENCIL_BUFFER_BIT7_QCOM = 0x00800000
-GL_MULTISAMPLE_BUFFER_BIT0_QCOM = 0x01000000
-GL_MULTISAMPLE_BUFFER_BIT1_QCOM = 0x02000000
-GL_MULTISAMPLE_BUFFER_BIT2_QCOM = 0x04000000
-GL_MULTISAMPLE_BUFFER_BIT3_QCOM = 0x08000000
-GL_MULTISAMPLE_BUFFER_BIT4_QCOM = 0x10000000
-GL_MULTISAMPLE_BUFFER_BIT5_QCOM = 0x20000000
-GL_MULTISAMPLE_BUFFER_BIT6_QCOM = 0x40000000
-GL_MULTISAMPLE_BUFFER_BIT7_QCOM = 0x80000000
-GL_SHADER_BINARY_VIV = 0x8FC4
+# This file is generated by prepare_constants.py.  Do not edit.
+# The constants are loaded from constant_tables.py on first use.
+import glconstants
+glconstants.install(__name__,'gl2ext')
@@ -0,0 +1,95 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Lazy access to the constants extracted from the header files by prepare_constants.py.
+#
+# Each header has its own namespace module (egl, eglext, gl2, gl2ext, gl, glext).  Its table
+# is only built the first time one of its constants is looked up, so importing a namespace
+# is cheap and headers that are never used are never loaded.
+#
+# from gl2 import GL_TRIANGLES      (loads only the gl2 table)
+# glconstants.names('gl2',0x0500)   returns ['GL_INVALID_ENUM']
+
+import sys
+import types
+
+apis = ('egl','eglext','gl2','gl2ext','gl','glext')
+
+_tables = {}
+_reverse = {}
+
+def table(api):
+    """Returns the name->value dict for one header, building it on first use"""
+    try:
+        return _tables[api]
+    except KeyError:
+        import constant_tables
+        t = _tables[api] = getattr(constant_tables,api)()
+        return t
+
+def names(api,value):
+    """Returns the sorted list of names that one header defines with the given value"""
+    try:
+        r = _reverse[api]
+    except KeyError:
+        r = _reverse[api] = {}
+        for name,v in table(api).iteritems():
+            r.setdefault(v,[]).append(name)
+        for L in r.itervalues():
+            L.sort()
+    return r.get(value,[])
+
+def enum_name(value,apis=('gl2','gl2ext')):
+    """Returns a readable name for a value, e.g. for decoding glGetError results"""
+    for api in apis:
+        L = names(api,value)
+        if L:
+            return '/'.join(L)
+    return hex(value)
+
+class Namespace(types.ModuleType):
+    """A module whose constants are loaded from the table of its header on first access"""
+
+    def __getattr__(self,name):
+        # Only called when normal lookup fails, i.e. before the table has been loaded
+        if name.startswith('__') and name!='__all__':
+            raise AttributeError(name)
+        t = table(self.api)
+        self.__dict__.update(t)
+        self.__dict__['__all__'] = sorted(t)
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(name)
+
+def install(module_name,api):
+    """Replaces the module being imported with a lazy namespace for the given header"""
+    m = Namespace(module_name)
+    m.api = api
+    sys.modules[module_name] = m
+
+class ReExport(object):
+    """A lazy __all__ for a module that re-exports the constants of some headers.
+
+    Nothing is loaded until a star import reads it; the headers' constants are then copied
+    into the module's globals, which the import takes them from."""
+
+    def __init__(self,namespace,apis):
+        self.namespace = namespace
+        self.apis = apis
+        self.names = None
+
+    def _load(self):
+        if self.names is None:
+            names = set(n for n in self.namespace if not n.startswith('_'))
+            for api in self.apis:
+                for name,value in table(api).iteritems():
+                    self.namespace.setdefault(name,value)
+                    names.add(name)
+            self.names = sorted(names)
+        return self.names
+
+    def __getitem__(self,i):
+        return self._load()[i]
+
+    def __len__(self):
+        return len(self._load())
@@ -0,0 +1,124 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Policy for checking glGetError.
+#
+# OFF    never calls glGetError, so production runs pay nothing
+# FRAME  calls glGetError once per frame, from EGL.swap_buffers
+# CALL   checks after every OpenGLES entry point (debug mode).  The first failing call is
+#        recorded in first_error together with the Python call site and the decoded enum.
+#
+# import glerror
+# glerror.set_policy(glerror.CALL)
+# glerror.reset()            forgets first_error, e.g. before the next test
+#
+# The call site is the first caller outside this library's own files, so an error raised
+# inside a wrapper such as glstate or upload names the code that called the wrapper.  Scripts
+# run from the library's directory (the demos) and the tests count as callers.
+
+import os
+import sys
+import traceback
+import bindings
+import glconstants
+
+OFF = 'off'
+FRAME = 'frame'
+CALL = 'call'
+
+policy = FRAME
+
+# The first error seen while checking, kept so it can be inspected after the exception
+first_error = None
+
+# Code in files from this directory is passed over when finding the call site
+directory = os.path.dirname(os.path.abspath(__file__))
+
+_in_library = {} # co_filename -> True if it is one of the library's files
+
+class GLError(ValueError):
+    """Raised when glGetError reports an error"""
+
+    def __init__(self,code,function=None,site=None):
+        self.code = code
+        self.name = glconstants.enum_name(code)
+        self.function = function
+        self.site = site # (filename,line number,function name,text) of the Python caller
+        msg = self.name
+        if function:
+            msg += ' from '+function
+        if site:
+            msg += ' at %s:%d in %s: %s' % site
+        ValueError.__init__(self,msg)
+
+def _raise(e,function=None,site=None):
+    global first_error
+    error = GLError(e,function,site)
+    if first_error is None:
+        first_error = error
+    raise error
+
+def reset():
+    """Forgets the first error seen"""
+    global first_error
+    first_error = None
+
+def _in_library_frame(frame):
+    if frame.f_globals.get('__name__')=='__main__':
+        return False
+    filename = frame.f_code.co_filename
+    try:
+        return _in_library[filename]
+    except KeyError:
+        path = os.path.abspath(filename)
+        r = _in_library[filename] = (os.path.dirname(path)==directory and
+                                     not os.path.basename(path).startswith('test_'))
+        return r
+
+def _site(frame):
+    """Returns (filename,line number,function name,text) of the first frame from frame
+    outwards that is not in one of the library's files"""
+    caller = frame
+    while caller is not None and _in_library_frame(caller):
+        caller = caller.f_back
+    return tuple(traceback.extract_stack(caller or frame,limit=1)[0])
+
+def _checker(name):
+    """Returns an errcheck function that checks glGetError after calls to name"""
+    glGetError = bindings.glGetError
+    def errcheck(result,func,args):
+        e = glGetError()
+        if e:
+            _raise(e,name,_site(sys._getframe(1)))
+        return result
+    return errcheck
+
+def set_policy(p):
+    """Selects OFF, FRAME or CALL checking.
+
+    CALL installs a ctypes errcheck on every OpenGLES entry point, so it also applies to
+    code holding direct references to the functions; the other modes remove it again."""
+    global policy
+    if p not in (OFF,FRAME,CALL):
+        raise ValueError('Unknown GL error policy %r' % (p,))
+    for name in bindings.opengles_functions:
+        f = getattr(bindings,name)
+        if f is None or name=='glGetError':
+            continue
+        if p==CALL:
+            f.errcheck = _checker(name)
+        else:
+            del f.errcheck
+    policy = p
+
+def check():
+    """Raises GLError if an error is pending, whatever the policy"""
+    e = bindings.glGetError()
+    if e:
+        _raise(e,site=_site(sys._getframe(1)))
+
+def check_frame():
+    """Called once per frame; checks for errors unless the policy is OFF"""
+    if policy!=OFF:
+        e = bindings.glGetError()
+        if e:
+            _raise(e,'frame')
@@ -1,199 +1,4 @@
-GL_BLEND_EQUATION_RGB_OES = 0x8009
-GL_BLEND_EQUATION_ALPHA_OES = 0x883D
-GL_BLEND_DST_RGB_OES = 0x80C8
-GL_BLEND_SRC_RGB_OES = 0x80C9
-GL_BLEND_DST_ALPHA_OES = 0x80CA
-GL_BLEND_SRC_ALPHA_OES = 0x80CB
-GL_BLEND_EQUATION_OES = 0x8009
-GL_FUNC_ADD_OES = 0x8006
-GL_FUNC_SUBTRACT_OES = 0x800A
-GL_FUNC_REVERSE_SUBTRACT_OES = 0x800B
-GL_ETC1_RGB8_OES = 0x8D64
-GL_DEPTH_COMPONENT24_OES = 0x81A6
-GL_DEPTH_COMPONENT32_OES = 0x81A7
-GL_TEXTURE_CROP_RECT_OES = 0x8B9D
-GL_TEXTURE_EXTERNAL_OES = 0x8D65
-GL_TEXTURE_BINDING_EXTERNAL_OES = 0x8D67
-GL_REQUIRED_TEXTURE_IMAGE_UNITS_OES = 0x8D68
-GL_UNSIGNED_INT = 0x1405
-GL_FIXED_OES = 0x140C
-GL_FRAMEBUFFER_OES = 0x8D40
-GL_RENDERBUFFER_OES = 0x8D41
-GL_RGBA4_OES = 0x8056
-GL_RGB5_A1_OES = 0x8057
-GL_RGB565_OES = 0x8D62
-GL_DEPTH_COMPONENT16_OES = 0x81A5
-GL_RENDERBUFFER_WIDTH_OES = 0x8D42
-GL_RENDERBUFFER_HEIGHT_OES = 0x8D43
-GL_RENDERBUFFER_INTERNAL_FORMAT_OES = 0x8D44
-GL_RENDERBUFFER_RED_SIZE_OES = 0x8D50
-GL_RENDERBUFFER_GREEN_SIZE_OES = 0x8D51
-GL_RENDERBUFFER_BLUE_SIZE_OES = 0x8D52
-GL_RENDERBUFFER_ALPHA_SIZE_OES = 0x8D53
-GL_RENDERBUFFER_DEPTH_SIZE_OES = 0x8D54
-GL_RENDERBUFFER_STENCIL_SIZE_OES = 0x8D55
-GL_FRAMEBUFFER_ATTACHMENT_OBJECT_TYPE_OES = 0x8CD0
-GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME_OES = 0x8CD1
-GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LEVEL_OES = 0x8CD2
-GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_CUBE_MAP_FACE_OES = 0x8CD3
-GL_COLOR_ATTACHMENT0_OES = 0x8CE0
-GL_DEPTH_ATTACHMENT_OES = 0x8D00
-GL_STENCIL_ATTACHMENT_OES = 0x8D20
-GL_FRAMEBUFFER_COMPLETE_OES = 0x8CD5
-GL_FRAMEBUFFER_INCOMPLETE_ATTACHMENT_OES = 0x8CD6
-GL_FRAMEBUFFER_INCOMPLETE_MISSING_ATTACHMENT_OES = 0x8CD7
-GL_FRAMEBUFFER_INCOMPLETE_DIMENSIONS_OES = 0x8CD9
-GL_FRAMEBUFFER_INCOMPLETE_FORMATS_OES = 0x8CDA
-GL_FRAMEBUFFER_UNSUPPORTED_OES = 0x8CDD
-GL_FRAMEBUFFER_BINDING_OES = 0x8CA6
-GL_RENDERBUFFER_BINDING_OES = 0x8CA7
-GL_MAX_RENDERBUFFER_SIZE_OES = 0x84E8
-GL_INVALID_FRAMEBUFFER_OPERATION_OES = 0x0506
-GL_WRITE_ONLY_OES = 0x88B9
-GL_BUFFER_ACCESS_OES = 0x88BB
-GL_BUFFER_MAPPED_OES = 0x88BC
-GL_BUFFER_MAP_POINTER_OES = 0x88BD
-GL_MODELVIEW_MATRIX_FLOAT_AS_INT_BITS_OES = 0x898D
-GL_PROJECTION_MATRIX_FLOAT_AS_INT_BITS_OES = 0x898E
-GL_TEXTURE_MATRIX_FLOAT_AS_INT_BITS_OES = 0x898F
-GL_MAX_VERTEX_UNITS_OES = 0x86A4
-GL_MAX_PALETTE_MATRICES_OES = 0x8842
-GL_MATRIX_PALETTE_OES = 0x8840
-GL_MATRIX_INDEX_ARRAY_OES = 0x8844
-GL_WEIGHT_ARRAY_OES = 0x86AD
-GL_CURRENT_PALETTE_MATRIX_OES = 0x8843
-GL_MATRIX_INDEX_ARRAY_SIZE_OES = 0x8846
-GL_MATRIX_INDEX_ARRAY_TYPE_OES = 0x8847
-GL_MATRIX_INDEX_ARRAY_STRIDE_OES = 0x8848
-GL_MATRIX_INDEX_ARRAY_POINTER_OES = 0x8849
-GL_MATRIX_INDEX_ARRAY_BUFFER_BINDING_OES = 0x8B9E
-GL_WEIGHT_ARRAY_SIZE_OES = 0x86AB
-GL_WEIGHT_ARRAY_TYPE_OES = 0x86A9
-GL_WEIGHT_ARRAY_STRIDE_OES = 0x86AA
-GL_WEIGHT_ARRAY_POINTER_OES = 0x86AC
-GL_WEIGHT_ARRAY_BUFFER_BINDING_OES = 0x889E
-GL_DEPTH_STENCIL_OES = 0x84F9
-GL_UNSIGNED_INT_24_8_OES = 0x84FA
-GL_DEPTH24_STENCIL8_OES = 0x88F0
-GL_RGB8_OES = 0x8051
-GL_RGBA8_OES = 0x8058
-GL_STENCIL_INDEX1_OES = 0x8D46
-GL_STENCIL_INDEX4_OES = 0x8D47
-GL_STENCIL_INDEX8_OES = 0x8D48
-GL_INCR_WRAP_OES = 0x8507
-GL_DECR_WRAP_OES = 0x8508
-GL_NORMAL_MAP_OES = 0x8511
-GL_REFLECTION_MAP_OES = 0x8512
-GL_TEXTURE_CUBE_MAP_OES = 0x8513
-GL_TEXTURE_BINDING_CUBE_MAP_OES = 0x8514
-GL_TEXTURE_CUBE_MAP_POSITIVE_X_OES = 0x8515
-GL_TEXTURE_CUBE_MAP_NEGATIVE_X_OES = 0x8516
-GL_TEXTURE_CUBE_MAP_POSITIVE_Y_OES = 0x8517
-GL_TEXTURE_CUBE_MAP_NEGATIVE_Y_OES = 0x8518
-GL_TEXTURE_CUBE_MAP_POSITIVE_Z_OES = 0x8519
-GL_TEXTURE_CUBE_MAP_NEGATIVE_Z_OES = 0x851A
-GL_MAX_CUBE_MAP_TEXTURE_SIZE_OES = 0x851C
-GL_TEXTURE_GEN_MODE_OES = 0x2500
-GL_TEXTURE_GEN_STR_OES = 0x8D60
-GL_MIRRORED_REPEAT_OES = 0x8370
-GL_VERTEX_ARRAY_BINDING_OES = 0x85B5
-GL_3DC_X_AMD = 0x87F9
-GL_3DC_XY_AMD = 0x87FA
-GL_ATC_RGB_AMD = 0x8C92
-GL_ATC_RGBA_EXPLICIT_ALPHA_AMD = 0x8C93
-GL_ATC_RGBA_INTERPOLATED_ALPHA_AMD = 0x87EE
-GL_RENDERBUFFER_SAMPLES_APPLE = 0x8CAB
-GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_APPLE = 0x8D56
-GL_MAX_SAMPLES_APPLE = 0x8D57
-GL_READ_FRAMEBUFFER_APPLE = 0x8CA8
-GL_DRAW_FRAMEBUFFER_APPLE = 0x8CA9
-GL_DRAW_FRAMEBUFFER_BINDING_APPLE = 0x8CA6
-GL_READ_FRAMEBUFFER_BINDING_APPLE = 0x8CAA
-GL_BGRA_EXT = 0x80E1
-GL_TEXTURE_MAX_LEVEL_APPLE = 0x813D
-GL_MIN_EXT = 0x8007
-GL_MAX_EXT = 0x8008
-GL_COLOR_EXT = 0x1800
-GL_DEPTH_EXT = 0x1801
-GL_STENCIL_EXT = 0x1802
-GL_BGRA_EXT = 0x80E1
-GL_UNSIGNED_SHORT_4_4_4_4_REV_EXT = 0x8365
-GL_UNSIGNED_SHORT_1_5_5_5_REV_EXT = 0x8366
-GL_TEXTURE_MAX_ANISOTROPY_EXT = 0x84FE
-GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT = 0x84FF
-GL_BGRA_EXT = 0x80E1
-GL_MAX_TEXTURE_LOD_BIAS_EXT = 0x84FD
-GL_TEXTURE_FILTER_CONTROL_EXT = 0x8500
-GL_TEXTURE_LOD_BIAS_EXT = 0x8501
-GL_BGRA_IMG = 0x80E1
-GL_UNSIGNED_SHORT_4_4_4_4_REV_IMG = 0x8365
-GL_COMPRESSED_RGB_PVRTC_4BPPV1_IMG = 0x8C00
-GL_COMPRESSED_RGB_PVRTC_2BPPV1_IMG = 0x8C01
-GL_COMPRESSED_RGBA_PVRTC_4BPPV1_IMG = 0x8C02
-GL_COMPRESSED_RGBA_PVRTC_2BPPV1_IMG = 0x8C03
-GL_MODULATE_COLOR_IMG = 0x8C04
-GL_RECIP_ADD_SIGNED_ALPHA_IMG = 0x8C05
-GL_TEXTURE_ALPHA_MODULATE_IMG = 0x8C06
-GL_FACTOR_ALPHA_MODULATE_IMG = 0x8C07
-GL_FRAGMENT_ALPHA_MODULATE_IMG = 0x8C08
-GL_ADD_BLEND_IMG = 0x8C09
-GL_DOT3_RGBA_IMG = 0x86AF
-GL_CLIP_PLANE0_IMG = 0x3000
-GL_CLIP_PLANE1_IMG = 0x3001
-GL_CLIP_PLANE2_IMG = 0x3002
-GL_CLIP_PLANE3_IMG = 0x3003
-GL_CLIP_PLANE4_IMG = 0x3004
-GL_CLIP_PLANE5_IMG = 0x3005
-GL_MAX_CLIP_PLANES_IMG = 0x0D32
-GL_RENDERBUFFER_SAMPLES_IMG = 0x9133
-GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_IMG = 0x9134
-GL_MAX_SAMPLES_IMG = 0x9135
-GL_TEXTURE_SAMPLES_IMG = 0x9136
-GL_ALL_COMPLETED_NV = 0x84F2
-GL_FENCE_STATUS_NV = 0x84F3
-GL_FENCE_CONDITION_NV = 0x84F4
-GL_TEXTURE_WIDTH_QCOM = 0x8BD2
-GL_TEXTURE_HEIGHT_QCOM = 0x8BD3
-GL_TEXTURE_DEPTH_QCOM = 0x8BD4
-GL_TEXTURE_INTERNAL_FORMAT_QCOM = 0x8BD5
-GL_TEXTURE_FORMAT_QCOM = 0x8BD6
-GL_TEXTURE_TYPE_QCOM = 0x8BD7
-GL_TEXTURE_IMAGE_VALID_QCOM = 0x8BD8
-GL_TEXTURE_NUM_LEVELS_QCOM = 0x8BD9
-GL_TEXTURE_TARGET_QCOM = 0x8BDA
-GL_TEXTURE_OBJECT_VALID_QCOM = 0x8BDB
-GL_STATE_RESTORE = 0x8BDC
-GL_PERFMON_GLOBAL_MODE_QCOM = 0x8FA0
-GL_WRITEONLY_RENDERING_QCOM = 0x8823
-GL_COLOR_BUFFER_BIT0_QCOM = 0x00000001
-GL_COLOR_BUFFER_BIT1_QCOM = 0x00000002
-GL_COLOR_BUFFER_BIT2_QCOM = 0x00000004
-GL_COLOR_BUFFER_BIT3_QCOM = 0x00000008
-GL_COLOR_BUFFER_BIT4_QCOM = 0x00000010
-GL_COLOR_BUFFER_BIT5_QCOM = 0x00000020
-GL_COLOR_BUFFER_BIT6_QCOM = 0x00000040
-GL_COLOR_BUFFER_BIT7_QCOM = 0x00000080
-GL_DEPTH_BUFFER_BIT0_QCOM = 0x00000100
-GL_DEPTH_BUFFER_BIT1_QCOM = 0x00000200
-GL_DEPTH_BUFFER_BIT2_QCOM = 0x00000400
-GL_DEPTH_BUFFER_BIT3_QCOM = 0x00000800
-GL_DEPTH_BUFFER_BIT4_QCOM = 0x00001000
-GL_DEPTH_BUFFER_BIT5_QCOM = 0x00002000
-GL_DEPTH_BUFFER_BIT6_QCOM = 0x00004000
-GL_DEPTH_BUFFER_BIT7_QCOM = 0x00008000
-GL_STENCIL_BUFFER_BIT0_QCOM = 0x00010000
-GL_STENCIL_BUFFER_BIT1_QCOM = 0x00020000
-GL_STENCIL_BUFFER_BIT2_QCOM = 0x00040000
-GL_STENCIL_BUFFER_BIT3_QCOM = 0x00080000
-GL_STENCIL_BUFFER_BIT4_QCOM = 0x00100000
-GL_STENCIL_BUFFER_BIT5_QCOM = 0x00200000
-GL_STENCIL_BUFFER_BIT6_QCOM = 0x00400000
-GL_STENCIL_BUFFER_BIT7_QCOM = 0x00800000
-GL_MULTISAMPLE_BUFFER_BIT0_QCOM = 0x01000000
-GL_MULTISAMPLE_BUFFER_BIT1_QCOM = 0x02000000
-GL_MULTISAMPLE_BUFFER_BIT2_QCOM = 0x04000000
-GL_MULTISAMPLE_BUFFER_BIT3_QCOM = 0x08000000
-GL_MULTISAMPLE_BUFFER_BIT4_QCOM = 0x10000000
-GL_MULTISAMPLE_BUFFER_BIT5_QCOM = 0x20000000
-GL_MULTISAMPLE_BUFFER_BIT6_QCOM = 0x40000000
-GL_MULTISAMPLE_BUFFER_BIT7_QCOM = 0x80000000
+# This file is generated by prepare_constants.py.  Do not edit.
+# The constants are loaded from constant_tables.py on first use.
+import glconstants
+glconstants.install(__name__,'glext')
@@ -0,0 +1,48 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Queries about the OpenGLES implementation of the current context.
+#
+# has_extension('GL_OES_vertex_array_object')
+# has_egl_extension('EGL_KHR_fence_sync')
+# get_integer(GL_MAX_VERTEX_UNIFORM_VECTORS)
+
+import ctypes
+from bindings import eglGetCurrentDisplay, eglQueryString, glGetIntegerv, glGetString
+from egl import EGL_EXTENSIONS
+from gl2 import GL_EXTENSIONS, GL_RENDERER, GL_VENDOR, GL_VERSION
+
+_extensions = None
+_egl_extensions = None
+
+def extensions():
+    """Returns the set of extension names advertised by the driver"""
+    global _extensions
+    if _extensions is None:
+        _extensions = frozenset((glGetString(GL_EXTENSIONS) or '').split())
+    return _extensions
+
+def has_extension(name,*entry_points):
+    """Returns True if the driver advertises an extension and provides its entry points"""
+    return name in extensions() and None not in entry_points
+
+def egl_extensions():
+    """Returns the set of extension names advertised by the current EGL display"""
+    global _egl_extensions
+    if _egl_extensions is None:
+        _egl_extensions = frozenset((eglQueryString(eglGetCurrentDisplay(),EGL_EXTENSIONS)
+                                     or '').split())
+    return _egl_extensions
+
+def has_egl_extension(name,*entry_points):
+    """Returns True if EGL advertises an extension and provides its entry points"""
+    return name in egl_extensions() and None not in entry_points
+
+def driver_version():
+    """Returns a string identifying the driver, for keying caches of driver output"""
+    return '|'.join(glGetString(e) or '' for e in (GL_VENDOR,GL_RENDERER,GL_VERSION))
+
+def get_integer(pname):
+    """Returns the value of an integer state variable"""
+    v = ctypes.c_int()
+    glGetIntegerv(pname,ctypes.byref(v))
+    return v.value
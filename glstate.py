@@ -0,0 +1,282 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Shadow copy of the GL state so that setting state which is already current costs no
+# call into the driver.
+#
+# gl_state.use_program(p)              only calls glUseProgram if p is not already in use
+# gl_state.bind_buffer(GL_ARRAY_BUFFER,b)
+# gl_state.delete_buffers([b])         glDeleteBuffers, forgetting where b was bound
+# gl_state.last_frame                  {'issued':n,'elided':m} for the previous frame
+#
+# The attribute pointers, enables and element buffer binding belong to the bound vertex
+# array object.  Changing them while an object is bound first returns to the default array,
+# unless into_array=True says the change is meant for the object (as when recording one).
+# The default array's shadow state is kept while an object is bound.
+#
+# Code that changes state through the raw bindings must call gl_state.invalidate()
+# afterwards, otherwise the cache would skip calls that are still needed.  Buffers should
+# be deleted with gl_state.delete_buffers: GL reuses the names of deleted buffers, so a
+# stale binding could make a later bind of a new buffer look already done.
+
+import ctypes
+from bindings import (glActiveTexture, glBindBuffer, glBindFramebuffer, glBindTexture,
+                      glBindVertexArrayOES, glBlendEquation, glBlendFunc, glCullFace,
+                      glDeleteBuffers, glDepthFunc, glDepthMask, glDisable, glDisableVertexAttribArray, glEnable,
+                      glEnableVertexAttribArray, glFrontFace, glUseProgram,
+                      glVertexAttribPointer, glViewport)
+from gl2 import GL_ARRAY_BUFFER, GL_ELEMENT_ARRAY_BUFFER
+
+class StateCache(object):
+    """Tracks program, buffer, vertex attribute, texture, framebuffer, viewport, enable, blend
+    and depth state"""
+
+    def __init__(self):
+        self.issued = 0 # Calls passed on to the driver
+        self.elided = 0 # Calls skipped because the state was already current
+        self.last_frame = {'issued':0,'elided':0}
+        self._frame_issued = 0
+        self._frame_elided = 0
+        self.invalidate()
+
+    def invalidate(self):
+        """Forgets everything, so the next call of each kind is always issued"""
+        self.program = None
+        self.buffers = {}     # target -> buffer
+        self.unit = None      # active texture unit, e.g. GL_TEXTURE0
+        self.textures = {}    # (unit,target) -> texture
+        self.framebuffer = None
+        self.viewport_rect = None
+        self.enabled = {}     # capability -> True/False
+        self.blend = None     # (sfactor,dfactor)
+        self.blend_mode = None
+        self.depth = None     # depth function
+        self.depth_write = None
+        self.cull = None
+        self.front = None
+        self.vertex_array = None
+        self.attrib_pointers = {} # index -> (buffer,size,type,normalized,stride,offset)
+        self.attrib_enabled = {}  # index -> True/False
+        # The default array's (attrib_pointers,attrib_enabled,element buffer) while an
+        # object is bound
+        self.default_array = ({},{},None)
+
+    def end_frame(self):
+        """Records the counts for the frame just finished in last_frame"""
+        self.last_frame = {'issued':self.issued-self._frame_issued,
+                           'elided':self.elided-self._frame_elided}
+        self._frame_issued = self.issued
+        self._frame_elided = self.elided
+        return self.last_frame
+
+    def use_program(self,program):
+        if program==self.program:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.program = program
+        glUseProgram(program)
+
+    def _array_state(self,into_array):
+        """Returns to the default vertex array before changing vertex array state, unless
+        the change is meant for the bound object"""
+        if self.vertex_array and not into_array:
+            self.bind_vertex_array(0)
+
+    def bind_buffer(self,target,buf,into_array=False):
+        if target==GL_ELEMENT_ARRAY_BUFFER:
+            self._array_state(into_array)
+        if self.buffers.get(target)==buf:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.buffers[target] = buf
+        glBindBuffer(target,buf)
+
+    def forget_buffer(self,target):
+        """Marks the binding of target as unknown, e.g. after binding a vertex array object"""
+        self.buffers.pop(target,None)
+
+    def delete_buffers(self,bufs):
+        """Deletes buffers, forgetting the bindings and attribute pointers that use them"""
+        bufs = [buf for buf in bufs if buf]
+        if not bufs:
+            return
+        glDeleteBuffers(len(bufs),ctypes.byref((ctypes.c_uint*len(bufs))(*bufs)))
+        for target,buf in self.buffers.items():
+            if buf in bufs:
+                self.forget_buffer(target)
+        pointers,enabled,element = self.default_array
+        for shadow in (self.attrib_pointers,pointers):
+            for index,pointer in shadow.items():
+                if pointer[0] in bufs:
+                    del shadow[index]
+        if element in bufs:
+            self.default_array = (pointers,enabled,None)
+
+    def bind_vertex_array(self,array):
+        """Binds a GL_OES_vertex_array_object, or the default array for 0.  The attribute
+        state and element buffer then come from the array: an object's are unknown, and
+        the default array's are the ones set aside when an object was bound."""
+        if array==self.vertex_array:
+            self.elided += 1
+            return
+        self.issued += 1
+        if not self.vertex_array:
+            self.default_array = (self.attrib_pointers,self.attrib_enabled,
+                                  self.buffers.get(GL_ELEMENT_ARRAY_BUFFER))
+        self.vertex_array = array
+        glBindVertexArrayOES(array)
+        if array:
+            self.attrib_pointers = {}
+            self.attrib_enabled = {}
+            self.forget_buffer(GL_ELEMENT_ARRAY_BUFFER)
+        else:
+            self.attrib_pointers,self.attrib_enabled,element = self.default_array
+            self.default_array = ({},{},None)
+            if element is None:
+                self.forget_buffer(GL_ELEMENT_ARRAY_BUFFER)
+            else:
+                self.buffers[GL_ELEMENT_ARRAY_BUFFER] = element
+
+    def vertex_attrib_pointer(self,index,buf,size,type,normalized,stride,offset,
+                              into_array=False):
+        """Points attribute index at data in buf, binding it to GL_ARRAY_BUFFER if needed.
+        buf=None uses whatever buffer is bound."""
+        self._array_state(into_array)
+        key = (buf,size,type,normalized,stride,offset)
+        if buf is not None and self.attrib_pointers.get(index)==key:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.attrib_pointers[index] = key
+        if buf is not None:
+            self.bind_buffer(GL_ARRAY_BUFFER,buf)
+        glVertexAttribPointer(index,size,type,normalized,stride,offset)
+
+    def enable_vertex_attrib_array(self,index,into_array=False):
+        self._array_state(into_array)
+        if self.attrib_enabled.get(index) is True:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.attrib_enabled[index] = True
+        glEnableVertexAttribArray(index)
+
+    def disable_vertex_attrib_array(self,index,into_array=False):
+        self._array_state(into_array)
+        if self.attrib_enabled.get(index) is False:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.attrib_enabled[index] = False
+        glDisableVertexAttribArray(index)
+
+    def disable_other_attrib_arrays(self,used):
+        """Disables the enabled attributes of the default array not in used"""
+        self._array_state(False)
+        for index,enabled in self.attrib_enabled.items():
+            if enabled and index not in used:
+                self.disable_vertex_attrib_array(index)
+
+    def active_texture(self,unit):
+        if unit==self.unit:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.unit = unit
+        glActiveTexture(unit)
+
+    def bind_texture(self,target,texture):
+        """Binds texture to target on the active texture unit"""
+        key = (self.unit,target)
+        if self.textures.get(key)==texture:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.textures[key] = texture
+        glBindTexture(target,texture)
+
+    def bind_framebuffer(self,target,framebuffer):
+        if framebuffer==self.framebuffer:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.framebuffer = framebuffer
+        glBindFramebuffer(target,framebuffer)
+
+    def viewport(self,x,y,width,height):
+        rect = (x,y,width,height)
+        if rect==self.viewport_rect:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.viewport_rect = rect
+        glViewport(x,y,width,height)
+
+    def enable(self,cap):
+        if self.enabled.get(cap) is True:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.enabled[cap] = True
+        glEnable(cap)
+
+    def disable(self,cap):
+        if self.enabled.get(cap) is False:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.enabled[cap] = False
+        glDisable(cap)
+
+    def blend_func(self,sfactor,dfactor):
+        if (sfactor,dfactor)==self.blend:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.blend = (sfactor,dfactor)
+        glBlendFunc(sfactor,dfactor)
+
+    def blend_equation(self,mode):
+        if mode==self.blend_mode:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.blend_mode = mode
+        glBlendEquation(mode)
+
+    def depth_func(self,func):
+        if func==self.depth:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.depth = func
+        glDepthFunc(func)
+
+    def depth_mask(self,flag):
+        flag = 1 if flag else 0
+        if flag==self.depth_write:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.depth_write = flag
+        glDepthMask(flag)
+
+    def cull_face(self,mode):
+        if mode==self.cull:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.cull = mode
+        glCullFace(mode)
+
+    def front_face(self,mode):
+        if mode==self.front:
+            self.elided += 1
+            return
+        self.issued += 1
+        self.front = mode
+        glFrontFace(mode)
+
+# The cache for the current context
+gl_state = StateCache()
@@ -0,0 +1,212 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Immediate mode drawing for quick lines, shapes and points, as glBegin/glEnd used to do.
+#
+# im = Immediate()
+# im.begin(GL_LINE_STRIP)
+# im.color(1.0,0.0,0.0)
+# im.vertex(0.0,0.0); im.vertex(10.0,5.0); im.vertex(20.0,0.0)
+# im.end()
+# ...
+# im.flush(view)             at the end of the frame, before swapping buffers
+# im.delete()                deletes the stream buffers when done
+#
+# Nothing reaches the driver until flush: vertices are written into a preallocated float
+# array (which doubles when full), strips, fans and loops are turned into lists as they
+# end, and consecutive primitives of the same kind and state are merged.  flush uploads
+# the whole frame with one write to a stream.StreamBuffer and makes one glDrawArrays per
+# merged run.  Frames too big for the stream go up in several writes of whole primitives,
+# with a draw for each part of a run.
+#
+# begin(mode,state) takes an optional state function, called before its primitives are
+# drawn (e.g. to enable blending); primitives merge only if they share the same one.
+
+import ctypes
+import numpy
+from bindings import glDrawArrays
+from gl2 import (GL_ARRAY_BUFFER, GL_LINES, GL_LINE_LOOP, GL_LINE_STRIP, GL_POINTS,
+                 GL_TRIANGLES, GL_TRIANGLE_FAN, GL_TRIANGLE_STRIP)
+import layout
+from glstate import gl_state
+from program import program_cache
+import stream
+
+vertex_layout = layout.VertexLayout(('vertex',3,'float'),('color',4,'float'))
+
+components = 7 # x,y,z,r,g,b,a
+
+vertex_source = """
+              attribute vec3 vertex;
+              attribute vec4 color;
+              uniform mat4 view;
+              uniform float point_size;
+              varying vec4 c;
+              void main(void) {
+                c = color;
+                gl_PointSize = point_size;
+                gl_Position = view * vec4(vertex,1.0);
+              }"""
+
+fragment_source = """
+              varying vec4 c;
+              void main(void) {
+                gl_FragColor = c;
+              }"""
+
+# The list primitive each mode is drawn as
+list_modes = {GL_POINTS:GL_POINTS, GL_LINES:GL_LINES, GL_LINE_STRIP:GL_LINES,
+              GL_LINE_LOOP:GL_LINES, GL_TRIANGLES:GL_TRIANGLES,
+              GL_TRIANGLE_STRIP:GL_TRIANGLES, GL_TRIANGLE_FAN:GL_TRIANGLES}
+
+# Vertices in each primitive of the list modes
+primitive_sizes = {GL_POINTS:1, GL_LINES:2, GL_TRIANGLES:3}
+
+def _list_order(mode,n):
+    """Returns the order of the n recorded vertices that draws mode as a list"""
+    i = numpy.arange(n)
+    if mode==GL_LINE_STRIP:
+        return numpy.column_stack((i[:-1],i[1:])).ravel()
+    if mode==GL_LINE_LOOP:
+        return numpy.column_stack((i,(i+1)%n)).ravel() if n>1 else i[:0]
+    if mode==GL_TRIANGLE_STRIP:
+        t = i[:-2]
+        # Every other triangle is swapped to keep the winding consistent
+        odd = t%2==1
+        return numpy.column_stack((numpy.where(odd,t+1,t),numpy.where(odd,t,t+1),t+2)).ravel()
+    if mode==GL_TRIANGLE_FAN:
+        t = i[1:-1]
+        return numpy.column_stack((numpy.zeros_like(t),t,t+1)).ravel()
+    return i
+
+class Immediate(object):
+    """Records primitives a vertex at a time and draws them all at the end of the frame"""
+
+    def __init__(self,capacity=4096,stream_size=1<<20):
+        self.data = (ctypes.c_float*(capacity*components))()
+        self.n = 0                     # Vertices recorded this frame
+        self.batches = []              # [list mode,state,first vertex,count]
+        self.rgba = (1.0,1.0,1.0,1.0)
+        self.mode = None
+        self.state = None
+        self.first = 0
+        self.point_size = 1.0
+        self.stream = stream.StreamBuffer(GL_ARRAY_BUFFER,stream_size)
+        self.program = program_cache.get(vertex_source,fragment_source)
+        self.draws = 0                 # glDrawArrays calls made by the last flush
+
+    def delete(self):
+        self.stream.delete()
+
+    def _reserve(self,n):
+        """Makes room for n more vertices, doubling the array as needed"""
+        size = len(self.data)
+        needed = (self.n+n)*components
+        if needed>size:
+            while size<needed:
+                size *= 2
+            data = (ctypes.c_float*size)()
+            ctypes.memmove(data,self.data,self.n*components*4)
+            self.data = data
+
+    def begin(self,mode,state=None):
+        assert self.mode is None, 'begin called again before end'
+        self.mode = mode
+        self.state = state
+        self.first = self.n
+
+    def color(self,r,g,b,a=1.0):
+        """Sets the color of the vertices that follow"""
+        self.rgba = (r,g,b,a)
+
+    def vertex(self,x,y,z=0.0):
+        assert self.mode is not None, 'vertex called outside begin and end'
+        if self.n*components>=len(self.data):
+            self._reserve(1)
+        i = self.n*components
+        self.data[i:i+components] = (x,y,z)+self.rgba
+        self.n += 1
+
+    def vertices(self,points,colors=None):
+        """Adds an (n,3) array of points, with an (n,4) array of colors or the current color"""
+        assert self.mode is not None, 'vertices called outside begin and end'
+        points = numpy.asarray(points,dtype=numpy.float32).reshape(-1,3)
+        k = len(points)
+        self._reserve(k)
+        rows = self._rows(self.n,k)
+        rows[:,:3] = points
+        rows[:,3:] = self.rgba if colors is None else colors
+        self.n += k
+
+    def _rows(self,first,count):
+        """Returns a NumPy view of recorded vertices"""
+        view = numpy.frombuffer(self.data,dtype=numpy.float32)
+        return view[first*components:(first+count)*components].reshape(count,components)
+
+    def end(self):
+        """Finishes a primitive, merging it into the previous one where possible"""
+        assert self.mode is not None, 'end called without begin'
+        mode = list_modes[self.mode]
+        count = self.n-self.first
+        if mode==self.mode:
+            # Drop a trailing partial primitive, which would shift the primitives after it
+            count -= count%primitive_sizes[mode]
+            self.n = self.first+count
+        elif count:
+            order = _list_order(self.mode,count)
+            rows = self._rows(self.first,count)[order]
+            self.n = self.first
+            self._reserve(len(rows))
+            self._rows(self.first,len(rows))[:] = rows
+            self.n = self.first+len(rows)
+            count = len(rows)
+        if count:
+            last = self.batches[-1] if self.batches else None
+            if last is not None and last[0]==mode and last[1] is self.state:
+                last[3] += count
+            else:
+                self.batches.append([mode,self.state,self.first,count])
+        self.mode = None
+
+    def _chunks(self):
+        """Yields (first vertex,count,batches) for runs of the batches that fit the stream,
+        splitting batches between whole primitives"""
+        most = self.stream.size//(components*4)
+        most -= most%6 # Whole points, lines and triangles
+        first,count,batches = 0,0,[]
+        for mode,state,start,n in self.batches:
+            size = primitive_sizes[mode]
+            while n:
+                k = min(n,most-count)
+                k -= k%size
+                if not k:
+                    # No room left for a primitive, so start the next chunk
+                    yield first,count,batches
+                    first,count,batches = start,0,[]
+                    continue
+                batches.append((mode,state,start,k))
+                count += k
+                start += k
+                n -= k
+        if batches:
+            yield first,count,batches
+
+    def flush(self,view):
+        """Draws everything recorded this frame with the given view matrix, then starts afresh"""
+        self.draws = 0
+        if self.n:
+            self.program.use()
+            self.program['view'] = view
+            self.program['point_size'] = self.point_size
+            gl_state.disable_other_attrib_arrays(self.program.attributes.values())
+            for first,count,batches in self._chunks():
+                data = (ctypes.c_float*(count*components)).from_buffer(self.data,first*components*4)
+                offset = self.stream.write(data)
+                vertex_layout.setup(self.program.attributes,offset)
+                for mode,state,start,n in batches:
+                    if state is not None:
+                        state()
+                    glDrawArrays(mode,start-first,n)
+                    self.draws += 1
+            self.stream.end_frame()
+        self.n = 0
+        self.batches = []
@@ -0,0 +1,127 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Pseudo-instancing for OpenGLES 2, which has no instanced draw calls.
+#
+# The mesh is stored k times in one buffer, each copy with an 'instance' attribute giving
+# its number.  The vertex shader picks its model matrix from a uniform array with it, so
+# k objects are drawn with one glUniformMatrix4fv (or glUniform4fv) and one glDrawElements.
+# More than k objects are drawn k at a time.
+#
+# k = instances_per_draw(len(m.positions))
+# p = program_cache.get(declarations(k)+vertex_source,fragment_source)
+# objects = InstancedMesh(m,p,k)
+# objects.draw(models)        models is an (n,4,4) array, e.g. from transform
+# objects.delete()            deletes its buffers
+#
+# In the vertex shader model_position(vec4(vertex,1.0)) and model_normal(normal) apply the
+# instance's model matrix.  With affine=True each matrix is sent as three vec4 rows
+# instead of a mat4, fitting a third more instances into the uniform space.
+#
+# NumPy is required.
+
+import ctypes
+import numpy
+from bindings import glDrawElements, glGenBuffers
+from gl2 import (GL_ARRAY_BUFFER, GL_ELEMENT_ARRAY_BUFFER, GL_MAX_VERTEX_UNIFORM_VECTORS,
+                 GL_STATIC_DRAW, GL_TRIANGLES)
+import glinfo
+import layout
+import mesh
+from glstate import gl_state
+from upload import buffer_data
+import vao
+
+default_layout = layout.VertexLayout(('vertex',3,'float'),('normal',3,'byte'),
+                                     ('instance',1,'index'))
+
+def instances_per_draw(vertex_count,affine=False,reserved=8,limit=None):
+    """Returns how many instances of a mesh can be drawn by one call.
+
+    reserved is the number of uniform vectors the shader uses besides the model matrices
+    (a mat4 view matrix takes 4).  The count is also limited by the instance attribute
+    being a byte and, without GL_OES_element_index_uint, by 16 bit indices."""
+    vectors = glinfo.get_integer(GL_MAX_VERTEX_UNIFORM_VECTORS)-reserved
+    k = min(vectors//(3 if affine else 4),256)
+    if not glinfo.has_extension('GL_OES_element_index_uint'):
+        k = min(k,(1<<16)//max(vertex_count,1))
+    if limit is not None:
+        k = min(k,limit)
+    if k<1:
+        raise ValueError('Not enough uniform space or indices for one instance')
+    return k
+
+def declarations(k,affine=False):
+    """Returns the GLSL declaring the model matrices, the instance attribute and the
+    model_position and model_normal functions, to put before a vertex shader"""
+    if affine:
+        return """
+              uniform vec4 models[%d];
+              attribute float instance;
+              vec4 model_position(vec4 v) {
+                int i = int(instance)*3;
+                return vec4(dot(models[i],v),dot(models[i+1],v),dot(models[i+2],v),1.0);
+              }
+              vec3 model_normal(vec3 n) {
+                int i = int(instance)*3;
+                return vec3(dot(models[i].xyz,n),dot(models[i+1].xyz,n),dot(models[i+2].xyz,n));
+              }
+""" % (3*k)
+    return """
+              uniform mat4 models[%d];
+              attribute float instance;
+              vec4 model_position(vec4 v) { return models[int(instance)]*v; }
+              vec3 model_normal(vec3 n) { return (models[int(instance)]*vec4(n,0.0)).xyz; }
+""" % k
+
+def affine_rows(models):
+    """Returns the (n*3,4) rows sent for affine model matrices: the first three columns of
+    each matrix, which hold its rotation, scale and translation"""
+    models = numpy.asarray(models,dtype=numpy.float32)
+    return numpy.ascontiguousarray(models[:,:,:3].transpose(0,2,1)).reshape(-1,4)
+
+class InstancedMesh(object):
+    """k copies of a mesh.Mesh in one buffer, drawn k instances per call with program"""
+
+    def __init__(self,m,program,k,affine=False,layout=None):
+        self.program = program
+        self.k = k
+        self.affine = affine
+        self.layout = layout or default_layout
+        n = len(m.positions)
+        arrays = {'vertex':numpy.tile(m.positions,(k,1)),'normal':numpy.tile(m.normals,(k,1)),
+                  'instance':numpy.repeat(numpy.arange(k),n)}
+        data,dequantize = self.layout.pack(arrays)
+        self.dequantize = dequantize
+        faces = m.faces.ravel()
+        self.indices_per_instance = len(faces)
+        E = (numpy.tile(faces,k)+numpy.repeat(numpy.arange(k)*n,len(faces)))
+        E = E.astype(mesh.index_dtype(k*n,True))
+        bufs = (ctypes.c_uint*2)()
+        glGenBuffers(2,ctypes.byref(bufs))
+        self.vbuf,self.ebuf = bufs
+        gl_state.bind_buffer(GL_ARRAY_BUFFER,self.vbuf)
+        gl_state.bind_buffer(GL_ELEMENT_ARRAY_BUFFER,self.ebuf)
+        buffer_data(GL_ARRAY_BUFFER,data,GL_STATIC_DRAW)
+        self.index_type = buffer_data(GL_ELEMENT_ARRAY_BUFFER,E,GL_STATIC_DRAW)
+        self.array = vao.VertexArray(self.layout,program.attributes,self.vbuf,self.ebuf)
+        self.draws = 0 # glDrawElements calls made
+
+    def delete(self):
+        self.array.delete()
+        gl_state.delete_buffers((self.vbuf,self.ebuf))
+
+    def draw(self,models):
+        """Draws one instance for each model matrix in an (n,4,4) array"""
+        models = numpy.ascontiguousarray(models,dtype=numpy.float32)
+        if self.affine:
+            rows = affine_rows(models)
+        self.program.use()
+        self.array.bind()
+        for start in xrange(0,len(models),self.k):
+            count = min(self.k,len(models)-start)
+            if self.affine:
+                self.program['models'] = rows[3*start:3*(start+count)]
+            else:
+                self.program['models'] = models[start:start+count]
+            glDrawElements(GL_TRIANGLES,count*self.indices_per_instance,self.index_type,0)
+            self.draws += 1
@@ -0,0 +1,123 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Vertex layouts: one description of each attribute's name, size and storage format that
+# both packs the vertex data and sets up the attribute pointers, so the two cannot
+# disagree.
+#
+# L = VertexLayout(('vertex',3,'float'),('normal',3,'byte'))
+# data,dequantize = L.pack({'vertex':positions,'normal':normals})
+# L.setup(program.attributes)      glVertexAttribPointer and glEnableVertexAttribArray
+#
+# vao.VertexArray records a layout's pointers once so drawing only needs a bind.
+#
+# Formats:
+#   float    32 bit floats
+#   half     16 bit floats.  These need GL_OES_vertex_half_float, and without it the
+#            layout stores floats instead, so create such layouts once a context is current.
+#   short    normalised signed shorts, for values in [-1,1] such as normals
+#   byte     normalised signed bytes
+#   ubyte    normalised unsigned bytes, for values in [0,1] such as colours
+#   index    unsigned bytes read as whole numbers, such as an instance index
+#   qshort   normalised shorts spanning the attribute's bounding box.  pack returns the
+#            dequantisation matrix mapping them back, to apply before the model matrix.
+#
+# Every attribute starts on a 4 byte boundary, as the hardware fetches whole words.
+#
+# NumPy is required.
+
+import numpy
+from gl2 import GL_ARRAY_BUFFER, GL_BYTE, GL_FLOAT, GL_SHORT, GL_UNSIGNED_BYTE
+from gl2ext import GL_HALF_FLOAT_OES
+import glinfo
+from glstate import gl_state
+import transform
+
+# format -> (GL type, normalized, NumPy type)
+formats = {
+    'float': (GL_FLOAT,False,numpy.float32),
+    'half': (GL_HALF_FLOAT_OES,False,numpy.float16),
+    'short': (GL_SHORT,True,numpy.int16),
+    'byte': (GL_BYTE,True,numpy.int8),
+    'ubyte': (GL_UNSIGNED_BYTE,True,numpy.uint8),
+    'index': (GL_UNSIGNED_BYTE,False,numpy.uint8),
+    'qshort': (GL_SHORT,True,numpy.int16),
+}
+
+def _snorm(values,bits):
+    """Encodes values in [-1,1] with OpenGLES 2's signed normalised mapping (2c+1)/(2^b-1)"""
+    top = (1<<(bits-1))-1
+    return numpy.clip(numpy.round((values*((1<<bits)-1)-1)*0.5),-top-1,top)
+
+class Attribute(object):
+    """One attribute of a layout and its byte offset in each vertex"""
+
+    def __init__(self,name,components,format,offset):
+        if format not in formats:
+            raise ValueError('Unknown vertex format %r' % (format,))
+        self.name = name
+        self.components = components
+        self.format = format
+        self.gl_type,self.normalized,self.dtype = formats[format]
+        self.offset = offset
+        self.size = components*numpy.dtype(self.dtype).itemsize
+
+class VertexLayout(object):
+    """The interleaved storage of a vertex, given as (name,components,format) triples"""
+
+    def __init__(self,*attributes):
+        self.attributes = []
+        offset = 0
+        for name,components,format in attributes:
+            if format=='half' and not glinfo.has_extension('GL_OES_vertex_half_float'):
+                format = 'float'
+            a = Attribute(name,components,format,offset)
+            self.attributes.append(a)
+            offset += (a.size+3)&~3
+        self.stride = offset
+
+    def pack(self,arrays):
+        """Returns (data,dequantize) for a dict of name -> (n,components) float arrays.
+
+        data is an (n,stride) array of bytes.  dequantize is the matrix mapping the qshort
+        attribute (if any) back to its original values, otherwise the identity."""
+        n = len(arrays[self.attributes[0].name])
+        data = numpy.zeros((n,self.stride),dtype=numpy.uint8)
+        dequantize = transform.identity()
+        for a in self.attributes:
+            values = numpy.asarray(arrays[a.name],dtype=numpy.float64).reshape(n,a.components)
+            if a.format=='qshort':
+                lo = values.min(axis=0)
+                hi = values.max(axis=0)
+                center = (lo+hi)*0.5
+                half = (hi-lo)*0.5
+                half[half==0] = 1.0
+                values = _snorm((values-center)/half,16)
+                # (2c+1)/65535 is what the shader sees; scale and shift it back
+                scale = numpy.ones(3)
+                scale[:a.components] = half
+                shift = numpy.zeros(3)
+                shift[:a.components] = center
+                dequantize = transform.multiply(transform.scaling(scale),transform.translation(shift))
+            elif a.format=='short':
+                values = _snorm(values,16)
+            elif a.format=='byte':
+                values = _snorm(values,8)
+            elif a.format=='ubyte':
+                values = numpy.clip(numpy.round(values*255),0,255)
+            column = numpy.ascontiguousarray(values.astype(a.dtype))
+            data[:,a.offset:a.offset+a.size] = column.view(numpy.uint8).reshape(n,a.size)
+        return data,dequantize
+
+    def pointers(self,locations,base=0):
+        """Returns (location,components,gl type,normalized,stride,offset) for each attribute
+        found in a {name:location} dict, for vertex data starting base bytes into a buffer"""
+        return [(locations[a.name],a.components,a.gl_type,a.normalized,self.stride,base+a.offset)
+                for a in self.attributes if locations.get(a.name,-1)>=0]
+
+    def setup(self,locations,base=0):
+        """Points and enables each attribute found in a {name:location} dict, for vertex
+        data starting base bytes into the bound GL_ARRAY_BUFFER"""
+        buf = gl_state.buffers.get(GL_ARRAY_BUFFER)
+        for p in self.pointers(locations,base):
+            gl_state.vertex_attrib_pointer(p[0],buf,*p[1:])
+            gl_state.enable_vertex_attrib_array(p[0])
@@ -0,0 +1,182 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Levels of detail: cheaper versions of a mesh drawn when it covers little of the screen.
+#
+# levels = simplified_levels(positions,faces)         or made parametrically, e.g. cone.cone_lod
+# detail = LOD([Buffer(p,f) for p,f in levels],(0.2,0.1,0.05))
+# obj = LODObject(detail)                             drawable, and placed in a cull.Scene
+# update_levels(objects,models,VP)                    once a frame, before drawing them
+#
+# Level 0 is the most detailed.  sizes gives, for each level but the last, the smallest
+# projected size at which it is used; the projected size is the fraction of the screen's
+# height covered by the bounding sphere.  An object only changes level once its size is
+# hysteresis (a fraction) past the threshold, so objects sitting at the threshold do not
+# flick between levels every frame.
+#
+# simplify reduces an arbitrary mesh by edge collapses: each vertex carries the quadric of
+# the planes of its faces, and the edges whose collapse moves their vertices least from
+# those planes go first.  The outline of an open mesh is held in place.  It makes no
+# checks against folded or flipped faces, so very low face counts can look rough.
+#
+# NumPy is required.
+
+import numpy
+import mesh
+
+def _plane_quadrics(normals,points,weights):
+    """Returns the weighted (m,16) quadrics of planes through points with unit normals"""
+    plane = numpy.column_stack((normals,-(normals*points).sum(axis=1)))
+    return (plane[:,:,None]*plane[:,None,:]*weights[:,None,None]).reshape(-1,16)
+
+def _quadrics(p,faces,boundary_weight=100.0):
+    """Returns the (n,4,4) sum over each vertex's faces of the area weighted plane quadrics.
+
+    Edges on the boundary of the mesh add a plane at right angles to their face, so
+    collapses keep the outline in place."""
+    normals,area = mesh.face_normals(p,faces)
+    Q = mesh._accumulate(faces,_plane_quadrics(normals,p[faces[:,0]],area),len(p))
+    ends = numpy.concatenate((faces[:,[0,1]],faces[:,[1,2]],faces[:,[2,0]]))
+    key = numpy.sort(ends,axis=1)
+    key = key[:,0].astype(numpy.int64)<<32|key[:,1]
+    inverse,count = numpy.unique(key,return_inverse=True,return_counts=True)[1:]
+    edge = numpy.nonzero(count[inverse]==1)[0]
+    if len(edge):
+        a,b = ends[edge,0],ends[edge,1]
+        face = edge%len(faces)
+        d = p[b]-p[a]
+        length = numpy.sqrt((d*d).sum(axis=1))
+        side = mesh._normalize(numpy.cross(d,normals[face]))
+        K = _plane_quadrics(side,p[a],boundary_weight*length*length)
+        for v in (a,b):
+            for k in xrange(16):
+                Q[:,k] += numpy.bincount(v,K[:,k],minlength=len(p))
+    return Q.reshape(-1,4,4)
+
+def _edges(faces):
+    """Returns the distinct (m,2) edges of the faces, lower vertex first"""
+    e = numpy.concatenate((faces[:,[0,1]],faces[:,[1,2]],faces[:,[2,0]]))
+    e.sort(axis=1)
+    e = numpy.unique(e[:,0].astype(numpy.int64)<<32|e[:,1])
+    return numpy.column_stack((e>>32,e&0xffffffff))
+
+def _error(Q,v):
+    """Returns v'Qv for (m,3) points v and (m,4,4) quadrics Q"""
+    h = numpy.column_stack((v,numpy.ones(len(v))))
+    return numpy.einsum('mi,mij,mj->m',h,Q,h)
+
+def simplify(positions,faces,target):
+    """Returns (positions,faces) of the mesh reduced to at most target faces (or as near as
+    collapses can get), with unused vertices dropped"""
+    p = numpy.array(positions,dtype=numpy.float64).reshape(-1,3)
+    faces = numpy.asarray(faces)[:,:3].astype(numpy.int64)
+    Q = _quadrics(p,faces)
+    while len(faces)>target:
+        edges = _edges(faces)
+        a,b = edges[:,0],edges[:,1]
+        Qe = Q[a]+Q[b]
+        # Place the merged vertex at whichever of the ends and the midpoint costs least
+        places = numpy.array([p[a],p[b],(p[a]+p[b])*0.5])
+        costs = numpy.array([_error(Qe,v) for v in places])
+        best = costs.argmin(axis=0)
+        cost = costs[best,numpy.arange(len(edges))]
+        # Collapse a set of cheap edges sharing no vertices: those that are the cheapest
+        # edge of both their vertices, from the cheapest quarter of all edges
+        rank = numpy.empty(len(edges),dtype=numpy.int64)
+        rank[numpy.argsort(cost,kind='mergesort')] = numpy.arange(len(edges))
+        lowest = numpy.full(len(p),len(edges),dtype=numpy.int64)
+        numpy.minimum.at(lowest,a,rank)
+        numpy.minimum.at(lowest,b,rank)
+        chosen = (rank==lowest[a])&(rank==lowest[b])&(rank<=len(edges)//4)
+        chosen = numpy.nonzero(chosen)[0]
+        # Each collapse removes about two faces
+        chosen = chosen[numpy.argsort(rank[chosen])][:max((len(faces)-target+1)//2,1)]
+        if not len(chosen):
+            break
+        a,b = a[chosen],b[chosen]
+        p[a] = places[best[chosen],chosen]
+        Q[a] += Q[b]
+        remap = numpy.arange(len(p))
+        remap[b] = a
+        faces = remap[faces]
+        keep = (faces[:,0]!=faces[:,1])&(faces[:,1]!=faces[:,2])&(faces[:,2]!=faces[:,0])
+        faces = faces[keep]
+    used = numpy.unique(faces)
+    index = numpy.zeros(len(p),dtype=numpy.int64)
+    index[used] = numpy.arange(len(used))
+    return p[used].astype(numpy.float32),index[faces]
+
+def simplified_levels(positions,faces,ratios=(1.0,0.5,0.25,0.125)):
+    """Returns [(positions,faces)] for each ratio of the original face count"""
+    faces = numpy.asarray(faces)[:,:3]
+    levels = []
+    for ratio in ratios:
+        if ratio>=1.0:
+            levels.append((numpy.asarray(positions,dtype=numpy.float32).reshape(-1,3),faces))
+        else:
+            # Simplifying the previous level is cheaper than starting again
+            p,f = levels[-1] if levels else (positions,faces)
+            levels.append(simplify(p,f,int(len(faces)*ratio)))
+    return levels
+
+def projected_sizes(centres,radii,VP):
+    """Returns the fraction of the screen's height covered by spheres in world space, seen
+    through the view matrix VP.  Spheres around the eye count as infinitely large."""
+    centres = numpy.asarray(centres,dtype=numpy.float64).reshape(-1,3)
+    VP = numpy.asarray(VP,dtype=numpy.float64)
+    w = numpy.dot(centres,VP[:3,3])+VP[3,3]
+    # The view's y column holds the vertical focal length times a unit vector
+    focal = numpy.sqrt((VP[:3,1]**2).sum())
+    radii = numpy.asarray(radii,dtype=numpy.float64)
+    return numpy.where(w>radii,radii*focal/numpy.maximum(w,1e-9),numpy.inf)
+
+class LOD(object):
+    """Drawables for each level of detail of a mesh, most detailed first"""
+
+    def __init__(self,levels,sizes,hysteresis=0.15):
+        if len(sizes)!=len(levels)-1:
+            raise ValueError('Need a size for each level but the last')
+        self.levels = levels
+        self.sizes = numpy.asarray(sizes,dtype=numpy.float64)
+        self.hysteresis = hysteresis
+        self.bounds = levels[0].bounds
+        self.sphere = levels[0].sphere
+
+    def select(self,sizes,current):
+        """Returns the level for objects of the given projected sizes that currently use
+        the given levels"""
+        # The thresholds are in decreasing order, so count those above the size
+        t = -self.sizes
+        coarser = numpy.searchsorted(t,-numpy.asarray(sizes)/(1.0-self.hysteresis))
+        finer = numpy.searchsorted(t,-numpy.asarray(sizes)/(1.0+self.hysteresis))
+        current = numpy.asarray(current)
+        return numpy.where(coarser>current,coarser,numpy.where(finer<current,finer,current))
+
+class LODObject(object):
+    """An object drawn at a level of detail of a shared LOD"""
+
+    def __init__(self,lod,level=0):
+        self.lod = lod
+        self.level = level
+        self.bounds = lod.bounds
+
+    def draw(self,s):
+        self.lod.levels[self.level].draw(s)
+
+def update_levels(objects,models,VP):
+    """Picks the level of each LODObject for its model matrix and the view matrix VP,
+    returning how many objects use each level"""
+    if not len(objects):
+        return numpy.zeros(0,dtype=numpy.intp)
+    models = numpy.asarray(models,dtype=numpy.float64)
+    centres = numpy.array([o.lod.sphere[0] for o in objects],dtype=numpy.float64)
+    radii = numpy.array([o.lod.sphere[1] for o in objects])
+    world = numpy.einsum('ni,nij->nj',centres,models[:,:3,:3])+models[:,3,:3]
+    # Scale the radius by the largest scale of each model matrix
+    radii = radii*numpy.sqrt((models[:,:3,:3]**2).sum(axis=2).max(axis=1))
+    sizes = projected_sizes(world,radii,VP)
+    levels = [o.level for o in objects]
+    for lod in set(o.lod for o in objects):
+        group = [i for i,o in enumerate(objects) if o.lod is lod]
+        for i,level in zip(group,lod.select(sizes[group],[levels[i] for i in group])):
+            objects[i].level = int(level)
+    return numpy.bincount([o.level for o in objects])
@@ -0,0 +1,220 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Builds vertex data for a triangle mesh with NumPy instead of per-vertex Python loops.
+#
+# m = Mesh(positions,faces)          (n,3) positions and (f,3) vertex indices
+# m.normals                          area weighted vertex normals
+# m.vertices()                       interleaved float32 position+normal data to upload
+# m.attributes                       [(name,components,byte offset)], with m.stride
+# m.pack(layout)                     the vertex data in a compact layout.VertexLayout
+#
+# Passing uvs adds them to the vertex data, and tangents=True adds a tangent per vertex
+# (xyz plus the handedness of the uv mapping in w) for normal mapping.
+#
+# m.optimize() reorders faces and vertices for the GPU's vertex cache (see meshopt).
+#
+# bounds(positions) and bounding_sphere(positions) give the box and sphere around a mesh.
+#
+# index_dtype(n) picks the narrowest index type for n vertices, and split(faces) breaks a
+# mesh too big for 16 bit indices into runs that each fit.
+#
+# NumPy is required.
+
+import numpy
+import meshopt
+
+def _accumulate(faces,values,n):
+    """Returns the sum over the faces using each of n vertices of the per-face values"""
+    out = numpy.zeros((n,values.shape[1]))
+    for corner in xrange(3):
+        for k in xrange(values.shape[1]):
+            out[:,k] += numpy.bincount(faces[:,corner],values[:,k],minlength=n)
+    return out
+
+def _normalize(v):
+    """Returns the rows of v scaled to unit length, leaving zero rows unchanged"""
+    length = numpy.sqrt((v*v).sum(axis=1))
+    length[length==0] = 1.0
+    return v/length[:,None]
+
+def face_normals(positions,faces):
+    """Returns the unit normal and the area of each face"""
+    p = numpy.asarray(positions,dtype=numpy.float64)
+    a = p[faces[:,0]]
+    n = numpy.cross(p[faces[:,1]]-a,p[faces[:,2]]-a)
+    length = numpy.sqrt((n*n).sum(axis=1))
+    return _normalize(n),0.5*length
+
+def vertex_normals(positions,faces):
+    """Returns the unit normal of each vertex, averaged over its faces weighted by area"""
+    p = numpy.asarray(positions,dtype=numpy.float64)
+    a = p[faces[:,0]]
+    # The cross product's length is twice the face area, so summing it weights by area
+    n = numpy.cross(p[faces[:,1]]-a,p[faces[:,2]]-a)
+    return _normalize(_accumulate(faces,n,len(p)))
+
+def vertex_tangents(positions,normals,uvs,faces):
+    """Returns an (n,4) array of tangents orthogonal to the normals, with the handedness
+    of the uv mapping (+1 or -1) in w"""
+    p = numpy.asarray(positions,dtype=numpy.float64)
+    t = numpy.asarray(uvs,dtype=numpy.float64)
+    e1 = p[faces[:,1]]-p[faces[:,0]]
+    e2 = p[faces[:,2]]-p[faces[:,0]]
+    d1 = t[faces[:,1]]-t[faces[:,0]]
+    d2 = t[faces[:,2]]-t[faces[:,0]]
+    det = d1[:,0]*d2[:,1]-d2[:,0]*d1[:,1]
+    r = numpy.zeros_like(det)
+    nonzero = det!=0
+    r[nonzero] = 1.0/det[nonzero] # Faces with degenerate uvs contribute nothing
+    sdir = (e1*d2[:,1,None]-e2*d1[:,1,None])*r[:,None]
+    tdir = (e2*d1[:,0,None]-e1*d2[:,0,None])*r[:,None]
+    n = len(p)
+    s = _accumulate(faces,sdir,n)
+    b = _accumulate(faces,tdir,n)
+    N = numpy.asarray(normals,dtype=numpy.float64)
+    # Gram-Schmidt: remove the part along the normal
+    s = _normalize(s-N*(N*s).sum(axis=1)[:,None])
+    w = numpy.where((numpy.cross(N,s)*b).sum(axis=1)<0,-1.0,1.0)
+    return numpy.hstack((s,w[:,None]))
+
+def interleave(*arrays):
+    """Returns one contiguous float32 array with the columns of each (n,k) array in turn"""
+    n = len(arrays[0])
+    out = numpy.empty((n,sum(a.shape[1] for a in arrays)),dtype=numpy.float32)
+    i = 0
+    for a in arrays:
+        out[:,i:i+a.shape[1]] = a
+        i += a.shape[1]
+    return out
+
+def bounds(positions):
+    """Returns the (lo,hi) corners of the axis aligned box around the points"""
+    p = numpy.asarray(positions,dtype=numpy.float32).reshape(-1,3)
+    return p.min(axis=0),p.max(axis=0)
+
+def bounding_sphere(positions):
+    """Returns (centre,radius) of a sphere around the points, centred on their box"""
+    p = numpy.asarray(positions,dtype=numpy.float32).reshape(-1,3)
+    lo,hi = bounds(p)
+    centre = (lo+hi)*0.5
+    return centre,float(numpy.sqrt(((p-centre)**2).sum(axis=1).max()))
+
+class Mesh(object):
+    """Positions, faces and the per-vertex data derived from them"""
+
+    def __init__(self,positions,faces,uvs=None,tangents=False):
+        self.positions = numpy.asarray(positions,dtype=numpy.float32).reshape(-1,3)
+        faces = numpy.asarray(faces)
+        self.faces = faces[:,:3].astype(numpy.uint32) # Only the first three corners are used
+        self.normals = vertex_normals(self.positions,self.faces)
+        self.uvs = None if uvs is None else numpy.asarray(uvs,dtype=numpy.float32).reshape(-1,2)
+        self.tangents = None
+        if tangents:
+            if self.uvs is None:
+                raise ValueError('Tangents need uvs')
+            self.tangents = vertex_tangents(self.positions,self.normals,self.uvs,self.faces)
+        self.attributes = []
+        offset = 0
+        for name,data in (('vertex',self.positions),('normal',self.normals),
+                          ('uv',self.uvs),('tangent',self.tangents)):
+            if data is not None:
+                self.attributes.append((name,data.shape[1],offset))
+                offset += 4*data.shape[1]
+        self.stride = offset
+
+    def vertices(self):
+        """Returns the interleaved float32 vertex data, in the order of self.attributes"""
+        return interleave(*[a for a in (self.positions,self.normals,self.uvs,self.tangents)
+                            if a is not None])
+
+    def pack(self,layout):
+        """Returns (data,dequantize) with the vertex data packed by a layout.VertexLayout"""
+        return layout.pack({'vertex':self.positions,'normal':self.normals,'uv':self.uvs,
+                            'tangent':self.tangents})
+
+    def optimize(self,cache_size=32):
+        """Reorders the faces for the post-transform vertex cache and the vertices into the
+        order the faces use them, returning the ACMR before and after"""
+        before = meshopt.acmr(self.faces,cache_size)
+        faces = meshopt.optimize_triangles(self.faces,len(self.positions),cache_size)
+        order,faces = meshopt.fetch_order(faces,len(self.positions))
+        for name in ('positions','normals','uvs','tangents'):
+            data = getattr(self,name)
+            if data is not None:
+                setattr(self,name,data[order])
+        self.faces = faces.astype(numpy.uint32)
+        return before,meshopt.acmr(self.faces,cache_size)
+
+    def indices(self,dtype=numpy.uint16):
+        """Returns the flattened vertex indices of the faces"""
+        return self.faces.astype(dtype).ravel()
+
+def index_dtype(vertex_count,uint=False):
+    """Returns the smallest unsigned type able to index vertex_count vertices.
+
+    32 bit indices are only returned if uint is True (GL_OES_element_index_uint is
+    supported), otherwise None is returned for meshes needing them."""
+    if vertex_count<=1<<8:
+        return numpy.uint8
+    if vertex_count<=1<<16:
+        return numpy.uint16
+    return numpy.uint32 if uint else None
+
+def _runs(faces,vertex_count,max_vertices,block=4096):
+    """Returns the end of each run of consecutive faces using at most max_vertices vertices"""
+    seen = numpy.zeros(vertex_count,dtype=bool)
+    ends = []
+    start = 0
+    while start<len(faces):
+        used = []
+        count = 0
+        i = start
+        while i<len(faces):
+            b = faces[i:i+block]
+            new = numpy.unique(b[~seen[b]])
+            if count+len(new)<=max_vertices:
+                seen[new] = True
+                used.append(new)
+                count += len(new)
+                i += len(b)
+                continue
+            # The run ends inside this block, so finish it a face at a time
+            for face in b:
+                new = set(v for v in face if not seen[v])
+                if count+len(new)>max_vertices:
+                    break
+                for v in new:
+                    seen[v] = True
+                used.append(numpy.array(list(new),dtype=faces.dtype))
+                count += len(new)
+                i += 1
+            break
+        for u in used:
+            seen[u] = False
+        ends.append(i)
+        start = i
+    return ends
+
+def split(faces,max_vertices=1<<16):
+    """Splits faces into runs each using at most max_vertices distinct vertices.
+
+    Returns a list of (vertices,faces) where vertices holds the original indices of the
+    vertices used by the run and faces indexes into it.  Vertices shared between runs are
+    duplicated, so the faces are split in their own order or, if that duplicates more,
+    sorted by their lowest vertex index, which keeps neighbouring faces together for
+    meshes whose vertices are numbered in a coherent order."""
+    faces = numpy.asarray(faces)
+    n = int(faces.max())+1 if len(faces) else 0
+    best = None
+    for order in (None,numpy.argsort(faces.min(axis=1),kind='mergesort')):
+        f = faces if order is None else faces[order]
+        chunks = []
+        start = 0
+        for end in _runs(f,n,max_vertices):
+            vertices,local = numpy.unique(f[start:end],return_inverse=True)
+            chunks.append((vertices,local.reshape(-1,faces.shape[1])))
+            start = end
+        total = sum(len(vertices) for vertices,local in chunks)
+        if best is None or total<best[0]:
+            best = (total,chunks)
+    return best[1]
@@ -0,0 +1,228 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Mesh optimisations that cut the number of times the vertex shader runs.
+#
+# vertices,faces = weld(vertices,faces)         merges identical vertices
+# faces = optimize_triangles(faces,len(vertices))   reorders faces for the vertex cache
+# order,faces = fetch_order(faces,len(vertices))    renumbers vertices in order of first use
+# acmr(faces)                                   average cache misses per triangle
+# indices = strip_indices(faces)                one GL_TRIANGLE_STRIP drawing the faces
+#
+# The GPU keeps the shaded results of the last few vertices in a post-transform cache, so
+# a triangle reusing recent vertices costs less.  ACMR counts the vertices shaded per
+# triangle: 3 for no reuse at all, about 0.5-0.7 for a well ordered regular mesh.
+#
+# mesh.Mesh.optimize() applies the reorders to every vertex attribute.
+#
+# Strips send about one index per triangle instead of three.  stripify grows strips
+# greedily across shared edges, and join_strips links them into one with degenerate
+# triangles (repeated indices), which the GPU discards without shading anything.
+#
+# NumPy is required.
+
+import collections
+import numpy
+
+def weld(vertices,faces):
+    """Merges vertices whose data is identical, returning the new vertices and faces.
+
+    vertices is an (n,k) array (positions, or all the per-vertex data interleaved).  The
+    vertices keep the order in which they first appear, and faces that become degenerate
+    are dropped."""
+    v = numpy.array(vertices)
+    if v.ndim==1:
+        v = v.reshape(len(v),-1)
+    if v.dtype.kind=='f':
+        v += 0.0 # Make -0.0 and 0.0 the same bytes
+    v = numpy.ascontiguousarray(v)
+    rows = v.view(numpy.dtype((numpy.void,v.dtype.itemsize*v.shape[1]))).ravel()
+    unique,first,inverse = numpy.unique(rows,return_index=True,return_inverse=True)
+    order = numpy.argsort(first)
+    rank = numpy.empty(len(order),dtype=numpy.int64)
+    rank[order] = numpy.arange(len(order))
+    faces = rank[inverse][numpy.asarray(faces)[:,:3]]
+    keep = ((faces[:,0]!=faces[:,1])&(faces[:,1]!=faces[:,2])&(faces[:,2]!=faces[:,0]))
+    return v[first[order]],faces[keep]
+
+def acmr(faces,cache_size=32):
+    """Returns the average number of vertices shaded per triangle with a FIFO cache"""
+    faces = numpy.asarray(faces)
+    if len(faces)==0:
+        return 0.0
+    cache = collections.deque()
+    cached = set()
+    misses = 0
+    for v in faces[:,:3].ravel().tolist():
+        if v in cached:
+            continue
+        misses += 1
+        cache.append(v)
+        cached.add(v)
+        if len(cache)>cache_size:
+            cached.discard(cache.popleft())
+    return float(misses)/len(faces)
+
+# Scoring from Tom Forsyth's "Linear-speed vertex cache optimisation"
+_cache_decay_power = 1.5
+_last_triangle_score = 0.75
+_valence_boost_scale = 2.0
+_valence_boost_power = 0.5
+
+def _score_tables(cache_size,max_valence=64):
+    cache = [0.0]*(cache_size+4)
+    for i in xrange(cache_size):
+        if i<3:
+            cache[i] = _last_triangle_score
+        else:
+            cache[i] = (1.0-(i-3)/float(cache_size-3))**_cache_decay_power
+    # Positions past the end of the cache (and -1, not cached) score nothing
+    valence = [0.0]+[_valence_boost_scale*n**-_valence_boost_power for n in xrange(1,max_valence)]
+    return cache,valence
+
+def optimize_triangles(faces,vertex_count,cache_size=32):
+    """Returns the faces reordered so consecutive faces share recently used vertices.
+
+    Each vertex is scored by its position in a simulated LRU cache and by how many of its
+    faces are still to be drawn; the face with the highest total score among those
+    touching the cache is drawn next.  This runs in Python at roughly 20k faces a second,
+    so it belongs in an offline or load time step, not in the frame loop."""
+    faces = numpy.asarray(faces)[:,:3]
+    F = len(faces)
+    if F==0:
+        return faces
+    cache_score,valence_score = _score_tables(cache_size)
+    max_valence = len(valence_score)-1
+    # Faces of each vertex, as slices of one array
+    flat = faces.ravel()
+    order = numpy.argsort(flat,kind='mergesort')
+    starts = numpy.zeros(vertex_count+1,dtype=numpy.int64)
+    starts[1:] = numpy.cumsum(numpy.bincount(flat,minlength=vertex_count))
+    adjacency = (order//3).tolist()
+    starts = starts.tolist()
+    tris = faces.tolist()
+    remaining = [starts[v+1]-starts[v] for v in xrange(vertex_count)]
+    position = [-1]*vertex_count
+
+    def vertex_score(v):
+        n = remaining[v]
+        if n==0:
+            return -1.0
+        p = position[v]
+        return (cache_score[p] if p>=0 else 0.0)+valence_score[min(n,max_valence)]
+
+    score = [vertex_score(v) for v in xrange(vertex_count)]
+    tri_score = [score[a]+score[b]+score[c] for a,b,c in tris]
+    emitted = [False]*F
+    out = []
+    cache = []
+    next_unemitted = 0
+    best = max(xrange(F),key=tri_score.__getitem__)
+    while True:
+        if best<0:
+            # Nothing touches the cache: carry on from the next face not yet drawn
+            while next_unemitted<F and emitted[next_unemitted]:
+                next_unemitted += 1
+            if next_unemitted==F:
+                break
+            best = next_unemitted
+        emitted[best] = True
+        tri = tris[best]
+        out.append(best)
+        for v in tri:
+            remaining[v] -= 1
+        # Move the face's vertices to the front of the cache
+        cache = tri+[v for v in cache if v not in tri]
+        for v in cache[cache_size:]:
+            position[v] = -1
+            score[v] = vertex_score(v)
+        del cache[cache_size:]
+        for i,v in enumerate(cache):
+            position[v] = i
+            score[v] = vertex_score(v)
+        # Rescore the faces touching the cache and pick the best of them
+        best = -1
+        best_score = -1.0
+        for v in cache:
+            for k in xrange(starts[v],starts[v+1]):
+                t = adjacency[k]
+                if emitted[t]:
+                    continue
+                a,b,c = tris[t]
+                s = tri_score[t] = score[a]+score[b]+score[c]
+                if s>best_score:
+                    best_score = s
+                    best = t
+    return faces[out]
+
+def fetch_order(faces,vertex_count):
+    """Returns (order,faces) numbering the vertices in the order the faces first use them.
+
+    vertices[order] gives the reordered vertex data; vertices no face uses are dropped."""
+    faces = numpy.asarray(faces)
+    used,first = numpy.unique(faces.ravel(),return_index=True)
+    order = used[numpy.argsort(first)]
+    remap = numpy.zeros(vertex_count,dtype=numpy.int64)
+    remap[order] = numpy.arange(len(order))
+    return order,remap[faces]
+
+def stripify(faces):
+    """Returns a list of triangle strips (lists of vertex indices) drawing the faces with
+    their winding kept.
+
+    Each strip starts at the first face not yet used, tried from each of its three edges,
+    and keeps the longest of the three.  Like optimize_triangles this is a Python loop
+    for load time, not the frame loop."""
+    tris = numpy.asarray(faces)[:,:3].tolist()
+    # The face on the left of each directed edge
+    edge_face = {}
+    for t,(a,b,c) in enumerate(tris):
+        edge_face[a,b] = edge_face[b,c] = edge_face[c,a] = t
+    used = [False]*len(tris)
+
+    def grow(strip,taken):
+        while True:
+            # Triangle k of a strip is v[k],v[k+1],v[k+2], reversed for odd k, so the
+            # next one's face holds the last edge in this direction
+            if len(strip)%2:
+                edge = strip[-1],strip[-2]
+            else:
+                edge = strip[-2],strip[-1]
+            t = edge_face.get(edge)
+            if t is None or used[t] or t in taken:
+                return strip,taken
+            a,b,c = tris[t]
+            strip.append(a+b+c-edge[0]-edge[1])
+            taken.append(t)
+
+    strips = []
+    for start in xrange(len(tris)):
+        if used[start]:
+            continue
+        a,b,c = tris[start]
+        best = None
+        for first in ((a,b,c),(b,c,a),(c,a,b)):
+            strip,taken = grow(list(first),[start])
+            if best is None or len(taken)>len(best[1]):
+                best = strip,taken
+        for t in best[1]:
+            used[t] = True
+        strips.append(best[0])
+    return strips
+
+def join_strips(strips):
+    """Returns one index array drawing every strip, linked by degenerate triangles"""
+    out = []
+    for strip in strips:
+        if out:
+            # Repeat the ends, and keep the next strip starting at an even position so
+            # its triangles keep their winding
+            out.append(out[-1])
+            if len(out)%2==0:
+                out.append(out[-1])
+            out.append(strip[0])
+        out.extend(strip)
+    return numpy.array(out,dtype=numpy.int64)
+
+def strip_indices(faces):
+    """Returns the indices of one triangle strip drawing the faces"""
+    return join_strips(stripify(faces))
@@ -0,0 +1,109 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Drawing many ranges of one buffer with one call.
+#
+# draw_elements(GL_TRIANGLES,counts,index_type,offsets)   ranges of the bound index buffer
+# draw_arrays(GL_TRIANGLES,firsts,counts)                 ranges of the bound vertex arrays
+#
+# With GL_EXT_multi_draw_arrays every range goes out in one glMultiDrawElementsEXT or
+# glMultiDrawArraysEXT.  Without it, list ranges that follow on from each other are merged
+# and drawn together.  For elements, given a copy of the index data, the ranges are instead
+# gathered into one index array in a stream.StreamBuffer and drawn with a single
+# glDrawElements (triangle strip ranges are joined with degenerate triangles), unless a
+# native vertex array object is bound.  Line strips, loops and fans cannot be joined, so
+# like everything else not gathered, each of their ranges gets its own call.
+#
+# Both return the number of draw calls made.
+#
+# NumPy is required.
+
+import ctypes
+import numpy
+from bindings import glDrawArrays, glDrawElements, glMultiDrawArraysEXT, glMultiDrawElementsEXT
+from gl2 import (GL_ELEMENT_ARRAY_BUFFER, GL_LINES, GL_POINTS, GL_TRIANGLES, GL_TRIANGLE_STRIP,
+                 GL_UNSIGNED_BYTE, GL_UNSIGNED_INT, GL_UNSIGNED_SHORT)
+import glinfo
+from glstate import gl_state
+import meshopt
+
+index_sizes = {GL_UNSIGNED_BYTE:1, GL_UNSIGNED_SHORT:2, GL_UNSIGNED_INT:4}
+
+# Ranges drawn with these modes can simply be run together
+list_modes = (GL_POINTS, GL_LINES, GL_TRIANGLES)
+
+# Ranges drawn with these modes can be gathered into one index array
+gather_modes = list_modes+(GL_TRIANGLE_STRIP,)
+
+_supported = None
+
+def supported():
+    global _supported
+    if _supported is None:
+        _supported = glinfo.has_extension('GL_EXT_multi_draw_arrays',glMultiDrawArraysEXT,
+                                          glMultiDrawElementsEXT)
+    return _supported
+
+def merge_ranges(firsts,counts):
+    """Returns (firsts,counts) with each range that starts where the previous one ends
+    merged into it"""
+    firsts = numpy.asarray(firsts,dtype=numpy.int64)
+    counts = numpy.asarray(counts,dtype=numpy.int64)
+    if len(firsts)<2:
+        return firsts,counts
+    starts = numpy.concatenate(([True],firsts[1:]!=firsts[:-1]+counts[:-1]))
+    i = numpy.nonzero(starts)[0]
+    return firsts[i],numpy.add.reduceat(counts,i)
+
+def draw_arrays(mode,firsts,counts,multi=None):
+    """Draws ranges of vertices from the vertex attributes set up"""
+    if multi is None:
+        multi = supported()
+    if multi and len(firsts)>1:
+        f = (ctypes.c_int*len(firsts))(*[int(x) for x in firsts])
+        c = (ctypes.c_int*len(counts))(*[int(x) for x in counts])
+        glMultiDrawArraysEXT(mode,f,c,len(firsts))
+        return 1
+    if mode in list_modes:
+        firsts,counts = merge_ranges(firsts,counts)
+    for first,count in zip(list(firsts),list(counts)):
+        glDrawArrays(mode,int(first),int(count))
+    return len(firsts)
+
+def gather(indices,firsts,counts,mode):
+    """Returns the index ranges (counted in indices, not bytes) of an index array as one
+    array, joining strips with degenerate triangles.  mode must be in gather_modes."""
+    if mode not in gather_modes:
+        raise ValueError('Ranges drawn with mode 0x%x cannot be gathered' % mode)
+    parts = [indices[f:f+c] for f,c in zip(firsts,counts)]
+    if mode==GL_TRIANGLE_STRIP:
+        return meshopt.join_strips(parts).astype(indices.dtype)
+    return numpy.concatenate(parts)
+
+def draw_elements(mode,counts,index_type,offsets,multi=None,indices=None,stream=None):
+    """Draws ranges of the bound index buffer, given their index counts and byte offsets.
+
+    indices (a copy of the buffer's index data) and stream (a StreamBuffer for
+    GL_ELEMENT_ARRAY_BUFFER) let the fallback gather the ranges into one draw."""
+    if multi is None:
+        multi = supported()
+    if multi and len(counts)>1:
+        c = (ctypes.c_int*len(counts))(*[int(x) for x in counts])
+        o = (ctypes.c_void_p*len(offsets))(*[int(x) for x in offsets])
+        glMultiDrawElementsEXT(mode,c,index_type,o,len(counts))
+        return 1
+    size = index_sizes[index_type]
+    firsts = numpy.asarray(offsets,dtype=numpy.int64)//size
+    if mode in list_modes:
+        firsts,counts = merge_ranges(firsts,counts)
+    # A bound vertex array object holds the element buffer, so only gather without one
+    if (len(firsts)>1 and mode in gather_modes and indices is not None and stream is not None
+            and not gl_state.vertex_array):
+        ebuf = gl_state.buffers.get(GL_ELEMENT_ARRAY_BUFFER)
+        data = gather(indices,list(firsts),list(counts),mode)
+        offset = stream.write(data)   # Binds the stream's buffer in place of ours
+        glDrawElements(mode,len(data),index_type,offset)
+        gl_state.bind_buffer(GL_ELEMENT_ARRAY_BUFFER,ebuf)
+        return 1
+    for first,count in zip(list(firsts),list(counts)):
+        glDrawElements(mode,int(count),index_type,int(first)*size)
+    return len(firsts)
@@ -0,0 +1,141 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# This file automatically extracts the function prototypes from the .h header files
+# and writes bindings.py, which gives every entry point its ctypes argtypes/restype.
+import os
+import re
+
+# C types used in the prototypes, and the ctypes type each one maps to
+ctypes_names = [
+    ('GLchar', 'ctypes.c_char'),
+    ('GLenum', 'ctypes.c_uint'),
+    ('GLboolean', 'ctypes.c_ubyte'),
+    ('GLbitfield', 'ctypes.c_uint'),
+    ('GLbyte', 'ctypes.c_byte'),
+    ('GLshort', 'ctypes.c_short'),
+    ('GLint', 'ctypes.c_int'),
+    ('GLsizei', 'ctypes.c_int'),
+    ('GLubyte', 'ctypes.c_ubyte'),
+    ('GLushort', 'ctypes.c_ushort'),
+    ('GLuint', 'ctypes.c_uint'),
+    ('GLfloat', 'ctypes.c_float'),
+    ('GLclampf', 'ctypes.c_float'),
+    ('GLfixed', 'ctypes.c_int'),
+    ('GLintptr', 'ctypes.c_ssize_t'),
+    ('GLsizeiptr', 'ctypes.c_ssize_t'),
+    ('GLeglImageOES', 'ctypes.c_void_p'),
+    ('EGLBoolean', 'ctypes.c_uint'),
+    ('EGLenum', 'ctypes.c_uint'),
+    ('EGLint', 'ctypes.c_int'),
+    ('EGLConfig', 'ctypes.c_void_p'),
+    ('EGLContext', 'ctypes.c_void_p'),
+    ('EGLDisplay', 'ctypes.c_void_p'),
+    ('EGLSurface', 'ctypes.c_void_p'),
+    ('EGLClientBuffer', 'ctypes.c_void_p'),
+    ('EGLNativeDisplayType', 'ctypes.c_void_p'),
+    ('EGLNativePixmapType', 'ctypes.c_void_p'),
+    ('EGLNativeWindowType', 'ctypes.c_void_p'),
+    ('EGLImageKHR', 'ctypes.c_void_p'),
+    ('EGLSyncKHR', 'ctypes.c_void_p'),
+    ('EGLTimeKHR', 'ctypes.c_uint64'),
+    ('EGLSyncNV', 'ctypes.c_void_p'),
+    ('EGLTimeNV', 'ctypes.c_uint64'),
+    ('EGLuint64NV', 'ctypes.c_uint64'),
+    ('__eglMustCastToProperFunctionPointerType', 'ctypes.c_void_p'),
+]
+known_types = dict(ctypes_names)
+
+prototype = re.compile(r'(GL_APICALL|EGLAPI)[ \t]+([\w \t\*]+?)\s*(?:(?:GL_APIENTRY|EGLAPIENTRY)\s+)?(\w+)\s*\(([^)]*)\)\s*;')
+
+def ctype(decl):
+    """Returns the ctypes name for a C declaration such as 'const GLchar* name'.
+
+    Strings become c_char_p so Python strings can be passed directly, every other
+    pointer becomes c_void_p which accepts ints, None, ctypes arrays and byref()."""
+    stars = decl.count('*')
+    tokens = decl.replace('*',' ').split()
+    const = 'const' in tokens
+    tokens = [t for t in tokens if t!='const']
+    base = tokens[0]
+    if stars==0:
+        if base=='void': return 'None'
+        if base=='int': return 'ctypes.c_int'
+        return base
+    if stars==1 and const and base in ('char','GLchar','GLubyte'):
+        return 'ctypes.c_char_p'
+    return 'ctypes.c_void_p'
+
+def extract(c_header_name):
+    """Returns a list of (name,restype,argtypes) for the prototypes in a .h file"""
+    with open(c_header_name) as c:
+        text = c.read()
+    text = re.sub(r'/\*.*?\*/','',text,flags=re.S)
+    functions = []
+    for m in prototype.finditer(text):
+        restype = ctype(m.group(2))
+        params = m.group(4).strip()
+        if params in ('','void'):
+            argtypes = []
+        else:
+            argtypes = [ctype(p) for p in params.split(',')]
+        for t in [restype]+argtypes:
+            assert t=='None' or t.startswith('ctypes.') or t in known_types, m.group(0)
+        functions.append((m.group(3),restype,argtypes))
+    return functions
+
+def write_bindings(py_name,libraries):
+    """Writes a module binding the functions of each (library variable,headers) pair"""
+    with open(py_name,'w') as py:
+        print >>py,'# This file is generated by prepare_bindings.py from the header files.  Do not edit.'
+        print >>py,'#'
+        print >>py,'# Every entry point has argtypes/restype set, so floats can be passed directly'
+        print >>py,'# and pointers are returned at full width.  Entry points the library does not'
+        print >>py,'# provide are looked up with eglGetProcAddress, or set to None if unavailable.'
+        print >>py,'import ctypes'
+        print >>py
+        for name,t in ctypes_names:
+            print >>py,name,'=',t
+        print >>py
+        print >>py,"opengles = ctypes.CDLL('libGLESv2.so')"
+        print >>py,"openegl = ctypes.CDLL('libEGL.so')"
+        print >>py
+        print >>py,'def _bind(lib,name,restype,argtypes):'
+        print >>py,'    """Returns the typed entry point, or None if it cannot be found"""'
+        print >>py,'    try:'
+        print >>py,'        f = getattr(lib,name)'
+        print >>py,'    except AttributeError:'
+        print >>py,'        address = eglGetProcAddress(name)'
+        print >>py,'        if not address:'
+        print >>py,'            return None'
+        print >>py,'        return ctypes.CFUNCTYPE(restype,*argtypes)(address)'
+        print >>py,'    f.restype = restype'
+        print >>py,'    f.argtypes = argtypes'
+        print >>py,'    return f'
+        print >>py
+        # eglGetProcAddress is needed by _bind, so bind it before anything else
+        print >>py,"eglGetProcAddress = openegl.eglGetProcAddress"
+        print >>py,"eglGetProcAddress.restype = ctypes.c_void_p"
+        print >>py,"eglGetProcAddress.argtypes = [ctypes.c_char_p]"
+        names = {}
+        for lib,headers in libraries:
+            print >>py
+            names[lib] = []
+            for header in headers:
+                for name,restype,argtypes in extract(header):
+                    if name in names[lib] or name=='eglGetProcAddress': continue
+                    names[lib].append(name)
+                    print >>py,"%s = _bind(%s,'%s',%s,[%s])" % (name,lib,name,restype,', '.join(argtypes))
+        print >>py
+        for lib,headers in libraries:
+            print >>py,'%s_functions = (' % lib
+            for name in names[lib]:
+                print >>py,"    '%s'," % name
+            print >>py,')'
+        print >>py
+        print >>py,"__all__ = ['opengles','openegl','opengles_functions','openegl_functions','eglGetProcAddress']"
+        for lib,headers in libraries:
+            print >>py,'__all__ += %s_functions' % lib
+
+write_bindings('bindings.py',
+               [('opengles',[os.path.join('GLES2','gl2.h'),os.path.join('GLES2','gl2ext.h')]),
+                ('openegl',[os.path.join('EGL','egl.h'),os.path.join('EGL','eglext.h')])])
@@ -1,21 +1,102 @@
 # Copyright (c) 2012 Peter de Rivaz
 #
 # This file automatically extracts useful information from the .h header files.
+#
+# The constants of every header are written into a single table module, constant_tables.py,
+# with one function per header that builds its name->value dict.  The function bodies are
+# compiled into the .pyc but only run when glconstants first needs that header, so importing
+# a header namespace such as gl2 costs nothing until one of its constants is used.
+import os
 import re
-def extract(c_header_name,py_name):
-    """Extracts useful information from a .h file into a .py file"""
+
+define = re.compile(r'^\s*#\s*define\s+(\w+)\s+(.+)$')
+cast = re.compile(r'\(\s*([A-Za-z_]\w*)\s*\*?\s*\)')
+suffix = re.compile(r'\b(0[xX][0-9a-fA-F]+|\d+)[uUlL]+\b')
+identifier = re.compile(r'\b[A-Za-z_]\w*\b')
+
+def evaluate(expr,values):
+    """Returns the integer value of a #define expression, or None if it is not a constant.
+
+    Handles hex and decimal literals with u/l suffixes, casts such as ((EGLint)-1),
+    references to earlier defines and simple arithmetic."""
+    expr = expr.split('//')[0].strip()
+    expr = cast.sub(lambda m: '' if m.group(1) not in values else m.group(0),expr)
+    expr = suffix.sub(r'\1',expr)
+    missing = [name for name in identifier.findall(expr)
+               if name not in values and not re.match(r'0[xX]',name)]
+    if missing or not expr:
+        return None
+    try:
+        v = eval(expr,{'__builtins__':{}},dict(values))
+    except Exception:
+        return None
+    if isinstance(v,bool) or not isinstance(v,(int,long)):
+        return None
+    return v
+
+def extract(c_header_name):
+    """Returns a list of (name,source text,value) for the integer #defines in a .h file.
+
+    Extension feature macros (a #define immediately following its own #ifndef guard, such
+    as GL_OES_mapbuffer) are skipped.  The unguarded version macros, such as EGL_VERSION_1_4
+    and GL_ES_VERSION_2_0, are kept with their value of 1."""
+    with open(c_header_name) as c:
+        text = re.sub(r'/\*.*?\*/','',c.read(),flags=re.S)
+    values = {}
+    constants = []
+    guard = None
+    for line in text.splitlines():
+        A = line.split()
+        if len(A)==2 and A[0]=='#ifndef':
+            guard = A[1]
+            continue
+        m = define.match(line)
+        if m is None:
+            if A: guard = None
+            continue
+        name,expr = m.group(1),m.group(2).strip()
+        if name==guard:
+            continue
+        guard = None
+        v = evaluate(expr,values)
+        if v is None:
+            continue
+        values[name] = v
+        if re.match(r'^0[xX][0-9a-fA-F]+$',expr):
+            constants.append((name,expr,v))
+        else:
+            constants.append((name,str(v),v))
+    return constants
+
+def write_tables(py_name,headers):
+    """Writes one table function per (api,header) pair into a single module"""
+    with open(py_name,'w') as py:
+        print >>py,'# This file is generated by prepare_constants.py from the header files.  Do not edit.'
+        print >>py,'# Use glconstants, or the per header modules such as gl2, to access these tables.'
+        for api,header in headers:
+            print >>py
+            print >>py,'def %s():' % api
+            print >>py,'    return {'
+            for name,source,v in extract(header):
+                print >>py,"        '%s': %s," % (name,source)
+            print >>py,'    }'
+
+def write_namespace(py_name,api):
+    """Writes a module that lazily exposes the constants of one header"""
     with open(py_name,'w') as py:
-        with open(c_header_name) as c:
-            for line in c.readlines():
-                A=line.split()
-                if len(A)<3: continue
-                if A[0]!='#define': continue
-                if A[2][0:2]!= '0x': continue
-                print >>py,A[1],'=',A[2]
-            
-
-extract('EGL\egl.h','egl.py')
-extract('GLES2\gl2.h','gl2.py')
-extract('GLES2\gl2ext.h','gl2ext.py')
-extract('GLES\gl.h','gl.py')
-extract('GLES\glext.h','glext.py')
+        print >>py,'# This file is generated by prepare_constants.py.  Do not edit.'
+        print >>py,'# The constants are loaded from constant_tables.py on first use.'
+        print >>py,'import glconstants'
+        print >>py,"glconstants.install(__name__,'%s')" % api
+
+headers = [('egl',os.path.join('EGL','egl.h')),
+           ('eglext',os.path.join('EGL','eglext.h')),
+           ('gl2',os.path.join('GLES2','gl2.h')),
+           ('gl2ext',os.path.join('GLES2','gl2ext.h')),
+           ('gl',os.path.join('GLES','gl.h')),
+           ('glext',os.path.join('GLES','glext.h'))]
+
+if __name__ == "__main__":
+    write_tables('constant_tables.py',headers)
+    for api,header in headers:
+        write_namespace(api+'.py',api)
@@ -0,0 +1,413 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Linked shader programs with cached uniform locations and values.
+#
+# p = Program(program)         introspects the active uniforms and attributes once
+# p.use()
+# p['offset'] = (x,y)          only calls glUniform2f if the value changed
+# p['view'] = matrix           matrices can be nested lists or float32 buffers
+#
+# Uniforms the compiler optimised away are not active, so setting them is ignored, just as
+# OpenGLES ignores location -1.
+#
+# program_cache.get(vertex_source,fragment_source,{'vertex':0}) returns a Program, compiling
+# each source pair only once per process.  With GL_OES_get_program_binary the linked binary
+# is also kept on disk, so later runs skip compiling and linking altogether.
+#
+# program_cache.get_many([(vs,fs1),(vs,fs2)]) builds a whole scene's programs at once:
+# everything is submitted before the first status query, so the driver is never made to
+# finish one shader before the next is handed over.  program_cache.timings lists the time
+# spent submitting and waiting for each shader and program.
+
+import array
+import ctypes
+import hashlib
+import itertools
+import os
+import struct
+import time
+from bindings import (glAttachShader, glBindAttribLocation, glCompileShader, glCreateProgram,
+                      glCreateShader, glDeleteProgram, glDeleteShader, glGetActiveAttrib,
+                      glGetActiveUniform, glGetAttribLocation, glGetError, glGetProgramBinaryOES,
+                      glGetProgramInfoLog, glGetProgramiv, glGetShaderInfoLog, glGetShaderiv,
+                      glGetUniformLocation, glLinkProgram, glProgramBinaryOES, glShaderSource,
+                      glUniform1f, glUniform1i, glUniform2f, glUniform2i, glUniform3f,
+                      glUniform3i, glUniform4f, glUniform4i)
+from gl2 import (GL_ACTIVE_ATTRIBUTES, GL_ACTIVE_ATTRIBUTE_MAX_LENGTH, GL_ACTIVE_UNIFORMS,
+                 GL_ACTIVE_UNIFORM_MAX_LENGTH, GL_BOOL, GL_BOOL_VEC2, GL_BOOL_VEC3,
+                 GL_BOOL_VEC4, GL_COMPILE_STATUS, GL_FLOAT, GL_FLOAT_MAT2, GL_FLOAT_MAT3,
+                 GL_FLOAT_MAT4, GL_FLOAT_VEC2, GL_FLOAT_VEC3, GL_FLOAT_VEC4,
+                 GL_FRAGMENT_SHADER, GL_INFO_LOG_LENGTH, GL_INT, GL_INT_VEC2, GL_INT_VEC3,
+                 GL_INT_VEC4, GL_LINK_STATUS, GL_SAMPLER_2D, GL_SAMPLER_CUBE,
+                 GL_VERTEX_SHADER)
+from gl2ext import GL_NUM_PROGRAM_BINARY_FORMATS_OES, GL_PROGRAM_BINARY_LENGTH_OES
+import glerror
+import glinfo
+from glstate import gl_state
+from upload import data_pointer, uniform_fv, uniform_iv, uniform_matrix_fv
+
+# GL uniform type -> (float values?, components, glUniform* for a single value)
+uniform_types = {
+    GL_FLOAT: (True,1,glUniform1f),
+    GL_FLOAT_VEC2: (True,2,glUniform2f),
+    GL_FLOAT_VEC3: (True,3,glUniform3f),
+    GL_FLOAT_VEC4: (True,4,glUniform4f),
+    GL_INT: (False,1,glUniform1i),
+    GL_INT_VEC2: (False,2,glUniform2i),
+    GL_INT_VEC3: (False,3,glUniform3i),
+    GL_INT_VEC4: (False,4,glUniform4i),
+    GL_BOOL: (False,1,glUniform1i),
+    GL_BOOL_VEC2: (False,2,glUniform2i),
+    GL_BOOL_VEC3: (False,3,glUniform3i),
+    GL_BOOL_VEC4: (False,4,glUniform4i),
+    GL_SAMPLER_2D: (False,1,glUniform1i),
+    GL_SAMPLER_CUBE: (False,1,glUniform1i),
+    GL_FLOAT_MAT2: (True,4,None),
+    GL_FLOAT_MAT3: (True,9,None),
+    GL_FLOAT_MAT4: (True,16,None),
+}
+
+matrix_sizes = {GL_FLOAT_MAT2:2, GL_FLOAT_MAT3:3, GL_FLOAT_MAT4:4}
+
+class Uniform(object):
+    """An active uniform: its location, GL type, array size and the last value sent"""
+
+    def __init__(self,name,location,type,size):
+        self.name = name
+        self.location = location
+        self.type = type
+        self.size = size
+        self.value = None
+
+def _active(program,count,max_length,get_active):
+    """Yields (name,size,type) for the active uniforms or attributes of a program"""
+    n = ctypes.c_int()
+    glGetProgramiv(program,count,ctypes.byref(n))
+    N = ctypes.c_int()
+    glGetProgramiv(program,max_length,ctypes.byref(N))
+    name = ctypes.create_string_buffer(max(N.value,1))
+    length = ctypes.c_int()
+    size = ctypes.c_int()
+    type = ctypes.c_uint()
+    for i in xrange(n.value):
+        get_active(program,i,len(name),ctypes.byref(length),ctypes.byref(size),
+                   ctypes.byref(type),name)
+        yield name.value,size.value,type.value
+
+class Program(object):
+    """A linked program whose uniforms are only uploaded when their value changes.
+
+    Setting a uniform makes the program current (glUniform acts on the current program),
+    and leaves it current."""
+
+    def __init__(self,program):
+        self.program = program
+        self.issued = 0 # glUniform calls made
+        self.elided = 0 # glUniform calls skipped because the value was unchanged
+        self.uniforms = {}
+        for name,size,type in _active(program,GL_ACTIVE_UNIFORMS,GL_ACTIVE_UNIFORM_MAX_LENGTH,
+                                      glGetActiveUniform):
+            if name.endswith('[0]'):
+                name = name[:-3]
+            self.uniforms[name] = Uniform(name,glGetUniformLocation(program,name),type,size)
+        self.attributes = {}
+        for name,size,type in _active(program,GL_ACTIVE_ATTRIBUTES,GL_ACTIVE_ATTRIBUTE_MAX_LENGTH,
+                                      glGetActiveAttrib):
+            self.attributes[name] = glGetAttribLocation(program,name)
+
+    def use(self):
+        """Makes this program current"""
+        gl_state.use_program(self.program)
+
+    def __setitem__(self,name,value):
+        """Sets a uniform from a number, a sequence (matrices may be nested) or a buffer"""
+        u = self.uniforms.get(name)
+        if u is None:
+            return
+        is_float,components,setter = uniform_types[u.type]
+        number = float if is_float else int
+        if isinstance(value,(int,long,float)):
+            key = number(value)
+        elif isinstance(value,(tuple,list)):
+            if value and isinstance(value[0],(tuple,list)):
+                value = tuple(itertools.chain(*value))
+            key = tuple(number(x) for x in value)
+        else:
+            # Comparing the raw bytes is a single memcmp, however large the matrix array
+            address,n,t,owner = data_pointer(value)
+            key = ctypes.string_at(address,n)
+        if key==u.value:
+            self.elided += 1
+            return
+        gl_state.use_program(self.program)
+        if isinstance(key,(int,long,float)):
+            setter(u.location,key)
+        elif isinstance(key,tuple):
+            if setter is not None and len(key)==components:
+                setter(u.location,*key)
+            else:
+                data = array.array('f' if is_float else 'i',key)
+                self._upload(u,data,is_float,components)
+        else:
+            self._upload(u,value,is_float,components)
+        # Only remembered once sent, so a failed upload is retried next time
+        u.value = key
+        self.issued += 1
+
+    def _upload(self,u,data,is_float,components):
+        if u.type in matrix_sizes:
+            uniform_matrix_fv(u.location,data,matrix_sizes[u.type])
+        elif is_float:
+            uniform_fv(u.location,data,components)
+        else:
+            uniform_iv(u.location,data,components)
+
+    def __getitem__(self,name):
+        """Returns the last value set for a uniform (a buffer value is returned as bytes)"""
+        return self.uniforms[name].value
+
+    def forget(self):
+        """Forgets the cached values, e.g. after setting uniforms with the raw bindings"""
+        for u in self.uniforms.itervalues():
+            u.value = None
+
+class ShaderError(ValueError):
+    """Raised when a shader fails to compile or a program fails to link"""
+
+def _get(getiv,obj,pname):
+    v = ctypes.c_int()
+    getiv(obj,pname,ctypes.byref(v))
+    return v.value
+
+def _log(getiv,getlog,obj):
+    """Returns the info log of a shader or program, sized by GL_INFO_LOG_LENGTH"""
+    n = _get(getiv,obj,GL_INFO_LOG_LENGTH)
+    if n<=0:
+        return ''
+    log = ctypes.create_string_buffer(n)
+    getlog(obj,n,None,log)
+    return log.value
+
+def _submit_shader(type,source):
+    shader = glCreateShader(type)
+    glShaderSource(shader,1,ctypes.byref(ctypes.c_char_p(source)),None)
+    glCompileShader(shader)
+    return shader
+
+def _submit_program(shaders,attributes):
+    program = glCreateProgram()
+    for shader in shaders:
+        glAttachShader(program,shader)
+    for name,location in (attributes or {}).iteritems():
+        glBindAttribLocation(program,location,name)
+    glLinkProgram(program)
+    return program
+
+def compile_shader(type,source):
+    """Compiles a shader from a source string, raising ShaderError on failure"""
+    shader = _submit_shader(type,source)
+    if not _get(glGetShaderiv,shader,GL_COMPILE_STATUS):
+        raise ShaderError(_log(glGetShaderiv,glGetShaderInfoLog,shader))
+    return shader
+
+def link_program(shaders,attributes=None):
+    """Links compiled shaders, binding the given {name:location} attributes first"""
+    program = _submit_program(shaders,attributes)
+    if not _get(glGetProgramiv,program,GL_LINK_STATUS):
+        raise ShaderError(_log(glGetProgramiv,glGetProgramInfoLog,program))
+    return program
+
+shader_kinds = {GL_VERTEX_SHADER:'vertex', GL_FRAGMENT_SHADER:'fragment'}
+
+def _label(kind,text):
+    return '%s %s' % (kind,hashlib.sha1(text).hexdigest()[:8])
+
+class ProgramCache(object):
+    """Programs keyed by their sources, attribute bindings and the driver version.
+
+    Each shader source is compiled at most once per process, and each source pair is
+    linked at most once.  If directory is given and the driver supports
+    GL_OES_get_program_binary, linked binaries are stored there and reloaded with
+    glProgramBinaryOES, falling back to compiling when the driver rejects a binary."""
+
+    magic = 'PYGLESPB'
+
+    def __init__(self,directory=None):
+        self.directory = directory
+        self.programs = {} # key -> Program
+        self.shaders = {}  # (type,source) -> shader
+        self.compiled = 0  # Shaders compiled
+        self.linked = 0    # Programs linked from source
+        self.loaded = 0    # Programs loaded from a binary on disk
+        self.timings = []  # (label,seconds to submit,seconds waiting for the result)
+        self._driver = None
+
+    def key(self,vertex_source,fragment_source,attributes=None):
+        if self._driver is None:
+            self._driver = glinfo.driver_version()
+        h = hashlib.sha1()
+        for part in (self._driver,vertex_source,fragment_source,
+                     repr(sorted((attributes or {}).items()))):
+            h.update(part)
+            h.update('\0')
+        return h.hexdigest()
+
+    def binaries_supported(self):
+        return (self.directory is not None and
+                glinfo.has_extension('GL_OES_get_program_binary',glGetProgramBinaryOES,
+                                     glProgramBinaryOES) and
+                glinfo.get_integer(GL_NUM_PROGRAM_BINARY_FORMATS_OES)>0)
+
+    def shader(self,type,source):
+        """Returns a compiled shader, compiling it only the first time a source is seen"""
+        shader = self.shaders.get((type,source))
+        if shader is None:
+            t = time.time()
+            shader = self.shaders[type,source] = compile_shader(type,source)
+            self.timings.append((_label(shader_kinds[type],source),time.time()-t,0.0))
+            self.compiled += 1
+        return shader
+
+    def get(self,vertex_source,fragment_source,attributes=None):
+        """Returns the Program for a pair of sources, building it if needed"""
+        return self.get_many([(vertex_source,fragment_source,attributes)])[0]
+
+    def get_many(self,sources):
+        """Returns the Programs for a list of (vertex,fragment) or (vertex,fragment,attributes).
+
+        Every new shader and program is submitted before any status is queried, so the
+        driver can compile one shader while the next is being submitted.  Logs are only
+        fetched for failures, which are all reported in a single ShaderError; the programs
+        that did build are kept."""
+        requests = []
+        pending = {} # key -> (vertex,fragment,attributes) still to be linked
+        order = []
+        binaries = self.binaries_supported()
+        for s in sources:
+            attributes = s[2] if len(s)>2 else None
+            key = self.key(s[0],s[1],attributes)
+            requests.append(key)
+            if key in self.programs or key in pending:
+                continue
+            program = self._load(key) if binaries else None
+            if program is not None:
+                self.loaded += 1
+                self.programs[key] = Program(program)
+                continue
+            pending[key] = (s[0],s[1],attributes)
+            order.append(key)
+
+        # Submit every shader that has not been compiled before, then every link
+        submitted = {} # (type,source) -> (shader,seconds to submit)
+        compiles = []  # (type,source) in the order submitted
+        for key in order:
+            vertex_source,fragment_source,attributes = pending[key]
+            for type,source in ((GL_VERTEX_SHADER,vertex_source),(GL_FRAGMENT_SHADER,fragment_source)):
+                if (type,source) in self.shaders or (type,source) in submitted:
+                    continue
+                t = time.time()
+                shader = _submit_shader(type,source)
+                submitted[type,source] = (shader,time.time()-t)
+                compiles.append((type,source))
+        links = []
+        for key in order:
+            vertex_source,fragment_source,attributes = pending[key]
+            shaders = [(self.shaders.get(k) or submitted[k][0]) for k in
+                       ((GL_VERTEX_SHADER,vertex_source),(GL_FRAGMENT_SHADER,fragment_source))]
+            t = time.time()
+            program = _submit_program(shaders,attributes)
+            links.append((key,program,time.time()-t))
+
+        # Only now wait for the results, in the order they were submitted
+        errors = []
+        failed = set()
+        for type,source in compiles:
+            shader,submit = submitted[type,source]
+            label = _label(shader_kinds[type],source)
+            t = time.time()
+            ok = _get(glGetShaderiv,shader,GL_COMPILE_STATUS)
+            self.timings.append((label,submit,time.time()-t))
+            if ok:
+                self.shaders[type,source] = shader
+                self.compiled += 1
+            else:
+                errors.append('%s failed to compile:\n%s' %
+                              (label,_log(glGetShaderiv,glGetShaderInfoLog,shader)))
+                failed.add((type,source))
+                glDeleteShader(shader)
+        for key,program,submit in links:
+            vertex_source,fragment_source,attributes = pending[key]
+            if (GL_VERTEX_SHADER,vertex_source) in failed or (GL_FRAGMENT_SHADER,fragment_source) in failed:
+                glDeleteProgram(program) # Already reported by the compile error
+                continue
+            label = _label('program',key)
+            t = time.time()
+            ok = _get(glGetProgramiv,program,GL_LINK_STATUS)
+            self.timings.append((label,submit,time.time()-t))
+            if not ok:
+                errors.append('%s failed to link:\n%s' %
+                              (label,_log(glGetProgramiv,glGetProgramInfoLog,program)))
+                glDeleteProgram(program)
+                continue
+            self.linked += 1
+            if binaries:
+                self._save(key,program)
+            self.programs[key] = Program(program)
+        if errors:
+            raise ShaderError('\n'.join(errors))
+        return [self.programs[key] for key in requests]
+
+    def _path(self,key):
+        return os.path.join(self.directory,key+'.bin')
+
+    def _load(self,key):
+        """Returns a program created from the stored binary, or None"""
+        try:
+            with open(self._path(key),'rb') as f:
+                data = f.read()
+        except IOError:
+            return None
+        header = len(self.magic)+4
+        if len(data)<header or not data.startswith(self.magic):
+            return None
+        format, = struct.unpack('<I',data[len(self.magic):header])
+        binary = data[header:]
+        # Errors the caller left pending are theirs, so report them before ours can appear
+        if glerror.policy!=glerror.OFF:
+            glerror.check()
+        first_error = glerror.first_error
+        program = glCreateProgram()
+        try:
+            glProgramBinaryOES(program,format,binary,len(binary))
+        except glerror.GLError:
+            glerror.first_error = first_error # A rejected binary is not the caller's error
+        else:
+            if glerror.policy==glerror.FRAME:
+                glGetError() # Clear the error a rejected binary leaves before the frame check
+        if _get(glGetProgramiv,program,GL_LINK_STATUS):
+            return program
+        glDeleteProgram(program)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+        return None
+
+    def _save(self,key,program):
+        n = _get(glGetProgramiv,program,GL_PROGRAM_BINARY_LENGTH_OES)
+        if n<=0:
+            return
+        binary = ctypes.create_string_buffer(n)
+        length = ctypes.c_int()
+        format = ctypes.c_uint()
+        glGetProgramBinaryOES(program,n,ctypes.byref(length),ctypes.byref(format),binary)
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        # Write to a temporary file first so a crash never leaves a truncated binary
+        path = self._path(key)
+        with open(path+'.tmp','wb') as f:
+            f.write(self.magic+struct.pack('<I',format.value)+binary.raw[:length.value])
+        os.rename(path+'.tmp',path)
+
+# The programs for the current context, with binaries kept in the user's cache directory
+program_cache = ProgramCache(os.path.join(os.path.expanduser('~'),'.cache','pyopengles'))
@@ -12,26 +12,35 @@
 import ctypes
 import time
 import math
-# Pick up our constants extracted from the header files with prepare_constants.py
-from egl import *
-from gl2 import *
-from gl2ext import *
+# Pick up our constants extracted from the header files with prepare_constants.py.
+# Each header's table is only loaded when the first of its names is imported.
+from egl import (EGL_ALPHA_SIZE, EGL_BLUE_SIZE, EGL_CONTEXT_CLIENT_VERSION,
+                 EGL_DEFAULT_DISPLAY, EGL_DEPTH_SIZE, EGL_GREEN_SIZE, EGL_NONE,
+                 EGL_NO_CONTEXT, EGL_NO_DISPLAY, EGL_NO_SURFACE, EGL_OPENGL_ES_API,
+                 EGL_RED_SIZE, EGL_SURFACE_TYPE, EGL_WINDOW_BIT)
+from gl2 import (GL_ARRAY_BUFFER, GL_COLOR_ATTACHMENT0, GL_COLOR_BUFFER_BIT,
+                 GL_DEPTH_BUFFER_BIT, GL_FLOAT, GL_FRAGMENT_SHADER, GL_FRAMEBUFFER,
+                 GL_NEAREST, GL_RGB, GL_STATIC_DRAW, GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER,
+                 GL_TEXTURE_MIN_FILTER, GL_TRIANGLE_FAN, GL_UNSIGNED_BYTE,
+                 GL_UNSIGNED_SHORT_5_6_5, GL_VERTEX_SHADER)
+import glconstants
 import pymouse
+from frames import FrameScheduler
 
 # Define verbose=True to get debug messages
 verbose = True
 
-# Define some extra constants that the automatic extraction misses
-EGL_DEFAULT_DISPLAY = 0
-EGL_NO_CONTEXT = 0
-EGL_NO_DISPLAY = 0
-EGL_NO_SURFACE = 0
+# Define some extra constants that are not in the header files
 DISPMANX_PROTECTION_NONE = 0
 
-# Open the libraries
+# Open the libraries.  The OpenGLES and EGL entry points come typed from bindings.py,
+# which is generated from the header files by prepare_bindings.py
 bcm = ctypes.CDLL('libbcm_host.so')
-opengles = ctypes.CDLL('libGLESv2.so')
-openegl = ctypes.CDLL('libEGL.so')
+from bindings import *
+import glerror
+from glstate import gl_state
+from program import Program, program_cache
+from upload import buffer_data, buffer_sub_data, tex_image_2d, uniform_fv, uniform_iv, uniform_matrix_fv
 
 eglint = ctypes.c_int
 
@@ -59,9 +68,9 @@ class EGL(object):
         """Opens up the OpenGL library and prepares a window for display"""
         b = bcm.bcm_host_init()
         assert b==0
-        self.display = openegl.eglGetDisplay(EGL_DEFAULT_DISPLAY)
+        self.display = eglGetDisplay(EGL_DEFAULT_DISPLAY)
         assert self.display
-        r = openegl.eglInitialize(self.display,0,0)
+        r = eglInitialize(self.display,0,0)
         assert r
         if depthbuffer:
             attribute_list = eglints(     (EGL_RED_SIZE, 8,
@@ -83,20 +92,20 @@ class EGL(object):
                                                                     
         numconfig = eglint()
         config = ctypes.c_void_p()
-        r = openegl.eglChooseConfig(self.display,
+        r = eglChooseConfig(self.display,
                                      ctypes.byref(attribute_list),
                                      ctypes.byref(config), 1,
                                      ctypes.byref(numconfig));
         assert r
-        r = openegl.eglBindAPI(EGL_OPENGL_ES_API)
+        r = eglBindAPI(EGL_OPENGL_ES_API)
         assert r
         if verbose:
             print 'numconfig=',numconfig
         context_attribs = eglints( (EGL_CONTEXT_CLIENT_VERSION, 2, EGL_NONE) )
-        self.context = openegl.eglCreateContext(self.display, config,
+        self.context = eglCreateContext(self.display, config,
                                         EGL_NO_CONTEXT,
                                         ctypes.byref(context_attribs))
-        assert self.context != EGL_NO_CONTEXT
+        assert self.context
         width = eglint()
         height = eglint()
         s = bcm.graphics_get_display_size(0,ctypes.byref(width),ctypes.byref(height))
@@ -118,35 +127,26 @@ class EGL(object):
         nativewindow = eglints((dispman_element,width,height));
         nw_p = ctypes.pointer(nativewindow)
         self.nw_p = nw_p
-        self.surface = openegl.eglCreateWindowSurface( self.display, config, nw_p, 0)
-        assert self.surface != EGL_NO_SURFACE
-        r = openegl.eglMakeCurrent(self.display, self.surface, self.surface, self.context)
+        self.surface = eglCreateWindowSurface( self.display, config, nw_p, 0)
+        assert self.surface
+        r = eglMakeCurrent(self.display, self.surface, self.surface, self.context)
         assert r
 
-class demo():
+    def swap_buffers(self):
+        """Makes the frame drawn visible, checking for GL errors once per frame unless
+        glerror.policy is OFF"""
+        glerror.check_frame()
+        gl_state.end_frame()
+        eglSwapBuffers(self.display, self.surface)
 
-    def showlog(self,shader):
-        """Prints the compile log for a shader"""
-        N=1024
-        log=(ctypes.c_char*N)()
-        loglen=ctypes.c_int()
-        opengles.glGetShaderInfoLog(shader,N,ctypes.byref(loglen),ctypes.byref(log))
-        print log.value
+class demo():
 
-    def showprogramlog(self,shader):
-        """Prints the compile log for a program"""
-        N=1024
-        log=(ctypes.c_char*N)()
-        loglen=ctypes.c_int()
-        opengles.glGetProgramInfoLog(shader,N,ctypes.byref(loglen),ctypes.byref(log))
-        print log.value
-            
     def __init__(self):
         self.vertex_data = eglfloats((-1.0,-1.0,1.0,1.0,
                          1.0,-1.0,1.0,1.0,
                          1.0,1.0,1.0,1.0,
                          -1.0,1.0,1.0,1.0))
-        self.vshader_source = ctypes.c_char_p(
+        self.vshader_source = (
               "attribute vec4 vertex;"
               "varying vec2 tcoord;"
               "void main(void) {"
@@ -156,14 +156,14 @@ class demo():
               "  tcoord = vertex.xy*0.5+0.5;"
               "}")
       
-        self.fshader_source = ctypes.c_char_p(
+        self.fshader_source = (
               "uniform vec4 color;"
               "void main(void) {"
               "   gl_FragColor = color;"
               "}")
 
         # Mandelbrot
-        mandelbrot_fshader_source = ctypes.c_char_p("""
+        mandelbrot_fshader_source = """
 	uniform vec4 color;
 	uniform vec2 scale;
 	varying vec2 tcoord;
@@ -197,10 +197,10 @@ class demo():
                 }
 	        color2 = vec4(float(i)*0.0625,0,0,1);
 		gl_FragColor = color2;
-	}""")
+	}"""
 
         # Julia
-        julia_fshader_source = ctypes.c_char_p("""
+        julia_fshader_source = """
 	uniform vec4 color;
 	uniform vec2 scale;
 	uniform vec2 offset;
@@ -243,181 +243,125 @@ class demo():
 	        color2 = vec4(col,float(i)*0.0625,0,1);
 	        color2 = color2+texture2D(tex,t2);
 		gl_FragColor = color2;
-	}""")
-
-        vshader = opengles.glCreateShader(GL_VERTEX_SHADER);
-        opengles.glShaderSource(vshader, 1, ctypes.byref(self.vshader_source), 0)
-        opengles.glCompileShader(vshader);
-
-        if verbose:
-            self.showlog(vshader)
-            
-        fshader = opengles.glCreateShader(GL_FRAGMENT_SHADER);
-        opengles.glShaderSource(fshader, 1, ctypes.byref(julia_fshader_source), 0);
-        opengles.glCompileShader(fshader);
-
-        if verbose:
-            self.showlog(fshader)
-
-        mshader = opengles.glCreateShader(GL_FRAGMENT_SHADER);
-        opengles.glShaderSource(mshader, 1, ctypes.byref(mandelbrot_fshader_source), 0);
-        opengles.glCompileShader(mshader);
-
+	}"""
+
+        # Both programs share the vertex shader, which the cache only compiles once, and
+        # bind "vertex" to the same location so they can share the attribute setup
+        self.program,self.program2 = program_cache.get_many(
+            [(self.vshader_source, julia_fshader_source, {"vertex":0}),
+             (self.vshader_source, mandelbrot_fshader_source, {"vertex":0})])
+        self.attr_vertex = self.program.attributes["vertex"]
+        self.attr_vertex2 = self.program2.attributes["vertex"]
         if verbose:
-            self.showlog(mshader)
-
-        program = opengles.glCreateProgram();
-        opengles.glAttachShader(program, vshader);
-        opengles.glAttachShader(program, fshader);
-        opengles.glLinkProgram(program);
-
-        if verbose:
-            self.showprogramlog(program)
-            
-        self.program = program
-        self.unif_color = opengles.glGetUniformLocation(program, "color");
-        self.attr_vertex = opengles.glGetAttribLocation(program, "vertex");
-        self.unif_scale = opengles.glGetUniformLocation(program, "scale");
-        self.unif_offset = opengles.glGetUniformLocation(program, "offset");
-        self.unif_tex = opengles.glGetUniformLocation(program, "tex");
-        
-
-        program2 = opengles.glCreateProgram();
-        opengles.glAttachShader(program2, vshader);
-        opengles.glAttachShader(program2, mshader);
-        opengles.glLinkProgram(program2);
-
-        if verbose:
-            self.showprogramlog(program2)
-            
-        self.program2 = program2
-        self.attr_vertex2 = opengles.glGetAttribLocation(program2, "vertex");
-        self.unif_scale2 = opengles.glGetUniformLocation(program2, "scale");
-        self.unif_offset2 = opengles.glGetUniformLocation(program2, "offset");
+            print 'shaders compiled',program_cache.compiled,'programs loaded from disk',program_cache.loaded
+            for label,submit,wait in program_cache.timings:
+                print '%-20s submit %.2fms wait %.2fms' % (label,submit*1e3,wait*1e3)
    
-        opengles.glClearColor ( eglfloat(0.0), eglfloat(1.0), eglfloat(1.0), eglfloat(1.0) );
+        glClearColor ( 0.0, 1.0, 1.0, 1.0 );
         
-        self.buf=eglint()
-        opengles.glGenBuffers(1,ctypes.byref(self.buf))
+        buf=eglint()
+        glGenBuffers(1,ctypes.byref(buf))
+        self.buf=buf.value
 
         self.check()
 
         # Prepare a texture image
-        self.tex=eglint()
+        tex=eglint()
         self.check()
-        opengles.glGenTextures(1,ctypes.byref(self.tex))
+        glGenTextures(1,ctypes.byref(tex))
+        self.tex=tex.value
         self.check()
-        opengles.glBindTexture(GL_TEXTURE_2D,self.tex)
+        gl_state.bind_texture(GL_TEXTURE_2D,self.tex)
         self.check()
-        # opengles.glActiveTexture(0)
+        # glActiveTexture(0)
         #test_tex=(eglshort*(1920*1080))(*([3567]*20000))
         #test_tex_p = ctypes.pointer(test_tex)
         #self.store=[test_tex,test_tex_p]
-        opengles.glTexImage2D(GL_TEXTURE_2D,0,GL_RGB,1920,1080,0,GL_RGB,GL_UNSIGNED_SHORT_5_6_5,0)
-        #opengles.glTexImage2D(GL_TEXTURE_2D,0,1920,1080,0,GL_RGB,GL_UNSIGNED_BYTE,0)
+        tex_image_2d(GL_TEXTURE_2D,0,GL_RGB,1920,1080,GL_RGB,GL_UNSIGNED_SHORT_5_6_5,None)
+        #glTexImage2D(GL_TEXTURE_2D,0,1920,1080,0,GL_RGB,GL_UNSIGNED_BYTE,0)
         self.check()
-        opengles.glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, eglfloat(GL_NEAREST))
-        opengles.glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, eglfloat(GL_NEAREST))
+        glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
         self.check()
         # Prepare a framebuffer for rendering
-        self.tex_fb=eglint()
-        opengles.glGenFramebuffers(1,ctypes.byref(self.tex_fb))
+        tex_fb=eglint()
+        glGenFramebuffers(1,ctypes.byref(tex_fb))
+        self.tex_fb=tex_fb.value
         self.check()
-        opengles.glBindFramebuffer(GL_FRAMEBUFFER,self.tex_fb)
+        gl_state.bind_framebuffer(GL_FRAMEBUFFER,self.tex_fb)
         self.check()
-        opengles.glFramebufferTexture2D(GL_FRAMEBUFFER,GL_COLOR_ATTACHMENT0,GL_TEXTURE_2D,self.tex,0)
+        glFramebufferTexture2D(GL_FRAMEBUFFER,GL_COLOR_ATTACHMENT0,GL_TEXTURE_2D,self.tex,0)
         self.check()
-        opengles.glBindFramebuffer(GL_FRAMEBUFFER,0)
+        gl_state.bind_framebuffer(GL_FRAMEBUFFER,0)
         self.check()
         # Prepare viewport
-        opengles.glViewport ( 0, 0, egl.width, egl.height );
+        gl_state.viewport(0, 0, egl.width.value, egl.height.value)
         self.check()
         
         # Upload vertex data to a buffer
-        opengles.glBindBuffer(GL_ARRAY_BUFFER, self.buf);
-        opengles.glBufferData(GL_ARRAY_BUFFER, ctypes.sizeof(self.vertex_data),
-                             ctypes.byref(self.vertex_data), GL_STATIC_DRAW);
-        opengles.glVertexAttribPointer(self.attr_vertex, 4, GL_FLOAT, 0, 16, 0);
-        opengles.glEnableVertexAttribArray(self.attr_vertex);
+        gl_state.bind_buffer(GL_ARRAY_BUFFER, self.buf)
+        buffer_data(GL_ARRAY_BUFFER, self.vertex_data, GL_STATIC_DRAW, GL_FLOAT)
+        gl_state.vertex_attrib_pointer(self.attr_vertex, self.buf, 4, GL_FLOAT, 0, 16, 0)
+        gl_state.enable_vertex_attrib_array(self.attr_vertex)
         self.check()
 
     def draw_mandelbrot_to_texture(self,scale):
         # Draw the mandelbrot to a texture
-        opengles.glBindFramebuffer(GL_FRAMEBUFFER,self.tex_fb)
-        self.check()
-        opengles.glBindBuffer(GL_ARRAY_BUFFER, self.buf);
+        gl_state.bind_framebuffer(GL_FRAMEBUFFER,self.tex_fb)
+        gl_state.bind_buffer(GL_ARRAY_BUFFER, self.buf)
         
-        opengles.glUseProgram ( self.program2 );
-        self.check()
+        self.program2.use()
 
-        opengles.glUniform2f(self.unif_scale2, eglfloat(scale), eglfloat(scale));
-        self.check()
-        #opengles.glUniform2f(self.unif_offset2, eglfloat(offset[0]), eglfloat(offset[1]));
-        #self.check()
-        opengles.glDrawArrays ( GL_TRIANGLE_FAN, 0, 4 );
-        self.check()
+        self.program2["scale"] = (scale, scale)
+        glDrawArrays ( GL_TRIANGLE_FAN, 0, 4 );
                
-        opengles.glFlush()
-        opengles.glFinish()
-        self.check()
+        glFlush()
+        glFinish()
+        glerror.check_frame()
         
     def draw_triangles(self,scale=0.0005,offset=(0.2,0.3)):
+        # Errors are checked according to glerror.policy, so there is no glGetError
+        # round trip after each call here
 
         # Now render to the main frame buffer
-        opengles.glBindFramebuffer(GL_FRAMEBUFFER,0)
+        gl_state.bind_framebuffer(GL_FRAMEBUFFER,0)
         # Clear the background (not really necessary I suppose)
-        opengles.glClear(GL_COLOR_BUFFER_BIT|GL_DEPTH_BUFFER_BIT);
-        self.check()
+        glClear(GL_COLOR_BUFFER_BIT|GL_DEPTH_BUFFER_BIT);
         
-        opengles.glBindBuffer(GL_ARRAY_BUFFER, self.buf);
-        self.check()
-        opengles.glUseProgram ( self.program );
-        self.check()
-        opengles.glBindTexture(GL_TEXTURE_2D,self.tex)
-        self.check()
-        opengles.glUniform4f(self.unif_color, eglfloat(0.5), eglfloat(0.5), eglfloat(0.8), eglfloat(1.0));
-        self.check()
-        opengles.glUniform2f(self.unif_scale, eglfloat(scale), eglfloat(scale));
-        self.check()
-        opengles.glUniform2f(self.unif_offset, eglfloat(offset[0]), eglfloat(offset[1]));
-        self.check()
-        opengles.glUniform1i(self.unif_tex, 0); # I don't really understand this part, perhaps it relates to active texture?
-        self.check()
-        
-        opengles.glDrawArrays ( GL_TRIANGLE_FAN, 0, 4 );
-        self.check()
-
-        opengles.glBindBuffer(GL_ARRAY_BUFFER, 0);
-
-        opengles.glFlush()
-        opengles.glFinish()
-        self.check()
+        gl_state.bind_buffer(GL_ARRAY_BUFFER, self.buf)
+        self.program.use()
+        gl_state.bind_texture(GL_TEXTURE_2D,self.tex)
+        # Only the uniforms whose values changed since the last frame are sent
+        self.program["color"] = (0.5, 0.5, 0.8, 1.0)
+        self.program["scale"] = (scale, scale)
+        self.program["offset"] = offset
+        self.program["tex"] = 0 # The texture unit the sampler reads from
         
-        openegl.eglSwapBuffers(egl.display, egl.surface);
-        self.check()      
+        glDrawArrays ( GL_TRIANGLE_FAN, 0, 4 );
+        # No glFinish: the frame scheduler bounds how far the CPU gets ahead of the GPU
         
     def check(self):
-        e=opengles.glGetError()
-        if e:
-            print hex(e)
-            raise ValueError
+        """Raises glerror.GLError if an error is pending"""
+        glerror.check()
         
 def showerror():
-    e=opengles.glGetError()
+    e=glGetError()
     print hex(e)
+
+# from pyopengles import * also gives the egl, gl2 and gl2ext constants, but those tables
+# are only loaded when such an import actually happens, not by import pyopengles
+__all__ = glconstants.ReExport(globals(),('egl','gl2','gl2ext'))
     
 if __name__ == "__main__":
     egl = EGL()
     d = demo()
     d.draw_mandelbrot_to_texture(0.003)
     m=pymouse.start_mouse()
-    while 1:
-        #offset=(400,600)
-        offset=(m.x,m.y)
-        d.draw_triangles(0.003,offset)
-        time.sleep(0.01)
-        if m.finished:
-            break
+    # Draw once per vsync, sleeping in between instead of polling
+    frames=FrameScheduler(egl)
+    frames.run(None,lambda alpha:d.draw_triangles(0.003,(m.x,m.y)),lambda:m.finished)
+    frames.close()
+    print 'Frame times (ms): median %(p50).1f, 90%% %(p90).1f, 99%% %(p99).1f, missed vsyncs %(missed)d' % frames.stats()
     showerror()
 
 
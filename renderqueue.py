@@ -0,0 +1,124 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# A render queue that puts each frame's draws into the order that changes state least.
+#
+# q = RenderQueue()
+# q.submit(draw,depth,program=p.program,texture=tex,buffer=buf.vbuf)
+# q.submit(draw_glass,depth,program=p.program,transparent=True)
+# q.flush()                   calls the draws in sorted order, then empties the queue
+# q.last_frame                draws, sort time and the state changes before and after sorting
+#
+# draw is any callable taking no arguments, and depth is the object's distance along the
+# view direction (view_depths gives it for points such as the centres of their bounds).
+#
+# Each draw gets a 64 bit key, and the keys are sorted as one array with a radix sort:
+#
+#   opaque       0 | program | texture | buffer | depth
+#   transparent  1 | far-to-near depth | program | texture | buffer
+#
+# so opaque draws are grouped by program, then texture, then buffer, and drawn
+# front-to-back within each group for the depth test to reject hidden fragments early,
+# while transparent draws come last and back-to-front, as blending needs.  Programs,
+# textures and buffers are numbered 0..8191 in order of their GL names each frame, and
+# depths are quantised to 24 bits between near and far.
+#
+# NumPy is required.
+
+import time
+import numpy
+import transform
+
+id_bits = 13
+depth_bits = 24
+
+def view_depths(points,VP):
+    """Returns the distances along the view direction of (n,3) points, given the view
+    matrix VP (the w they get in clip space)"""
+    return transform.transform_points(points,VP)[:,3]
+
+def radix_argsort(keys,bits=64,digit_bits=16):
+    """Returns the indices that sort an array of unsigned integer keys.
+
+    A least significant digit radix sort: one stable sort of each digit_bits wide digit
+    in turn, skipping digits that are the same in every key.  NumPy sorts 16 bit digits
+    with a counting sort (a merge sort before NumPy 1.17)."""
+    keys = numpy.asarray(keys,dtype=numpy.uint64)
+    order = numpy.arange(len(keys))
+    if len(keys)<2:
+        return order
+    mask = numpy.uint64((1<<digit_bits)-1)
+    varying = numpy.bitwise_or.reduce(keys^keys[0])
+    for shift in xrange(0,bits,digit_bits):
+        if not (int(varying)>>shift)&((1<<digit_bits)-1):
+            continue
+        digit = ((keys[order]>>numpy.uint64(shift))&mask).astype(numpy.uint16)
+        order = order[numpy.argsort(digit,kind='stable')]
+    return order
+
+def _dense(names):
+    """Numbers the distinct values of names from 0, keeping their order"""
+    ids = numpy.unique(names,return_inverse=True)[1]
+    return ids.astype(numpy.uint64)&numpy.uint64((1<<id_bits)-1)
+
+def _changes(values):
+    """Returns how many times consecutive values differ"""
+    return int((values[1:]!=values[:-1]).sum()) if len(values) else 0
+
+class RenderQueue(object):
+    """Draws collected over a frame, issued in sorted order"""
+
+    def __init__(self,near=10.0,far=1000.0):
+        self.near = near
+        self.far = far
+        self.clear()
+        self.last_frame = {'draws':0,'sort_time':0.0,'changes_unsorted':0,'changes_sorted':0}
+
+    def clear(self):
+        """Drops every draw submitted"""
+        self.draws = []
+        self.depths = []
+        self.programs = []
+        self.textures = []
+        self.buffers = []
+        self.transparent = []
+
+    def submit(self,draw,depth,program=0,texture=0,buffer=0,transparent=False):
+        self.draws.append(draw)
+        self.depths.append(depth)
+        self.programs.append(program)
+        self.textures.append(texture)
+        self.buffers.append(buffer)
+        self.transparent.append(transparent)
+
+    def keys(self):
+        """Returns the sort key of each draw submitted so far"""
+        u = numpy.uint64
+        depth = (numpy.asarray(self.depths,dtype=numpy.float64)-self.near)/(self.far-self.near)
+        depth = (numpy.clip(depth,0.0,1.0)*((1<<depth_bits)-1)).astype(u)
+        program = _dense(self.programs)
+        texture = _dense(self.textures)
+        buffer = _dense(self.buffers)
+        transparent = numpy.asarray(self.transparent,dtype=bool)
+        b = id_bits
+        opaque = (program<<u(depth_bits+2*b))|(texture<<u(depth_bits+b))|(buffer<<u(depth_bits))|depth
+        far_first = (u((1<<depth_bits)-1)-depth)<<u(3*b)
+        blended = (u(1)<<u(63))|far_first|(program<<u(2*b))|(texture<<u(b))|buffer
+        return numpy.where(transparent,blended,opaque)
+
+    def order(self):
+        """Returns the indices of the submitted draws in the order they will be issued"""
+        return radix_argsort(self.keys())
+
+    def flush(self):
+        """Issues the draws in sorted order and empties the queue"""
+        t = time.time()
+        order = self.order()
+        sort_time = time.time()-t
+        state = [numpy.asarray(s) for s in (self.programs,self.textures,self.buffers)]
+        self.last_frame = {'draws':len(self.draws),'sort_time':sort_time,
+                           'changes_unsorted':sum(_changes(s) for s in state),
+                           'changes_sorted':sum(_changes(s[order]) for s in state)}
+        draws = self.draws
+        self.clear()
+        for i in order:
+            draws[i]()
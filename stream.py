@@ -0,0 +1,126 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Streaming buffers for geometry that changes every frame (particles, lines, overlays).
+#
+# s = StreamBuffer(GL_ARRAY_BUFFER)
+# offset = s.write(vertices)       copies into the current buffer, which is left bound
+# ... draw using s.buf at offset ...
+# s.end_frame()                    call once per frame, before swapping buffers
+# s.delete()                       deletes the buffers when done with them
+#
+# Each frame's data goes into one of a ring of GL_STREAM_DRAW buffers.  Before a buffer is
+# written again the CPU must be sure the GPU has finished drawing from it:
+#
+#  - with EGL_KHR_fence_sync a fence is placed after each frame's draws, and reusing the
+#    buffer waits on it (normally long passed, as the ring holds several frames)
+#  - otherwise the buffer is orphaned with glBufferData(...,NULL,...), so the driver gives
+#    it fresh storage and frees the old storage once the GPU is done with it
+#
+# With GL_OES_mapbuffer the first write into a recycled buffer is copied straight into the
+# mapped buffer.  Later writes in the same frame use glBufferSubData, as mapping a buffer
+# that queued draws still read from would make the driver wait for them.
+
+import ctypes
+import time
+from bindings import glBufferData, glGenBuffers, glMapBufferOES, glUnmapBufferOES
+from gl2 import GL_ARRAY_BUFFER, GL_STREAM_DRAW
+from gl2ext import GL_WRITE_ONLY_OES
+import fence
+import glinfo
+from glstate import gl_state
+from upload import buffer_sub_data, data_pointer
+
+class StreamBuffer(object):
+    """A ring of count buffers of size bytes, written a frame at a time"""
+
+    def __init__(self,target=GL_ARRAY_BUFFER,size=1<<20,count=3,alignment=4,fences=None,
+                 mapping=None):
+        self.target = target
+        self.size = size
+        self.alignment = alignment
+        self.fences_used = fence.supported() if fences is None else fences
+        self.mapping = (glinfo.has_extension('GL_OES_mapbuffer',glMapBufferOES,glUnmapBufferOES)
+                        if mapping is None else mapping)
+        bufs = (ctypes.c_uint*count)()
+        glGenBuffers(count,ctypes.byref(bufs))
+        self.bufs = list(bufs)
+        self.fences = [None]*count
+        self.index = 0
+        self.offset = 0
+        self.waits = 0         # Times the CPU had to wait for the GPU
+        self.wait_time = 0.0   # Seconds spent waiting
+        self.orphaned = 0      # Buffers orphaned
+        self.written = 0       # Bytes written
+        for buf in self.bufs:
+            self._bind(buf)
+            glBufferData(target,size,None,GL_STREAM_DRAW)
+        self._bind(self.buf)
+
+    @property
+    def buf(self):
+        """The buffer being written this frame"""
+        return self.bufs[self.index]
+
+    def _bind(self,buf):
+        gl_state.bind_buffer(self.target,buf)
+
+    def _next(self):
+        """Moves on to the next buffer of the ring, making sure the GPU is done with it"""
+        self.index = (self.index+1)%len(self.bufs)
+        self.offset = 0
+        f = self.fences[self.index]
+        if f is not None:
+            if not f.signaled():
+                self.waits += 1
+                t = time.time()
+                f.wait()
+                self.wait_time += time.time()-t
+            f.delete()
+            self.fences[self.index] = None
+        self._bind(self.buf)
+        if not self.fences_used:
+            glBufferData(self.target,self.size,None,GL_STREAM_DRAW)
+            self.orphaned += 1
+
+    def write(self,data):
+        """Copies data into the current buffer, returning its byte offset"""
+        address,n,t,owner = data_pointer(data)
+        if n>self.size:
+            raise ValueError('%d bytes do not fit a stream buffer of %d' % (n,self.size))
+        if self.offset+n>self.size:
+            # This frame has filled the buffer; the draws already issued still read it
+            if self.fences_used:
+                self.fences[self.index] = fence.Fence()
+            self._next()
+        offset = self.offset
+        self._bind(self.buf)
+        p = glMapBufferOES(self.target,GL_WRITE_ONLY_OES) if self.mapping and offset==0 else None
+        if p:
+            ctypes.memmove(p,address,n)
+            glUnmapBufferOES(self.target)
+        else:
+            buffer_sub_data(self.target,offset,data)
+        self.offset = (offset+n+self.alignment-1)//self.alignment*self.alignment
+        self.written += n
+        return offset
+
+    def end_frame(self):
+        """Fences the frame's draws and moves to the next buffer for the next frame"""
+        if self.offset==0:
+            return
+        if self.fences_used:
+            self.fences[self.index] = fence.Fence()
+        self._next()
+
+    def delete(self):
+        """Deletes the buffers and any fences still guarding them"""
+        for f in self.fences:
+            if f is not None:
+                f.delete()
+        self.fences = [None]*len(self.bufs)
+        gl_state.delete_buffers(self.bufs)
+        self.bufs = []
+
+    def stats(self):
+        return {'waits':self.waits,'wait_time':self.wait_time,'orphaned':self.orphaned,
+                'written':self.written,'fences':self.fences_used,'mapping':self.mapping}
@@ -0,0 +1,80 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Tests for arena.py.  Run with python -m unittest discover -p 'test_*.py'
+
+import unittest
+import numpy
+import arena
+import glstate
+
+class AllocatorTest(unittest.TestCase):
+
+    def test_alloc_and_coalesce(self):
+        a = arena.Allocator(100)
+        offsets = [a.alloc(12) for i in xrange(8)]
+        self.assertEqual(offsets,range(0,96,12))
+        self.assertEqual(a.alloc(8),None) # 4 bytes left
+        for offset in offsets[1:4]:
+            a.release(offset,12)
+        a.release(offsets[0],12)
+        self.assertEqual(a.free,[(0,48),(96,4)])
+        self.assertEqual(a.used,48)
+
+    def test_best_fit(self):
+        a = arena.Allocator(100)
+        x,y,z,w = a.alloc(40),a.alloc(8),a.alloc(20),a.alloc(8)
+        a.release(x,40)
+        a.release(z,20)
+        self.assertEqual(a.free,[(0,40),(48,20),(76,24)])
+        self.assertEqual(a.alloc(16),48) # The 20 byte hole is the tightest fit
+
+    def test_grow(self):
+        a = arena.Allocator(16)
+        a.alloc(16)
+        a.grow(64)
+        self.assertEqual(a.free,[(16,48)])
+        self.assertEqual(a.stats()['utilization'],0.25)
+
+class BufferArenaTest(unittest.TestCase):
+    """BufferArena with the GL calls replaced by stand-ins recording nothing"""
+
+    def setUp(self):
+        self.saved = (arena.glGenBuffers,arena.glBufferData,arena.buffer_sub_data,
+                      glstate.glBindBuffer)
+        arena.glGenBuffers = lambda n,p:None
+        arena.glBufferData = lambda *args:None
+        arena.buffer_sub_data = lambda *args:None
+        glstate.glBindBuffer = lambda *args:None
+        glstate.gl_state.invalidate()
+
+    def tearDown(self):
+        (arena.glGenBuffers,arena.glBufferData,arena.buffer_sub_data,
+         glstate.glBindBuffer) = self.saved
+        glstate.gl_state.invalidate()
+
+    def test_grow_past_holes(self):
+        # Free space in a hole in the middle does not help a range bigger than the hole
+        b = arena.BufferArena(capacity=100)
+        ranges = [b.alloc(numpy.zeros(12,dtype=numpy.uint8)) for i in xrange(8)]
+        ranges[0].free()
+        data = numpy.arange(200,dtype=numpy.uint8)
+        r = b.alloc(data)
+        self.assertTrue(r.offset is not None)
+        self.assertTrue(r.offset+200<=b.allocator.capacity)
+        self.assertTrue((b.shadow[r.offset:r.offset+200]==data).all())
+        self.assertEqual(ranges[1].offset,12) # Growing keeps ranges in place
+
+    def test_defragment_moves_ranges(self):
+        b = arena.BufferArena(capacity=96)
+        ranges = [b.alloc(numpy.full(24,i,dtype=numpy.uint8)) for i in xrange(4)]
+        ranges[0].free()
+        ranges[2].free()
+        r = b.alloc(numpy.full(48,9,dtype=numpy.uint8))
+        self.assertEqual(b.generation,1)
+        for i in (1,3):
+            s = ranges[i]
+            self.assertTrue((b.shadow[s.offset:s.offset+24]==i).all())
+        self.assertTrue((b.shadow[r.offset:r.offset+48]==9).all())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Tests for cull.py.  Run with python -m unittest discover -p 'test_*.py'
+
+import unittest
+import numpy
+import cull
+import transform
+
+VP = transform.projection(near=1.0,far=100.0,fov_h=1.0,fov_v=1.0)
+
+def random_boxes(n,seed=1):
+    rng = numpy.random.RandomState(seed)
+    centres = rng.uniform((-80,-80,-20),(80,80,120),(n,3))
+    size = rng.uniform(0.1,4.0,(n,3))
+    return centres-size,centres+size
+
+class FrustumTest(unittest.TestCase):
+
+    def test_planes(self):
+        planes = cull.frustum_planes(VP)
+        inside = numpy.array([[0,0,50],[20,0,50],[0,-20,50]])
+        outside = numpy.array([[0,0,-5],[40,0,50],[0,0,200]])
+        self.assertTrue(cull.spheres_visible(planes,inside,numpy.zeros(3)).all())
+        self.assertFalse(cull.spheres_visible(planes,outside,numpy.zeros(3)).any())
+        # A sphere reaching past the near plane (at about z=0.5) is visible
+        self.assertFalse(cull.spheres_visible(planes,outside[:1],[5.4])[0])
+        self.assertTrue(cull.spheres_visible(planes,outside[:1],[5.6])[0])
+
+class BVHTest(unittest.TestCase):
+
+    def test_query_matches_brute_force(self):
+        lo,hi = random_boxes(1000)
+        bvh = cull.BVH(lo,hi)
+        planes = cull.frustum_planes(VP)
+        found,tested = bvh.query(planes,lo,hi)
+        expected = numpy.nonzero(cull.boxes_visible(planes,lo,hi))[0]
+        self.assertEqual(sorted(found.tolist()),expected.tolist())
+        self.assertTrue(0<len(expected)<1000)
+        self.assertTrue(tested<len(bvh.start))
+
+    def test_refit(self):
+        lo,hi = random_boxes(300)
+        bvh = cull.BVH(lo,hi)
+        lo[:50] += 1000.0 # Out of sight
+        hi[:50] += 1000.0
+        bvh.refit(lo,hi)
+        planes = cull.frustum_planes(VP)
+        found,tested = bvh.query(planes,lo,hi)
+        expected = numpy.nonzero(cull.boxes_visible(planes,lo,hi))[0]
+        self.assertEqual(sorted(found.tolist()),expected.tolist())
+        self.assertTrue((bvh.lo[0]<=lo.min(axis=0)).all() and (bvh.hi[0]>=hi.max(axis=0)).all())
+
+    def test_empty(self):
+        bvh = cull.BVH(numpy.zeros((0,3)),numpy.zeros((0,3)))
+        self.assertEqual(len(bvh.query(cull.frustum_planes(VP),None,None)[0]),0)
+
+class SceneTest(unittest.TestCase):
+
+    def test_add_move_remove(self):
+        scene = cull.Scene(capacity=2)
+        bounds = (-numpy.ones(3),numpy.ones(3))
+        for z in (50,60,-50,70):
+            scene.add(None,transform.translation((0,0,z)),bounds)
+        self.assertEqual(scene.visible(VP).tolist(),[0,1,3])
+        scene.move(2,transform.translation((0,0,30)))
+        scene.move(numpy.array([0,1]),transform.translation((0,0,-30)))
+        self.assertEqual(scene.visible(VP).tolist(),[2,3])
+        self.assertEqual(scene.refitted,1)
+        scene.remove(3)
+        self.assertEqual(scene.visible(VP).tolist(),[2])
+        self.assertEqual(scene.last_frame['objects'],3)
+        self.assertEqual(scene.last_frame['culled'],2)
+
+if __name__ == '__main__':
+    unittest.main()
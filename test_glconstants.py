@@ -0,0 +1,33 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Tests for glconstants.py.  Run with python -m unittest discover -p 'test_*.py'
+
+import sys
+import types
+import unittest
+import glconstants
+
+class ReExportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.module = types.ModuleType('reexporter')
+        self.module.helper = 1
+        self.module._private = 2
+        self.module.__all__ = glconstants.ReExport(self.module.__dict__,('gl2',))
+        sys.modules['reexporter'] = self.module
+
+    def tearDown(self):
+        del sys.modules['reexporter']
+
+    def test_nothing_copied_before_star_import(self):
+        self.assertFalse(hasattr(self.module,'GL_TRIANGLES'))
+
+    def test_star_import(self):
+        namespace = {}
+        exec 'from reexporter import *' in namespace
+        self.assertEqual(namespace['GL_TRIANGLES'],glconstants.table('gl2')['GL_TRIANGLES'])
+        self.assertEqual(namespace['helper'],1)
+        self.assertFalse('_private' in namespace)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Tests for glerror.py.  Run with python -m unittest discover -p 'test_*.py'
+
+import os
+import unittest
+import bindings
+from gl2 import GL_INVALID_ENUM, GL_INVALID_VALUE
+import glerror
+
+class CheckTest(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = bindings.glGetError
+        self.errors = []
+        bindings.glGetError = lambda:self.errors.pop(0) if self.errors else 0
+        glerror.reset()
+
+    def tearDown(self):
+        bindings.glGetError = self.saved
+        glerror.reset()
+
+    def test_first_error_until_reset(self):
+        self.errors = [GL_INVALID_ENUM,GL_INVALID_VALUE]
+        self.assertRaises(glerror.GLError,glerror.check)
+        self.assertRaises(glerror.GLError,glerror.check)
+        self.assertEqual(glerror.first_error.name,'GL_INVALID_ENUM')
+        glerror.reset()
+        self.assertEqual(glerror.first_error,None)
+        glerror.check()
+
+    def wrapper(self,filename):
+        """Returns a function compiled as if from filename that checks on its caller's behalf"""
+        namespace = {'__name__':'wrapper','glerror':glerror}
+        exec compile('def wrapper():\n    glerror.check()\n',filename,'exec') in namespace
+        return namespace['wrapper']
+
+    def site(self,f):
+        self.errors = [GL_INVALID_VALUE]
+        try:
+            f()
+        except glerror.GLError as e:
+            return e.site
+        self.fail('No GLError raised')
+
+    def test_site_skips_library_files(self):
+        wrapper = self.wrapper(os.path.join(glerror.directory,'upload.py'))
+        self.assertEqual(self.site(wrapper)[2],'site') # The caller here, not upload.py
+
+    def test_site_outside_library(self):
+        wrapper = self.wrapper(os.path.join(os.path.dirname(glerror.directory),'app.py'))
+        self.assertEqual(self.site(wrapper)[2],'wrapper')
+
+if __name__ == '__main__':
+    unittest.main()
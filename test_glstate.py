@@ -0,0 +1,105 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Tests for glstate.py.  Run with python -m unittest discover -p 'test_*.py'
+
+import unittest
+from gl2 import GL_ARRAY_BUFFER, GL_ELEMENT_ARRAY_BUFFER, GL_FLOAT
+import glstate
+import layout
+import vao
+
+class Recorded(unittest.TestCase):
+    """The GL calls gl_state makes replaced by stand-ins recording them"""
+
+    names = ('glBindBuffer','glBindVertexArrayOES','glDeleteBuffers','glDisableVertexAttribArray',
+             'glEnableVertexAttribArray','glVertexAttribPointer')
+
+    def setUp(self):
+        self.saved = dict((name,getattr(glstate,name)) for name in self.names)
+        self.calls = []
+        for name in self.names:
+            setattr(glstate,name,self.recorder(name))
+        glstate.gl_state.invalidate()
+        self.state = glstate.StateCache()
+
+    def recorder(self,name):
+        return lambda *args:self.calls.append((name,)+args)
+
+    def tearDown(self):
+        for name,f in self.saved.items():
+            setattr(glstate,name,f)
+        glstate.gl_state.invalidate()
+
+    def made(self):
+        """Returns the names of the calls made since the last time, and forgets them"""
+        names = [c[0] for c in self.calls]
+        del self.calls[:]
+        return names
+
+class DeleteBuffersTest(Recorded):
+
+    def test_rebind_after_delete(self):
+        s = self.state
+        s.bind_buffer(GL_ARRAY_BUFFER,5)
+        s.bind_buffer(GL_ELEMENT_ARRAY_BUFFER,6)
+        s.vertex_attrib_pointer(0,5,3,GL_FLOAT,False,12,0)
+        s.delete_buffers([5,0])
+        self.assertEqual(self.calls[-1][:2],('glDeleteBuffers',1))
+        self.assertEqual(s.buffers,{GL_ELEMENT_ARRAY_BUFFER:6})
+        # GL may hand the name 5 out again, and binding it must reach the driver
+        del self.calls[:]
+        s.bind_buffer(GL_ARRAY_BUFFER,5)
+        s.vertex_attrib_pointer(0,5,3,GL_FLOAT,False,12,0)
+        s.bind_buffer(GL_ELEMENT_ARRAY_BUFFER,6)
+        self.assertEqual(self.made(),['glBindBuffer','glVertexAttribPointer'])
+
+    def test_nothing_to_delete(self):
+        self.state.delete_buffers([0,None])
+        self.assertEqual(self.calls,[])
+
+class VertexArrayTest(Recorded):
+
+    def setUp(self):
+        Recorded.setUp(self)
+        self.saved_gen = vao.glGenVertexArraysOES
+        names = iter(xrange(1,100))
+        def gen(n,p):
+            p._obj.value = next(names)
+        vao.glGenVertexArraysOES = gen
+        self.layout = layout.VertexLayout(('vertex',3,'float'),('normal',3,'byte'))
+
+    def tearDown(self):
+        vao.glGenVertexArraysOES = self.saved_gen
+        Recorded.tearDown(self)
+
+    def test_creating_leaves_previous_array_bound(self):
+        s = glstate.gl_state
+        s.bind_buffer(GL_ELEMENT_ARRAY_BUFFER,7)
+        a = vao.VertexArray(self.layout,{'vertex':0,'normal':1},5,6,native=True)
+        self.assertEqual(s.vertex_array,0)
+        self.assertEqual(s.buffers[GL_ELEMENT_ARRAY_BUFFER],7)
+        self.made()
+        # Binding an element buffer with the object bound leaves the object alone
+        a.bind()
+        s.bind_buffer(GL_ELEMENT_ARRAY_BUFFER,8)
+        self.assertEqual(self.calls,[('glBindVertexArrayOES',a.vao),('glBindVertexArrayOES',0),
+                                     ('glBindBuffer',GL_ELEMENT_ARRAY_BUFFER,8)])
+
+    def test_default_array_state_kept(self):
+        s = glstate.gl_state
+        emulated = vao.VertexArray(self.layout,{'vertex':0,'normal':1},5,6,native=False)
+        emulated.bind()
+        native = vao.VertexArray(self.layout,{'vertex':2},5,6,native=True)
+        native.bind()
+        self.made()
+        # Back on the default array only the state that differs is issued
+        emulated.bind()
+        self.assertEqual(self.made(),['glBindVertexArrayOES'])
+        small = vao.VertexArray(self.layout,{'vertex':0},5,6,native=False)
+        native.bind()
+        self.made()
+        small.bind()
+        self.assertEqual(self.calls,[('glBindVertexArrayOES',0),('glDisableVertexAttribArray',1)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Tests for immediate.py.  Run with python -m unittest discover -p 'test_*.py'
+
+import unittest
+import numpy
+from gl2 import GL_LINES, GL_LINE_STRIP, GL_POINTS, GL_TRIANGLES, GL_TRIANGLE_FAN
+import immediate
+
+class Stream(object):
+    def __init__(self,target,size):
+        self.size = size
+
+class Programs(object):
+    def get(self,vertex_source,fragment_source):
+        return None
+
+class RecordTest(unittest.TestCase):
+    """Recording only, with the stream buffer and program replaced by stand-ins"""
+
+    def setUp(self):
+        self.saved = immediate.stream.StreamBuffer,immediate.program_cache
+        immediate.stream.StreamBuffer = Stream
+        immediate.program_cache = Programs()
+        self.im = immediate.Immediate(capacity=4)
+
+    def tearDown(self):
+        immediate.stream.StreamBuffer,immediate.program_cache = self.saved
+
+    def primitive(self,mode,n,first=0):
+        self.im.begin(mode)
+        for i in xrange(first,first+n):
+            self.im.vertex(float(i),0.0)
+        self.im.end()
+
+    def test_partial_primitive_dropped(self):
+        # The fourth vertex of the first primitive must not shift the second triangle
+        self.primitive(GL_TRIANGLES,4)
+        self.primitive(GL_TRIANGLES,3,10)
+        self.assertEqual(self.im.batches,[[GL_TRIANGLES,None,0,6]])
+        self.assertEqual(self.im._rows(0,6)[:,0].tolist(),[0,1,2,10,11,12])
+        self.primitive(GL_LINES,3,20)
+        self.assertEqual(self.im.batches[-1],[GL_LINES,None,6,2])
+        self.assertEqual(self.im.n,8)
+
+    def test_conversions_merge(self):
+        self.primitive(GL_LINE_STRIP,3)
+        self.primitive(GL_LINES,2,10)
+        self.primitive(GL_TRIANGLE_FAN,4,20)
+        self.primitive(GL_POINTS,1,30)
+        self.assertEqual(self.im.batches,[[GL_LINES,None,0,6],[GL_TRIANGLES,None,6,6],
+                                          [GL_POINTS,None,12,1]])
+        self.assertEqual(self.im._rows(0,6)[:,0].tolist(),[0,1,1,2,10,11])
+        self.assertEqual(self.im._rows(6,6)[:,0].tolist(),[20,21,22,20,22,23])
+
+    def test_chunks_split_whole_primitives(self):
+        self.im.stream.size = 7*4*12 # Room for 12 vertices
+        self.primitive(GL_POINTS,5)
+        self.primitive(GL_TRIANGLES,12,10)
+        chunks = list(self.im._chunks())
+        self.assertEqual([(first,count) for first,count,batches in chunks],[(0,11),(11,6)])
+        self.assertEqual(chunks[0][2],[(GL_POINTS,None,0,5),(GL_TRIANGLES,None,5,6)])
+
+    def test_end_without_begin(self):
+        self.assertRaises(AssertionError,self.im.end)
+        self.assertRaises(AssertionError,self.im.vertex,0.0,0.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Tests for layout.py.  Run with python -m unittest discover -p 'test_*.py'
+
+import unittest
+import numpy
+from gl2 import GL_BYTE, GL_FLOAT, GL_SHORT, GL_UNSIGNED_BYTE
+import glinfo
+import layout
+import transform
+
+def column(data,a):
+    """Returns an attribute's values from packed vertices"""
+    n = len(data)
+    return data[:,a.offset:a.offset+a.size].copy().view(a.dtype).reshape(n,a.components)
+
+class PackTest(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = glinfo._extensions
+        glinfo._extensions = frozenset(['GL_OES_vertex_half_float'])
+
+    def tearDown(self):
+        glinfo._extensions = self.saved
+
+    def test_offsets(self):
+        L = layout.VertexLayout(('vertex',3,'half'),('normal',3,'byte'),('color',4,'ubyte'),
+                                ('uv',2,'float'))
+        self.assertEqual([a.offset for a in L.attributes],[0,8,12,16])
+        self.assertEqual(L.stride,24)
+
+    def test_encodings(self):
+        L = layout.VertexLayout(('vertex',3,'float'),('normal',3,'byte'),('tangent',3,'short'),
+                                ('color',4,'ubyte'),('index',1,'index'))
+        n = numpy.array([[1,0,0],[0,-1,0],[0,0.5,-0.5]])
+        arrays = {'vertex':[[1,2,3],[4,5,6],[7,8,9]],'normal':n,'tangent':n,
+                  'color':[[0,0.5,1,2],[0,0,0,0],[1,1,1,1]],'index':[[0],[1],[255]]}
+        data,dequantize = L.pack(arrays)
+        self.assertEqual(data.shape,(3,L.stride))
+        self.assertTrue((dequantize==transform.identity()).all())
+        vertex,normal,tangent,color,index = [column(data,a) for a in L.attributes]
+        self.assertEqual(vertex.tolist(),arrays['vertex'])
+        # Signed normalised values map back by (2c+1)/(2^b-1)
+        for values,bits in ((normal,8),(tangent,16)):
+            decoded = (2.0*values+1)/((1<<bits)-1)
+            self.assertTrue(abs(decoded-n).max()<=1.0/((1<<bits)-1))
+        self.assertEqual(normal[0,0],127)
+        self.assertEqual(normal[1,1],-128)
+        self.assertEqual(color.tolist(),[[0,128,255,255],[0,0,0,0],[255,255,255,255]])
+        self.assertEqual(index.ravel().tolist(),[0,1,255])
+        self.assertEqual([a.gl_type for a in L.attributes][:4],[GL_FLOAT,GL_BYTE,GL_SHORT,
+                                                                GL_UNSIGNED_BYTE])
+
+    def test_qshort(self):
+        L = layout.VertexLayout(('vertex',3,'qshort'))
+        positions = numpy.random.RandomState(1).uniform((-5,10,0),(15,12,0),(50,3))
+        data,dequantize = L.pack({'vertex':positions})
+        q = column(data,L.attributes[0])
+        decoded = (2.0*q+1)/65535
+        restored = transform.transform_points(decoded,dequantize)[:,:3]
+        self.assertTrue(abs(restored-positions).max()<1e-3)
+
+    def test_half_needs_extension(self):
+        glinfo._extensions = frozenset()
+        L = layout.VertexLayout(('vertex',3,'half'),('normal',3,'byte'))
+        self.assertEqual(L.attributes[0].format,'float')
+        self.assertEqual(L.attributes[0].gl_type,GL_FLOAT)
+        self.assertEqual(L.stride,16)
+
+    def test_dequantize_folds_into_view(self):
+        # Quantised positions through dequantize*view land where the originals do
+        L = layout.VertexLayout(('vertex',3,'qshort'))
+        positions = numpy.random.RandomState(2).uniform(-50,50,(20,3))
+        data,dequantize = L.pack({'vertex':positions})
+        decoded = (2.0*column(data,L.attributes[0])+1)/65535
+        view = transform.multiply(transform.translation((1,2,30)),transform.projection())
+        folded = transform.transform_points(decoded,transform.multiply(dequantize,view))
+        expected = transform.transform_points(positions,view)
+        self.assertTrue(abs(folded-expected).max()<1e-2)
+
+    def test_pointers(self):
+        L = layout.VertexLayout(('vertex',3,'float'),('normal',3,'byte'))
+        self.assertEqual(L.pointers({'normal':2,'vertex':-1},base=64),
+                         [(2,3,GL_BYTE,True,16,76)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Tests for lod.py.  Run with python -m unittest discover -p 'test_*.py'
+
+import unittest
+import numpy
+from benchmark import grid_mesh
+import lod
+import mesh
+
+class SimplifyTest(unittest.TestCase):
+
+    def test_flat_grid(self):
+        positions,faces,uvs = grid_mesh(20)
+        positions[:,2] = 0.0
+        p,f = lod.simplify(positions,faces,100)
+        self.assertTrue(len(f)<=100)
+        self.assertEqual(len(numpy.unique(f)),len(p)) # Unused vertices are dropped
+        # A flat mesh stays flat, and its outline keeps the grid's corners
+        self.assertEqual(abs(p[:,2]).max(),0.0)
+        lo,hi = mesh.bounds(p)
+        self.assertEqual((lo.tolist(),hi.tolist()),([0,0,0],[19,19,0]))
+        # Every face keeps the orientation of the original
+        normals,area = mesh.face_normals(p,f)
+        self.assertTrue((normals[:,2]<0).all() or (normals[:,2]>0).all())
+
+    def test_levels(self):
+        positions,faces,uvs = grid_mesh(16)
+        levels = lod.simplified_levels(positions,faces,(1.0,0.5,0.25))
+        self.assertEqual([len(f) for p,f in levels][0],len(faces))
+        counts = [len(f) for p,f in levels]
+        self.assertTrue(counts[2]<=len(faces)//4<counts[1]<=len(faces)//2)
+
+class Level(object):
+    bounds = (numpy.zeros(3),numpy.ones(3))
+    sphere = (numpy.zeros(3),1.0)
+
+class SelectTest(unittest.TestCase):
+
+    def setUp(self):
+        self.lod = lod.LOD([Level(),Level(),Level()],(0.2,0.1),hysteresis=0.1)
+
+    def test_thresholds(self):
+        sizes = [0.5,0.15,0.05,numpy.inf]
+        self.assertEqual(self.lod.select(sizes,[0,1,2,2]).tolist(),[0,1,2,0])
+        self.assertEqual(self.lod.select(sizes,[2,2,0,1]).tolist(),[0,1,2,0])
+
+    def test_hysteresis(self):
+        # Just past a threshold either way, an object keeps its level
+        self.assertEqual(self.lod.select([0.21,0.19],[1,0]).tolist(),[1,0])
+        self.assertEqual(self.lod.select([0.23,0.17],[1,0]).tolist(),[0,1])
+
+    def test_sizes_needed(self):
+        self.assertRaises(ValueError,lod.LOD,[Level(),Level()],(0.2,0.1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Tests for mesh.py.  Run with python -m unittest discover -p 'test_*.py'
+
+import unittest
+import numpy
+from benchmark import grid_mesh
+import mesh
+
+class SplitTest(unittest.TestCase):
+
+    def check(self,faces,max_vertices):
+        chunks = mesh.split(faces,max_vertices)
+        for vertices,local in chunks:
+            self.assertTrue(len(vertices)<=max_vertices)
+            self.assertTrue(local.max()<len(vertices))
+        rebuilt = numpy.concatenate([vertices[local] for vertices,local in chunks])
+        self.assertEqual(sorted(map(tuple,rebuilt)),sorted(map(tuple,faces)))
+        return chunks
+
+    def test_fits(self):
+        positions,faces,uvs = grid_mesh(10)
+        self.assertEqual(len(self.check(faces,1000)),1)
+
+    def test_split(self):
+        positions,faces,uvs = grid_mesh(40)
+        chunks = self.check(faces,300)
+        # Only the vertices along the seams are duplicated
+        total = sum(len(vertices) for vertices,local in chunks)
+        self.assertTrue(total<len(positions)*1.3)
+
+    def test_shuffled(self):
+        positions,faces,uvs = grid_mesh(20)
+        faces = faces[numpy.random.RandomState(2).permutation(len(faces))]
+        self.check(faces,100)
+
+    def test_small_blocks(self):
+        # Runs that end inside a block are finished a face at a time
+        positions,faces,uvs = grid_mesh(30)
+        ends = mesh._runs(faces,len(positions),50,block=16)
+        self.assertEqual(ends[-1],len(faces))
+        start = 0
+        for end in ends:
+            self.assertTrue(len(numpy.unique(faces[start:end]))<=50)
+            start = end
+
+if __name__ == '__main__':
+    unittest.main()
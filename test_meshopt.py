@@ -0,0 +1,60 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Tests for meshopt.py.  Run with python -m unittest discover -p 'test_*.py'
+
+import unittest
+import numpy
+from benchmark import grid_mesh
+import meshopt
+from test_multidraw import rotated, strip_triangles
+
+def triangles(faces):
+    """Returns the sorted faces, each rotated to start at its lowest vertex"""
+    return sorted(rotated(f) for f in faces)
+
+class MeshoptTest(unittest.TestCase):
+
+    def setUp(self):
+        self.positions,self.faces,uvs = grid_mesh(12)
+
+    def test_weld(self):
+        # Split every face into its own three vertices, then weld them back
+        p = self.positions[self.faces.ravel()]
+        f = numpy.arange(len(p)).reshape(-1,3)
+        p[0,2] = -0.0 # Equal to 0.0, though its bytes differ
+        v,faces = meshopt.weld(p,f)
+        self.assertEqual(len(v),len(self.positions))
+        self.assertTrue((v[faces]==self.positions[self.faces]).all())
+
+    def test_weld_drops_degenerate_faces(self):
+        v,faces = meshopt.weld([[0,0,0],[1,0,0],[1,0,0],[0,1,0]],[[0,1,2],[0,1,3]])
+        self.assertEqual(len(v),3)
+        self.assertEqual(faces.tolist(),[[0,1,2]])
+
+    def test_optimize_triangles(self):
+        rng = numpy.random.RandomState(1)
+        shuffled = self.faces[rng.permutation(len(self.faces))]
+        faces = meshopt.optimize_triangles(shuffled,len(self.positions))
+        self.assertEqual(triangles(faces),triangles(self.faces))
+        self.assertTrue(meshopt.acmr(faces)<meshopt.acmr(shuffled))
+        self.assertTrue(meshopt.acmr(faces)<1.0)
+
+    def test_fetch_order(self):
+        faces = numpy.array([[5,2,7],[7,2,0]])
+        order,renumbered = meshopt.fetch_order(faces,9)
+        self.assertEqual(order.tolist(),[5,2,7,0])
+        self.assertEqual(renumbered.tolist(),[[0,1,2],[2,1,3]])
+        self.assertTrue((order[renumbered]==faces).all())
+
+    def test_stripify(self):
+        for faces in (self.faces,meshopt.optimize_triangles(self.faces,len(self.positions))):
+            strips = meshopt.stripify(faces)
+            self.assertEqual(sum(len(s)-2 for s in strips),len(faces))
+            self.assertEqual(sorted(sum([strip_triangles(s) for s in strips],[])),
+                             triangles(faces))
+            indices = meshopt.join_strips(strips)
+            self.assertEqual(strip_triangles(indices.tolist()),triangles(faces))
+            self.assertTrue(len(indices)<faces.size)
+
+if __name__ == '__main__':
+    unittest.main()
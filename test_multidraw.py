@@ -0,0 +1,104 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Tests for multidraw.py.  Run with python -m unittest discover -p 'test_*.py'
+
+import unittest
+import numpy
+from gl2 import GL_LINE_STRIP, GL_TRIANGLE_FAN, GL_TRIANGLES, GL_TRIANGLE_STRIP, GL_UNSIGNED_SHORT
+import meshopt
+import multidraw
+
+def rotated(t):
+    """Returns a triangle rotated to start at its lowest vertex, keeping its winding"""
+    t = tuple(int(v) for v in t)
+    k = t.index(min(t))
+    return t[k:]+t[:k]
+
+def strip_triangles(indices):
+    """Returns the sorted, rotated triangles a strip draws, dropping degenerate ones"""
+    triangles = []
+    for i in xrange(len(indices)-2):
+        a,b,c = indices[i:i+3]
+        if i%2:
+            a,b = b,a
+        if a==b or b==c or c==a:
+            continue
+        triangles.append(rotated((a,b,c)))
+    return sorted(triangles)
+
+class GatherTest(unittest.TestCase):
+
+    def test_strip_ranges(self):
+        # Strips of different parity, so joining has to keep each one's winding
+        strips = [[0,1,2,3,4],[5,6,7,8],[9,10,11],[12,13,14,15,16,17]]
+        indices = numpy.array(sum(strips,[]),dtype=numpy.uint16)
+        starts = numpy.cumsum([0]+[len(s) for s in strips])
+        for chosen in ([0,1,2,3],[1,3],[2,0]):
+            firsts = [starts[i] for i in chosen]
+            counts = [len(strips[i]) for i in chosen]
+            data = multidraw.gather(indices,firsts,counts,GL_TRIANGLE_STRIP)
+            self.assertEqual(data.dtype,indices.dtype)
+            expected = sorted(sum([strip_triangles(strips[i]) for i in chosen],[]))
+            self.assertEqual(strip_triangles(list(data)),expected)
+
+    def test_stripified_mesh(self):
+        faces = numpy.array([[0,1,4],[1,5,4],[1,2,5],[2,6,5],[2,3,6],[3,7,6],
+                             [4,5,8],[5,9,8],[6,7,10],[7,11,10]])
+        strips = meshopt.stripify(faces)
+        joined = meshopt.join_strips(strips)
+        self.assertTrue(len(strips)>1)
+        self.assertEqual(strip_triangles(list(joined)),sorted(rotated(f) for f in faces))
+
+    def test_list_ranges(self):
+        indices = numpy.arange(30,dtype=numpy.uint16)
+        data = multidraw.gather(indices,[3,12],[6,3],GL_TRIANGLES)
+        self.assertEqual(list(data),range(3,9)+range(12,15))
+
+    def test_unjoinable_modes(self):
+        indices = numpy.arange(30,dtype=numpy.uint16)
+        for mode in (GL_LINE_STRIP,GL_TRIANGLE_FAN):
+            self.assertRaises(ValueError,multidraw.gather,indices,[0,10],[4,4],mode)
+
+class DrawElementsTest(unittest.TestCase):
+    """draw_elements with the draw calls replaced by counters"""
+
+    def setUp(self):
+        self.saved = multidraw.glDrawElements,multidraw.glMultiDrawElementsEXT
+        self.calls = []
+        multidraw.glDrawElements = lambda *args:self.calls.append(('single',args))
+        multidraw.glMultiDrawElementsEXT = lambda *args:self.calls.append(('multi',args))
+
+    def tearDown(self):
+        multidraw.glDrawElements,multidraw.glMultiDrawElementsEXT = self.saved
+
+    def test_merges_adjacent_list_ranges(self):
+        n = multidraw.draw_elements(GL_TRIANGLES,[3,3,6],GL_UNSIGNED_SHORT,[0,6,24],multi=False)
+        self.assertEqual(n,2)
+        self.assertEqual([args for kind,args in self.calls],
+                         [(GL_TRIANGLES,6,GL_UNSIGNED_SHORT,0),(GL_TRIANGLES,6,GL_UNSIGNED_SHORT,24)])
+
+    def test_strip_ranges_are_not_merged(self):
+        n = multidraw.draw_elements(GL_TRIANGLE_STRIP,[4,4],GL_UNSIGNED_SHORT,[0,8],multi=False)
+        self.assertEqual(n,2)
+        self.assertEqual(len(self.calls),2)
+
+    def test_fans_drawn_separately(self):
+        class Stream(object):
+            def write(self,data):
+                raise AssertionError('Fans must not be gathered')
+        indices = numpy.arange(30,dtype=numpy.uint16)
+        for mode in (GL_TRIANGLE_FAN,GL_LINE_STRIP):
+            del self.calls[:]
+            n = multidraw.draw_elements(mode,[4,4],GL_UNSIGNED_SHORT,[0,8],multi=False,
+                                        indices=indices,stream=Stream())
+            self.assertEqual(n,2)
+            self.assertEqual([args for kind,args in self.calls],
+                             [(mode,4,GL_UNSIGNED_SHORT,0),(mode,4,GL_UNSIGNED_SHORT,8)])
+
+    def test_multi_draw(self):
+        n = multidraw.draw_elements(GL_TRIANGLES,[3,3,6],GL_UNSIGNED_SHORT,[0,6,24],multi=True)
+        self.assertEqual(n,1)
+        self.assertEqual([kind for kind,args in self.calls],['multi'])
+
+if __name__ == '__main__':
+    unittest.main()
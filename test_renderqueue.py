@@ -0,0 +1,57 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Tests for renderqueue.py.  Run with python -m unittest discover -p 'test_*.py'
+
+import unittest
+import numpy
+import renderqueue
+
+class RadixArgsortTest(unittest.TestCase):
+
+    def check(self,keys):
+        order = renderqueue.radix_argsort(keys)
+        expected = numpy.argsort(numpy.asarray(keys,dtype=numpy.uint64),kind='mergesort')
+        self.assertEqual(order.tolist(),expected.tolist())
+
+    def test_random(self):
+        rng = numpy.random.RandomState(1)
+        keys = rng.randint(0,1<<62,1000,dtype=numpy.int64).astype(numpy.uint64)
+        keys[::3] |= numpy.uint64(1<<63) # The top bit too
+        self.check(keys)
+
+    def test_stable(self):
+        # Few distinct keys, so ties must keep their order
+        self.check(numpy.random.RandomState(2).randint(0,4,500).astype(numpy.uint64)<<40)
+
+    def test_single_digit(self):
+        self.check([5,3,5,1,0,3])
+
+    def test_short(self):
+        self.assertEqual(renderqueue.radix_argsort([]).tolist(),[])
+        self.assertEqual(renderqueue.radix_argsort([7]).tolist(),[0])
+
+class RenderQueueTest(unittest.TestCase):
+
+    def test_order(self):
+        q = renderqueue.RenderQueue(near=1.0,far=100.0)
+        drawn = []
+        draws = [('glass far',90.0,1,0,0,True),('b near',5.0,2,0,0,False),
+                 ('a far',80.0,1,0,0,False),('glass near',20.0,2,0,0,True),
+                 ('a near',10.0,1,0,0,False),('b far',50.0,2,0,0,False)]
+        for name,depth,program,texture,buffer,transparent in draws:
+            q.submit(lambda name=name:drawn.append(name),depth,program,texture,buffer,transparent)
+        q.flush()
+        # Opaque grouped by program and front to back, then transparent back to front
+        self.assertEqual(drawn,['a near','a far','b near','b far','glass far','glass near'])
+        self.assertEqual(q.last_frame['draws'],6)
+        self.assertTrue(q.last_frame['changes_sorted']<q.last_frame['changes_unsorted'])
+        self.assertEqual(q.draws,[])
+
+    def test_state_before_depth(self):
+        q = renderqueue.RenderQueue()
+        for texture,depth in ((3,20.0),(1,900.0),(3,10.0),(1,15.0)):
+            q.submit(None,depth,program=7,texture=texture)
+        self.assertEqual(q.order().tolist(),[3,1,2,0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# 4x4 transforms as contiguous float32 NumPy arrays.
+#
+# Matrices follow the convention cone.py has always used: M[row][col] with row vectors,
+# so a point is transformed by p*M and A*B applies A first.  Uploading M unchanged with
+# transpose=GL_FALSE then gives the matrix the shader expects for gl_Position = M*v.
+#
+# Every function also accepts arrays of N inputs and returns an (N,4,4) array, so the
+# matrices of a whole scene are computed in one call:
+#
+# VP = multiply(look_at(at,eye),projection())
+# MVP = multiply(multiply(rotation_z(angles),translation(positions)),VP)   # (N,4,4)
+# program['view'] = MVP[i]      uploaded straight from the array, without copying
+#
+# NumPy is required.
+
+import numpy
+
+float32 = numpy.float32
+
+def as_matrix(M):
+    """Returns M as a C contiguous float32 array, without copying if it already is one"""
+    return numpy.ascontiguousarray(M,dtype=float32)
+
+def identity(n=None):
+    """Returns the identity, or n identities as an (n,4,4) array"""
+    if n is None:
+        return numpy.identity(4,dtype=float32)
+    M = numpy.zeros((n,4,4),dtype=float32)
+    M[:,[0,1,2,3],[0,1,2,3]] = 1.0
+    return M
+
+def translation(pt):
+    """Returns the matrix moving points by pt, or one matrix per row of an (n,3) array"""
+    pt = numpy.asarray(pt,dtype=float32)
+    if pt.ndim==1:
+        M = identity()
+        M[3,:3] = pt
+    else:
+        M = identity(len(pt))
+        M[:,3,:3] = pt
+    return M
+
+def scaling(s):
+    """Returns a matrix scaling by s (a number or an x,y,z triple), or one per row of s"""
+    s = numpy.asarray(s,dtype=float32)
+    if s.ndim==0 or (s.ndim==1 and len(s)==3):
+        M = identity()
+        M[[0,1,2],[0,1,2]] = s
+    else:
+        M = identity(len(s))
+        M[:,[0,1,2],[0,1,2]] = s.reshape(len(s),-1)
+    return M
+
+def rotation_z(angle):
+    """Returns the rotation about z by an angle in degrees, or one matrix per angle"""
+    a = numpy.radians(numpy.asarray(angle,dtype=float32))
+    c = numpy.cos(a)
+    s = numpy.sin(a)
+    M = identity() if a.ndim==0 else identity(len(a))
+    M[...,0,0] = c
+    M[...,0,1] = s
+    M[...,1,0] = -s
+    M[...,1,1] = c
+    return M
+
+def multiply(A,B):
+    """Returns A*B (apply A, then B).  Either may be an (n,4,4) array of matrices."""
+    A = numpy.asarray(A,dtype=float32)
+    B = numpy.asarray(B,dtype=float32)
+    if B.ndim==2:
+        # One BLAS call for the whole batch instead of n small products
+        return numpy.dot(A.reshape(-1,4),B).reshape(A.shape)
+    return numpy.matmul(A,B)
+
+def transform_points(P,M):
+    """Returns the (n,4) homogeneous coordinates of the (n,3) points P transformed by M"""
+    P = numpy.asarray(P,dtype=float32)
+    M = numpy.asarray(M,dtype=float32)
+    return numpy.dot(P,M[:3])+M[3]
+
+def projection(near=10,far=1000.0,fov_h=1.7,fov_v=1.4):
+    """Returns the perspective projection with the given distance to the near and far planes
+    and fields of view in radians"""
+    Q = far/(far-near)
+    M = numpy.zeros((4,4),dtype=float32)
+    M[0,0] = 1.0/numpy.tan(fov_h*0.5)
+    M[1,1] = 1.0/numpy.tan(fov_v*0.5)
+    M[2,2] = Q
+    M[3,2] = -Q*near
+    M[2,3] = 1
+    return M
+
+def _normal(v):
+    return v/(numpy.sqrt(numpy.dot(v,v))+0.0001)
+
+def look_at(at,eye,up=(0,0,1),reflect=False):
+    """Returns the matrix of an eye looking at a point.
+
+    If reflect, the view is reflected in the plane z=-20 (the water depth)."""
+    at = numpy.array(at,dtype=numpy.float64)
+    eye = numpy.array(eye,dtype=numpy.float64)
+    if reflect:
+        depth = -20.0
+        eye[2] = 2*depth-eye[2]
+        at[2] = 2*depth-at[2]
+    zaxis = _normal(at-eye)
+    xaxis = _normal(numpy.cross(up,zaxis))
+    yaxis = numpy.cross(zaxis,xaxis)
+    M = identity()
+    M[:3,0] = xaxis
+    M[:3,1] = yaxis
+    M[:3,2] = zaxis
+    M[3,:3] = [-numpy.dot(xaxis,eye),-numpy.dot(yaxis,eye),-numpy.dot(zaxis,eye)]
+    return M
+
+def billboard():
+    """Returns a matrix that copies x,y and sets z to 0.9"""
+    M = identity()
+    M[2,2] = 0.0
+    M[3,2] = 0.9
+    return M
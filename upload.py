@@ -0,0 +1,194 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Upload helpers that pass data straight to the driver without converting it in Python.
+#
+# Anything exposing its memory can be uploaded: NumPy arrays (or any object with an
+# __array_interface__), array.array, ctypes arrays, str, bytearray, mmap and memoryview.
+# The element type and size are checked against what the GL call expects, then the
+# object's own pointer is handed to the driver, so the only copy is the driver's memcpy.
+#
+# X = numpy.array(vertices,dtype=numpy.float32)
+# buffer_data(GL_ARRAY_BUFFER,X,GL_STATIC_DRAW,GL_FLOAT)
+
+import array
+import ctypes
+import struct
+from bindings import (glBufferData, glBufferSubData, glTexImage2D, glUniform1fv, glUniform2fv,
+                      glUniform3fv, glUniform4fv, glUniform1iv, glUniform2iv, glUniform3iv,
+                      glUniform4iv, glUniformMatrix2fv, glUniformMatrix3fv, glUniformMatrix4fv)
+from gl2 import (GL_ALPHA, GL_BYTE, GL_FALSE, GL_FLOAT, GL_INT, GL_LUMINANCE,
+                 GL_LUMINANCE_ALPHA, GL_RGB, GL_RGBA, GL_SHORT, GL_STATIC_DRAW,
+                 GL_UNSIGNED_BYTE, GL_UNSIGNED_INT, GL_UNSIGNED_SHORT,
+                 GL_UNSIGNED_SHORT_4_4_4_4, GL_UNSIGNED_SHORT_5_5_5_1, GL_UNSIGNED_SHORT_5_6_5)
+from gl2ext import GL_HALF_FLOAT_OES
+
+# (kind,itemsize) -> GL type, where kind is 'f' for floats, 'i' signed, 'u' unsigned
+gl_types = {
+    ('f',4): GL_FLOAT,
+    ('f',2): GL_HALF_FLOAT_OES,
+    ('i',1): GL_BYTE,
+    ('u',1): GL_UNSIGNED_BYTE,
+    ('i',2): GL_SHORT,
+    ('u',2): GL_UNSIGNED_SHORT,
+    ('i',4): GL_INT,
+    ('u',4): GL_UNSIGNED_INT,
+}
+
+# Size in bytes of each GL type
+gl_sizes = dict((t,size) for (kind,size),t in gl_types.items())
+
+# Number of components of each texture format
+format_components = {GL_ALPHA:1, GL_LUMINANCE:1, GL_LUMINANCE_ALPHA:2, GL_RGB:3, GL_RGBA:4}
+
+# Pixel types that pack a whole pixel into one unsigned short
+packed_pixel_types = (GL_UNSIGNED_SHORT_5_6_5, GL_UNSIGNED_SHORT_4_4_4_4, GL_UNSIGNED_SHORT_5_5_5_1)
+
+def _struct_type(code):
+    """Returns the GL type for a struct/array/ctypes format code such as 'f' or '<H'"""
+    code = code.lstrip('@=<!')
+    if code.startswith('>') or len(code)!=1:
+        return None
+    if code=='e':
+        return GL_HALF_FLOAT_OES
+    if code in 'fd':
+        kind = 'f'
+    elif code in 'cB?HILQ':
+        kind = 'u'
+    elif code in 'bhilq':
+        kind = 'i'
+    else:
+        return None
+    return gl_types.get((kind,struct.calcsize(code)))
+
+def _array_interface_type(typestr):
+    """Returns the GL type for a NumPy typestr such as '<f4'"""
+    if typestr[0]=='>' and typestr[2:]!='1':
+        return None
+    kind = typestr[1]
+    if kind=='b':
+        kind = 'u'
+    return gl_types.get((kind,int(typestr[2:])))
+
+def data_pointer(data):
+    """Returns (address,nbytes,gl type,owner) for an object exposing its memory.
+
+    owner must be kept alive while the address is in use.  The gl type is None when the
+    element type has no GL equivalent.  Only read-only objects without a pointer of their
+    own (such as a read-only mmap) are copied."""
+    if data is None:
+        return None,0,None,None
+    if isinstance(data,(ctypes.Array,ctypes._SimpleCData)):
+        t = type(data)
+        while issubclass(t,ctypes.Array):
+            t = t._type_
+        code = getattr(t,'_type_',None)
+        return ctypes.addressof(data),ctypes.sizeof(data),code and _struct_type(code),data
+    ai = getattr(data,'__array_interface__',None)
+    if ai is not None:
+        n = 1
+        for s in ai['shape']:
+            n *= s
+        size = int(ai['typestr'][2:])
+        strides = ai.get('strides')
+        if strides is not None:
+            expected = size
+            for dim,stride in reversed(zip(ai['shape'],strides)):
+                if dim>1 and stride!=expected:
+                    raise ValueError('Data must be C contiguous to upload without a copy')
+                expected *= dim
+        return ai['data'][0],n*size,_array_interface_type(ai['typestr']),data
+    if isinstance(data,array.array):
+        address,n = data.buffer_info()
+        return address,n*data.itemsize,_struct_type(data.typecode),data
+    if isinstance(data,str):
+        return ctypes.cast(ctypes.c_char_p(data),ctypes.c_void_p).value,len(data),GL_UNSIGNED_BYTE,data
+    gl_type = GL_UNSIGNED_BYTE
+    try:
+        m = memoryview(data)
+    except TypeError:
+        m = None
+    if m is not None:
+        if m.ndim>0:
+            gl_type = _struct_type(m.format)
+        n = m.itemsize
+        for s in m.shape or ():
+            n *= s
+    else:
+        n = len(data)
+    try:
+        owner = (ctypes.c_char*n).from_buffer(data)
+    except TypeError:
+        # Read-only memory has to be copied
+        owner = (ctypes.c_char*n).from_buffer_copy(m.tobytes() if m is not None else data)
+    return ctypes.addressof(owner),n,gl_type,owner
+
+def _check_type(gl_type,expected):
+    if gl_type!=expected:
+        raise TypeError('Expected data of GL type 0x%x, got %s' %
+                        (expected,'unknown' if gl_type is None else '0x%x' % gl_type))
+
+def buffer_data(target,data,usage=GL_STATIC_DRAW,gl_type=None):
+    """Uploads data into the buffer bound to target, returning its GL type.
+
+    If gl_type is given the element type of data must match it."""
+    address,n,t,owner = data_pointer(data)
+    if gl_type is not None:
+        _check_type(t,gl_type)
+    glBufferData(target,n,address,usage)
+    return t
+
+def buffer_sub_data(target,offset,data,gl_type=None):
+    """Uploads data at a byte offset into the buffer bound to target, returning its GL type"""
+    address,n,t,owner = data_pointer(data)
+    if gl_type is not None:
+        _check_type(t,gl_type)
+    glBufferSubData(target,offset,n,address)
+    return t
+
+def tex_image_2d(target,level,internalformat,width,height,format,type,data,alignment=4):
+    """Uploads a texture image, checking data holds width x height pixels of the given type.
+
+    alignment is the GL_UNPACK_ALIGNMENT in effect (4 unless changed with glPixelStorei).
+    Pass data=None to allocate the texture without uploading."""
+    address,n,t,owner = data_pointer(data)
+    if data is not None:
+        if type in packed_pixel_types:
+            pixel = 2
+        else:
+            pixel = format_components[format]*gl_sizes[type]
+        # Raw bytes are accepted for any pixel type
+        if t!=GL_UNSIGNED_BYTE:
+            _check_type(t,GL_UNSIGNED_SHORT if type in packed_pixel_types else type)
+        row = width*pixel
+        stride = (row+alignment-1)//alignment*alignment
+        needed = stride*(height-1)+row if height else 0
+        if n<needed:
+            raise ValueError('Texture data has %d bytes but %dx%d pixels need %d' %
+                             (n,width,height,needed))
+    glTexImage2D(target,level,internalformat,width,height,0,format,type,address)
+
+_uniform_fv = {1:glUniform1fv, 2:glUniform2fv, 3:glUniform3fv, 4:glUniform4fv}
+_uniform_iv = {1:glUniform1iv, 2:glUniform2iv, 3:glUniform3iv, 4:glUniform4iv}
+_uniform_matrix_fv = {2:glUniformMatrix2fv, 3:glUniformMatrix3fv, 4:glUniformMatrix4fv}
+
+def _count(n,t,gl_type,components):
+    _check_type(t,gl_type)
+    elements = n//gl_sizes[gl_type]
+    if elements==0 or elements%components:
+        raise ValueError('Uniform data has %d values, not a multiple of %d' % (elements,components))
+    return elements//components
+
+def uniform_fv(location,data,size):
+    """Sets a float, vec2, vec3 or vec4 uniform (or array of them) from float32 data"""
+    address,n,t,owner = data_pointer(data)
+    _uniform_fv[size](location,_count(n,t,GL_FLOAT,size),address)
+
+def uniform_iv(location,data,size):
+    """Sets an int, ivec2, ivec3 or ivec4 uniform (or array of them) from int32 data"""
+    address,n,t,owner = data_pointer(data)
+    _uniform_iv[size](location,_count(n,t,GL_INT,size),address)
+
+def uniform_matrix_fv(location,data,size=4):
+    """Sets a mat2, mat3 or mat4 uniform (or array of them) from float32 data"""
+    address,n,t,owner = data_pointer(data)
+    _uniform_matrix_fv[size](location,_count(n,t,GL_FLOAT,size*size),GL_FALSE,address)
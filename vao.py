@@ -0,0 +1,70 @@
+# Copyright (c) 2012 Peter de Rivaz
+#
+# Vertex arrays: the attribute pointers, enables and element buffer needed to draw a
+# mesh, recorded once so that each draw needs a single bind.
+#
+# a = VertexArray(layout,program.attributes,vbuf,ebuf)
+# a.bind()
+# glDrawElements(...)
+#
+# With GL_OES_vertex_array_object the state lives in a driver vertex array object and
+# bind() is one glBindVertexArrayOES.  Without it bind() goes through gl_state, which only
+# re-issues the pointers and enables that differ from the ones currently applied to the
+# default array.  Creating an object leaves whichever array was bound before it bound.
+
+import ctypes
+from bindings import glBindVertexArrayOES, glDeleteVertexArraysOES, glGenVertexArraysOES
+from gl2 import GL_ELEMENT_ARRAY_BUFFER
+import glinfo
+from glstate import gl_state
+
+def supported():
+    """Returns True if the driver provides GL_OES_vertex_array_object"""
+    return glinfo.has_extension('GL_OES_vertex_array_object',glGenVertexArraysOES,
+                                glBindVertexArrayOES,glDeleteVertexArraysOES)
+
+class VertexArray(object):
+    """The attribute state for drawing vertex data laid out by a layout.VertexLayout.
+
+    locations is a {name:location} dict such as Program.attributes, and base the byte
+    offset of the first vertex in vbuf.  native=None uses a vertex array object if the
+    driver supports them."""
+
+    def __init__(self,layout,locations,vbuf,ebuf=0,base=0,native=None):
+        self.pointers = layout.pointers(locations,base)
+        self.enabled = set(p[0] for p in self.pointers)
+        self.vbuf = vbuf
+        self.ebuf = ebuf
+        self.vao = None
+        if native is None:
+            native = supported()
+        if native:
+            vao = ctypes.c_uint()
+            glGenVertexArraysOES(1,ctypes.byref(vao))
+            self.vao = vao.value
+            # Record the state into the new object, which starts with everything disabled
+            previous = gl_state.vertex_array or 0
+            gl_state.bind_vertex_array(self.vao)
+            self._apply(True)
+            gl_state.bind_vertex_array(previous)
+
+    def _apply(self,into_array=False):
+        for p in self.pointers:
+            gl_state.vertex_attrib_pointer(p[0],self.vbuf,*p[1:],into_array=into_array)
+            gl_state.enable_vertex_attrib_array(p[0],into_array)
+        gl_state.bind_buffer(GL_ELEMENT_ARRAY_BUFFER,self.ebuf,into_array)
+
+    def bind(self):
+        """Makes this the vertex attribute state used by draw calls"""
+        if self.vao is not None:
+            gl_state.bind_vertex_array(self.vao)
+            return
+        self._apply()
+        gl_state.disable_other_attrib_arrays(self.enabled)
+
+    def delete(self):
+        if self.vao is not None:
+            if gl_state.vertex_array==self.vao:
+                gl_state.bind_vertex_array(0)
+            glDeleteVertexArraysOES(1,ctypes.byref(ctypes.c_uint(self.vao)))
+            self.vao = None